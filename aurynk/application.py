@@ -10,11 +10,13 @@ gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
 
 
-from gi.repository import Adw, Gio, GLib
+from gi.repository import Adw, Gdk, Gio, GLib, Gtk
 
+from aurynk.core.adb_manager import ADBController
 from aurynk.services.device_monitor import DeviceMonitor
 from aurynk.services.tray_service import tray_command_listener
 from aurynk.ui.windows.main_window import AurynkWindow
+from aurynk.utils.adb_utils import start_device_tracking, stop_device_tracking
 from aurynk.utils.logger import get_logger
 from aurynk.utils.power import PowerMonitor
 
@@ -271,6 +273,10 @@ class AurynkApp(Adw.Application):
         except Exception as e:
             logger.warning(f"Error disconnecting devices on quit: {e}")
 
+        # Release persistent adb shell pipes and the device-state stream
+        ADBController().close_all_shells()
+        stop_device_tracking()
+
         # Stop device monitor
         try:
             self.device_monitor.stop()
@@ -309,6 +315,8 @@ class AurynkApp(Adw.Application):
         Adw.Application.do_startup(self)
         self._apply_theme()
         self._load_gresource()
+        # Keep adb's device list pushed to us rather than polled per lookup
+        start_device_tracking()
 
         # Set up keyboard accelerators for window actions
         self.set_accels_for_action("win.shortcuts", ["<Primary>question"])
@@ -403,20 +411,26 @@ class AurynkApp(Adw.Application):
             "/app/share/aurynk/io.github.IshuSinghSE.aurynk.gresource",
         ]
 
-        for path in candidates:
+        # Running from the source tree, the two development paths are usually the
+        # same file; try each distinct path once
+        for path in dict.fromkeys(os.path.abspath(p) for p in candidates):
+            # Try the load directly; a missing candidate fails with NOENT, which
+            # spares a separate exists() stat per path
             try:
-                if path and os.path.exists(path):
-                    resource = Gio.Resource.load(path)
-                    Gio.Resource._register(resource)
-                    from gi.repository import Gdk, Gtk
-
-                    Gtk.IconTheme.get_for_display(Gdk.Display.get_default()).add_resource_path(
-                        "/io/github/IshuSinghSE/aurynk/icons"
-                    )
-                    logger.info(f"Loaded GResource from: {path}")
-                    break
-
+                resource = Gio.Resource.load(path)
+            except GLib.Error as e:
+                if not e.matches(GLib.file_error_quark(), GLib.FileError.NOENT):
+                    logger.warning(f"Failed to load GResource from {path}: {e}")
+                continue
+            try:
+                Gio.resources_register(resource)
+                Gtk.IconTheme.get_for_display(Gdk.Display.get_default()).add_resource_path(
+                    "/io/github/IshuSinghSE/aurynk/icons"
+                )
+                logger.info(f"Loaded GResource from: {path}")
+                break
             except Exception as e:
+                resource = None
                 logger.warning(f"Failed to load GResource from {path}: {e}")
 
         if resource is None:
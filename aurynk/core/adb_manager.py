@@ -1,20 +1,35 @@
 """ADB/scrcpy controller for device management."""
 
+import asyncio
 import os
 import random
+import select
 import string
 import subprocess
+import threading
+import time
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
 from zeroconf import IPVersion, ServiceBrowser, ServiceStateChange, Zeroconf
+from zeroconf.asyncio import AsyncServiceInfo
 
 from aurynk.core.device_manager import DeviceStore
 from aurynk.i18n import _
-from aurynk.utils.adb_utils import get_adb_path
+from aurynk.utils.adb_utils import get_adb_path, invalidate_adb_cache
 from aurynk.utils.logger import get_logger
-from aurynk.utils.settings import SettingsManager
+from aurynk.utils.settings import get_settings_manager
+
+# For screenshot thumbnails
+try:
+    import gi
+
+    gi.require_version("GdkPixbuf", "2.0")
+    from gi.repository import GdkPixbuf
+except (ImportError, ValueError):
+    GdkPixbuf = None
 
 logger = get_logger("ADBController")
 
@@ -33,6 +48,69 @@ DEVICE_STORE_PATH = os.path.join(DEVICE_STORE_DIR, "paired_devices.json")
 
 # ~/.local/share/aurynk/paired_devices.json
 
+# Size (in pixels) of the preview image shown in the device details window
+THUMBNAIL_SIZE = 360
+
+# Seconds before the first `adb connect` retry while pairing, and the longest wait
+_CONNECT_RETRY_BASE = 0.5
+_CONNECT_RETRY_MAX = 8.0
+
+# Milliseconds to wait for the records of a discovered mDNS service
+_MDNS_RESOLVE_TIMEOUT_MS = 3000
+
+# Build properties read for a newly paired device, in _fetch_device_info's order
+_INFO_PROPS = (
+    "ro.product.marketname",
+    "ro.product.device",
+    "ro.product.manufacturer",
+    "ro.build.version.release",
+)
+
+# Commands whose outputs fetch_device_specs_by_serial parses: RAM, storage, battery
+_SPECS_COMMANDS = ("cat /proc/meminfo", "df /data", "dumpsys battery")
+
+
+def _connect_retry_delay(attempt: int, output: str) -> float:
+    """Return the backoff before retrying `adb connect` after a failed attempt (0-based)."""
+    # Refused means nothing listens yet, so back off harder than for transient errors
+    factor = 2.0 if "refused" in output else 1.5
+    return min(_CONNECT_RETRY_BASE * factor**attempt, _CONNECT_RETRY_MAX)
+
+
+def resolve_service(
+    zeroconf: Zeroconf, service_type: str, name: str, on_resolved: Callable[[Any], None]
+):
+    """
+    Resolve an mDNS service on zeroconf's own event loop without blocking.
+
+    Unlike Zeroconf.get_service_info(), this returns at once, so a browser
+    handler calling it keeps receiving other services while records arrive.
+
+    Args:
+        zeroconf (Zeroconf): The running Zeroconf instance.
+        service_type (str): Service type, e.g. "_adb-tls-connect._tcp.local.".
+        name (str): Full service name.
+        on_resolved (Callable[[Any], None]): Called with the resolved ServiceInfo, from
+            zeroconf's event loop thread; not called if the service does not resolve.
+    """
+    info = AsyncServiceInfo(service_type, name)
+
+    async def request():
+        if not await info.async_request(zeroconf, _MDNS_RESOLVE_TIMEOUT_MS):
+            return
+        try:
+            on_resolved(info)
+        except Exception:
+            logger.exception(f"Error handling resolved mDNS service {name}")
+
+    asyncio.run_coroutine_threadsafe(request(), zeroconf.loop)
+
+
+def get_thumbnail_path(screenshot_path: str) -> str:
+    """Return the path of the pre-scaled thumbnail stored next to a screenshot."""
+    root, _ext = os.path.splitext(screenshot_path)
+    return f"{root}.thumb.png"
+
 
 class ADBController:
     """
@@ -42,10 +120,143 @@ class ADBController:
     It handles mDNS discovery, device information retrieval, and screenshot capture.
     """
 
+    # Persistent `adb -s <serial> shell` processes, shared by all controllers
+    _shells: Dict[str, subprocess.Popen] = {}
+    # serial -> lock held while talking to that serial's shell, so a slow
+    # device only stalls its own commands
+    _shell_locks: Dict[str, threading.Lock] = {}
+    # Guards _shell_locks lookups; never held while waiting on a device
+    _shells_lock = threading.Lock()
+
     def __init__(self):
         """Initialize the ADB controller."""
         self.device_store = DeviceStore(DEVICE_STORE_PATH)
 
+    # ===== Persistent Shell =====
+
+    def _shell_lock(self, serial: str) -> threading.Lock:
+        """Return the lock guarding the serial's shell, creating it on first use."""
+        with self._shells_lock:
+            lock = self._shell_locks.get(serial)
+            if lock is None:
+                lock = self._shell_locks[serial] = threading.Lock()
+            return lock
+
+    def _get_shell(self, serial: str) -> subprocess.Popen:
+        """Return a running shell process for the serial, spawning one if needed."""
+        proc = self._shells.get(serial)
+        if proc is None or proc.poll() is not None:
+            proc = subprocess.Popen(
+                [get_adb_path(), "-s", serial, "shell"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+            )
+            self._shells[serial] = proc
+        return proc
+
+    def _discard_shell(self, serial: str):
+        """Terminate and forget the shell process for the serial (caller holds its lock)."""
+        proc = self._shells.pop(serial, None)
+        if proc is not None and proc.poll() is None:
+            try:
+                proc.kill()
+                proc.wait(timeout=1)
+            except Exception:
+                pass
+
+    def run_shell(self, serial: str, command: str, timeout: Optional[float] = None) -> str:
+        """
+        Run a command on the device through a persistent `adb shell` pipe.
+
+        Avoids spawning a fresh adb client per command. The output is framed
+        with a unique end marker echoed after the command.
+
+        Args:
+            serial (str): Device serial (address:port for wireless, or USB serial).
+            command (str): Shell command line to run on the device.
+            timeout (Optional[float]): Seconds to wait for the output. Defaults to the
+                configured ADB connection timeout.
+
+        Returns:
+            str: The command's standard output.
+
+        Raises:
+            subprocess.TimeoutExpired: If the command does not finish in time.
+            OSError: If the shell cannot be started or exits unexpectedly.
+        """
+        if timeout is None:
+            timeout = get_settings_manager().get("adb", "connection_timeout", 10)
+        marker = f"__END_{uuid.uuid4().hex}__".encode()
+
+        with self._shell_lock(serial):
+            proc = self._get_shell(serial)
+            try:
+                proc.stdin.write(command.encode() + b"; echo " + marker + b"\n")
+                proc.stdin.flush()
+
+                fd = proc.stdout.fileno()
+                deadline = time.monotonic() + timeout
+                buf = b""
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise subprocess.TimeoutExpired(command, timeout)
+                    ready, _w, _x = select.select([fd], [], [], remaining)
+                    if not ready:
+                        continue
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        raise OSError(f"adb shell for {serial} exited")
+                    buf += chunk
+                    idx = buf.find(marker)
+                    if idx != -1:
+                        return buf[:idx].decode(errors="replace")
+            except Exception:
+                self._discard_shell(serial)
+                raise
+
+    def run_shell_batch(
+        self, serial: str, commands: List[str], timeout: Optional[float] = None
+    ) -> List[str]:
+        """
+        Run several commands in one round-trip and return each one's output.
+
+        Args:
+            serial (str): Device serial (address:port for wireless, or USB serial).
+            commands (List[str]): Shell command lines, run in order.
+            timeout (Optional[float]): Seconds to wait for all of the output.
+
+        Returns:
+            List[str]: One output per command; empty for any that printed nothing.
+
+        Raises:
+            subprocess.TimeoutExpired: If the commands do not finish in time.
+            OSError: If the shell cannot be started or exits unexpectedly.
+        """
+        # Unique per call, so no command's output can be mistaken for it
+        separator = f"__SEP_{uuid.uuid4().hex}__"
+        script = f"; echo {separator}; ".join(commands)
+        outputs = self.run_shell(serial, script, timeout).split(f"{separator}\n")
+        outputs += [""] * (len(commands) - len(outputs))
+        return outputs[: len(commands)]
+
+    def close_shell(self, serial: str):
+        """
+        Close the persistent shell for a device, if one is open.
+
+        Args:
+            serial (str): Device serial.
+        """
+        with self._shell_lock(serial):
+            self._discard_shell(serial)
+
+    def close_all_shells(self):
+        """Close every persistent shell opened by any controller."""
+        for serial in list(self._shells):
+            self.close_shell(serial)
+
     # ===== Device Pairing =====
 
     def generate_code(self, length: int = 5) -> str:
@@ -81,7 +292,6 @@ class ADBController:
         Returns:
             bool: True if successful, False otherwise.
         """
-        import time
 
         def log(msg: str):
             logger.info(msg)
@@ -103,7 +313,7 @@ class ADBController:
         connected = False
 
         # Load retry settings
-        settings = SettingsManager()
+        settings = get_settings_manager()
         max_retries = settings.get("adb", "max_retry_attempts", 5)
         timeout = settings.get("adb", "connection_timeout", 10)
 
@@ -119,8 +329,10 @@ class ADBController:
                 log("✓ Connected successfully")
                 break
 
-            time.sleep(1)
+            if attempt < max_retries - 1:
+                time.sleep(_connect_retry_delay(attempt, output))
 
+        invalidate_adb_cache()
         if not connected:
             log(f"✗ Could not connect to {address}:{connect_port}")
             return False
@@ -183,6 +395,10 @@ class ADBController:
                 # Optionally, remove to avoid duplicate callbacks
                 del discovered[address]
 
+        def on_resolved(info):
+            address = ".".join(map(str, info.addresses[0])) if info.addresses else None
+            handle_found(address, info.type, info.port)
+
         def make_handler(expected_service_type):
             # Handler must match zeroconf's expected signature: (zeroconf, service_type, name, state_change)
             def on_service_state_change(zeroconf, service_type, name, state_change, **kwargs):
@@ -190,11 +406,8 @@ class ADBController:
                     state_change is ServiceStateChange.Added
                     and service_type == expected_service_type
                 ):
-                    info = zeroconf.get_service_info(service_type, name)
-                    if info:
-                        address = ".".join(map(str, info.addresses[0])) if info.addresses else None
-                        port = info.port
-                        handle_found(address, service_type, port)
+                    # Resolved on zeroconf's loop, which also serializes handle_found calls
+                    resolve_service(zeroconf, service_type, name, on_resolved)
 
             return on_service_state_change
 
@@ -268,25 +481,12 @@ class ADBController:
         serial = f"{address}:{connect_port}"
         device_info = {}
 
-        # Helper to run adb shell command
-        def get_prop(prop: str) -> str:
-            try:
-                timeout = SettingsManager().get("adb", "connection_timeout", 10)
-                result = subprocess.run(
-                    [get_adb_path(), "-s", serial, "shell", "getprop", prop],
-                    capture_output=True,
-                    text=True,
-                    timeout=timeout,
-                )
-                return result.stdout.strip()
-            except Exception:
-                return ""
-
-        # Fetch basic properties
-        marketname = get_prop("ro.product.marketname")
-        model = get_prop("ro.product.device")
-        manufacturer = get_prop("ro.product.manufacturer")
-        android_version = get_prop("ro.build.version.release")
+        # Fetch basic properties in a single shell round-trip
+        try:
+            values = self.run_shell_batch(serial, [f"getprop {prop}" for prop in _INFO_PROPS])
+        except Exception:
+            values = [""] * len(_INFO_PROPS)
+        marketname, model, manufacturer, android_version = (value.strip() for value in values)
 
         device_info["name"] = f"{marketname}" if marketname else (model or _("Unknown"))
         device_info["model"] = model
@@ -307,56 +507,7 @@ class ADBController:
         Returns:
             Dict[str, str]: A dictionary containing RAM, storage, and battery info.
         """
-        serial = f"{address}:{connect_port}"
-        specs = {"ram": "", "storage": "", "battery": ""}
-
-        try:
-            # RAM
-            timeout = SettingsManager().get("adb", "connection_timeout", 10)
-            meminfo = subprocess.run(
-                [get_adb_path(), "-s", serial, "shell", "cat", "/proc/meminfo"],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
-            import re
-
-            match = re.search(r"MemTotal:\s+(\d+) kB", meminfo.stdout)
-            if match:
-                ram_mb = int(match.group(1)) // 1000
-                ram_gb = ram_mb / 1000
-                specs["ram"] = f"{round(ram_gb)} GB"
-
-            # Storage
-            df = subprocess.run(
-                [get_adb_path(), "-s", serial, "shell", "df", "/data"],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
-            lines = df.stdout.splitlines()
-            if len(lines) > 1:
-                parts = lines[1].split()
-                if len(parts) > 1:
-                    storage_mb = int(parts[1]) // 1000
-                    storage_gb = storage_mb / 1000
-                    specs["storage"] = f"{round(storage_gb)} GB"
-
-            # Battery
-            battery = subprocess.run(
-                [get_adb_path(), "-s", serial, "shell", "dumpsys", "battery"],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
-            match = re.search(r"level: (\d+)", battery.stdout)
-            if match:
-                specs["battery"] = f"{match.group(1)}%"
-
-        except Exception as e:
-            logger.error(f"Error fetching specs: {e}")
-
-        return specs
+        return self.fetch_device_specs_by_serial(f"{address}:{connect_port}")
 
     def fetch_device_specs_by_serial(self, serial: str) -> Dict[str, str]:
         """
@@ -371,30 +522,19 @@ class ADBController:
         specs = {"ram": "", "storage": "", "battery": ""}
 
         try:
-            # RAM
-            timeout = SettingsManager().get("adb", "connection_timeout", 10)
-            meminfo = subprocess.run(
-                [get_adb_path(), "-s", serial, "shell", "cat", "/proc/meminfo"],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+            # All three outputs come from one shell round-trip
+            meminfo, df, battery = self.run_shell_batch(serial, list(_SPECS_COMMANDS))
             import re
 
-            match = re.search(r"MemTotal:\s+(\d+) kB", meminfo.stdout)
+            # RAM
+            match = re.search(r"MemTotal:\s+(\d+) kB", meminfo)
             if match:
                 ram_mb = int(match.group(1)) // 1000
                 ram_gb = ram_mb / 1000
                 specs["ram"] = f"{round(ram_gb)} GB"
 
             # Storage
-            df = subprocess.run(
-                [get_adb_path(), "-s", serial, "shell", "df", "/data"],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
-            lines = df.stdout.splitlines()
+            lines = df.splitlines()
             if len(lines) > 1:
                 parts = lines[1].split()
                 if len(parts) > 1:
@@ -403,13 +543,7 @@ class ADBController:
                     specs["storage"] = f"{round(storage_gb)} GB"
 
             # Battery
-            battery = subprocess.run(
-                [get_adb_path(), "-s", serial, "shell", "dumpsys", "battery"],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
-            match = re.search(r"level: (\d+)", battery.stdout)
+            match = re.search(r"level: (\d+)", battery)
             if match:
                 specs["battery"] = f"{match.group(1)}%"
 
@@ -440,7 +574,7 @@ class ADBController:
         try:
             # 1. Check if device is locked or screen is off
             # Check screen state
-            timeout = SettingsManager().get("adb", "connection_timeout", 10)
+            timeout = get_settings_manager().get("adb", "connection_timeout", 10)
             dumpsys = subprocess.run(
                 [get_adb_path(), "-s", serial, "shell", "dumpsys", "window"],
                 capture_output=True,
@@ -522,6 +656,7 @@ class ADBController:
                 check=True,
                 timeout=timeout,
             )
+            self._write_thumbnail(local_path)
             return local_path
         except Exception as e:
             logger.error(f"Error capturing screenshot: {e}")
@@ -545,7 +680,7 @@ class ADBController:
         local_path = os.path.join(screenshot_dir, f"aurynk_{serial.replace(':', '_')}_screen.png")
         try:
             # Check if device is locked or screen is off
-            timeout = SettingsManager().get("adb", "connection_timeout", 10)
+            timeout = get_settings_manager().get("adb", "connection_timeout", 10)
             dumpsys = subprocess.run(
                 [get_adb_path(), "-s", serial, "shell", "dumpsys", "window"],
                 capture_output=True,
@@ -625,6 +760,7 @@ class ADBController:
                 check=True,
                 timeout=timeout,
             )
+            self._write_thumbnail(local_path)
             return local_path
         except Exception as e:
             logger.error(f"Error capturing screenshot by serial: {e}")
@@ -632,6 +768,40 @@ class ADBController:
                 return local_path
             return None
 
+    def _write_thumbnail(self, screenshot_path: str) -> Optional[str]:
+        """
+        Write a pre-scaled thumbnail next to a freshly captured screenshot.
+
+        Decoding the full-resolution capture on the UI thread is expensive, so
+        the scaled copy is produced here on the capture worker instead.
+
+        Args:
+            screenshot_path (str): Path to the full-resolution screenshot.
+
+        Returns:
+            Optional[str]: Path to the thumbnail if written, None otherwise.
+        """
+        thumb_path = get_thumbnail_path(screenshot_path)
+        # The previous capture's thumbnail would otherwise outlive a failed write
+        # and be shown in place of the new screenshot
+        try:
+            os.unlink(thumb_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not remove old thumbnail {thumb_path}: {e}")
+        if GdkPixbuf is None:
+            return None
+        try:
+            pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(
+                screenshot_path, THUMBNAIL_SIZE, THUMBNAIL_SIZE, True
+            )
+            pixbuf.savev(thumb_path, "png", [], [])
+            return thumb_path
+        except Exception as e:
+            logger.debug(f"Could not write screenshot thumbnail: {e}")
+            return None
+
     # ===== Device Storage =====
 
     def load_paired_devices(self) -> List[Dict[str, Any]]:
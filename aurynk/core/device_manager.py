@@ -1,6 +1,6 @@
 import json
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from aurynk.utils.logger import get_logger
 
@@ -19,11 +19,21 @@ class DeviceStore:
         """
         self.path = path
         self._devices: List[Dict[str, Any]] = []
+        # (mtime_ns, size) of the file as last read or written, None if absent
+        self._file_stat: Optional[Tuple[int, int]] = None
         self._load_from_file()
 
+    def _stat_file(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def _load_from_file(self):
         """Load devices from the JSON file."""
-        if not os.path.exists(self.path):
+        self._file_stat = self._stat_file()
+        if self._file_stat is None:
             self._devices = []
             return
         try:
@@ -82,7 +92,7 @@ class DeviceStore:
         """
         import subprocess
 
-        from aurynk.utils.adb_utils import get_adb_path
+        from aurynk.utils.adb_utils import get_adb_path, invalidate_adb_cache
         from aurynk.utils.device_events import notify_device_changed
         from aurynk.utils.notify import show_notification
 
@@ -117,6 +127,7 @@ class DeviceStore:
                     subprocess.run(
                         [get_adb_path(), "disconnect", f"{address}:{connect_port}"], check=False
                     )
+                    invalidate_adb_cache()
                 except Exception as e:
                     logger.error(f"Error disconnecting device: {e}")
 
@@ -168,6 +179,8 @@ class DeviceStore:
         except Exception as e:
             logger.error(f"Error saving devices: {e}")
         else:
+            # Our own write must not make the next reload() parse the file again
+            self._file_stat = self._stat_file()
             # After a successful save, notify the tray helper via a central
             # helper so the tray menu is kept in sync. Run in a daemon thread
             # to avoid blocking the caller.
@@ -189,8 +202,13 @@ class DeviceStore:
                 pass
 
     def reload(self):
-        """Reload device list from file (if changed externally)."""
-        self._load_from_file()
+        """Reload device list from file (if changed externally).
+
+        The file is only read again when its mtime or size differs from
+        the last load or save, so refreshing an unchanged list costs a stat.
+        """
+        if self._stat_file() != self._file_stat:
+            self._load_from_file()
 
     def clear(self):
         """Clear all devices from the store and save."""
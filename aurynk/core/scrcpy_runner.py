@@ -1,6 +1,7 @@
 """scrcpy interaction and management for Aurynk."""
 
 import os
+import selectors
 import shutil
 import subprocess
 import threading
@@ -22,6 +23,87 @@ except ImportError:
 logger = get_logger("ScrcpyManager")
 
 
+class _ProcessReaper:
+    """Waits for every scrcpy process from one thread, using Linux pidfds.
+
+    A pidfd turns readable once its process exits, so a single select() covers
+    all mirroring sessions instead of one thread blocked in wait() per session.
+    """
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = os.pipe()
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        # (pidfd, serial, proc, on_exit) handed over by watch(), registered by the
+        # thread; pidfd is None if the process was already gone
+        self._pending = []
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run, name="scrcpy-reaper", daemon=True).start()
+
+    def watch(self, serial, proc, on_exit):
+        """Call on_exit(serial, proc) from the reaper thread once proc has exited."""
+        # Open the pidfd right away, before a poll() elsewhere can reap the pid
+        # and let the kernel hand it to another process
+        try:
+            fd = os.pidfd_open(proc.pid)
+        except OSError:
+            fd = None
+        with self._lock:
+            self._pending.append((fd, serial, proc, on_exit))
+        os.write(self._wake_w, b"\0")
+
+    def _run(self):
+        while True:
+            for key, _events in self._selector.select():
+                if key.fd == self._wake_r:
+                    os.read(self._wake_r, 512)
+                    self._register_pending()
+                    continue
+                self._selector.unregister(key.fd)
+                os.close(key.fd)
+                self._reap(*key.data)
+
+    def _register_pending(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for fd, serial, proc, on_exit in pending:
+            if fd is None:
+                # Already reaped, e.g. by a poll() elsewhere
+                self._reap(serial, proc, on_exit)
+                continue
+            self._selector.register(fd, selectors.EVENT_READ, (serial, proc, on_exit))
+
+    @staticmethod
+    def _reap(serial, proc, on_exit):
+        try:
+            proc.wait()
+        except Exception as e:
+            logger.error(f"Error monitoring process {serial}: {e}")
+        # An error here must not end the thread every session relies on
+        try:
+            on_exit(serial, proc)
+        except Exception:
+            logger.exception(f"Error handling exit of process {serial}")
+
+
+_reaper = None
+_reaper_lock = threading.Lock()
+
+
+def _get_reaper():
+    """Return the shared _ProcessReaper, or None where pidfds are unsupported."""
+    global _reaper
+    with _reaper_lock:
+        if _reaper is None:
+            try:
+                os.close(os.pidfd_open(os.getpid()))
+            except (AttributeError, OSError):
+                _reaper = False
+            else:
+                _reaper = _ProcessReaper()
+        return _reaper or None
+
+
 class ScrcpyManager:
     """
     Handles scrcpy process management for device mirroring.
@@ -319,17 +401,14 @@ class ScrcpyManager:
             # Send notification to device that mirroring started
             if settings.get("app", "notify_device_on_mirroring", True):
                 try:
-                    from aurynk.utils.adb_utils import send_device_notification
+                    from aurynk.utils.adb_utils import send_device_notification_async
 
-                    send_device_notification(serial, "Screen mirroring started")
+                    send_device_notification_async(serial, "Screen mirroring started")
                 except Exception:
                     pass  # Don't fail mirroring if notification fails
 
-            # Start monitoring thread to handle window close events
-            monitor_thread = threading.Thread(
-                target=self._monitor_process, args=(serial, proc), daemon=True
-            )
-            monitor_thread.start()
+            # Watch for the process exiting to handle window close events
+            self._watch_process(serial, proc)
 
             return True
         except Exception as e:
@@ -396,9 +475,11 @@ class ScrcpyManager:
                     settings = SettingsManager()
                     if settings.get("app", "notify_device_on_mirroring", True):
                         try:
-                            from aurynk.utils.adb_utils import send_device_notification
+                            from aurynk.utils.adb_utils import send_device_notification_async
 
-                            send_device_notification(target_serial, "Screen mirroring stopped")
+                            send_device_notification_async(
+                                target_serial, "Screen mirroring stopped"
+                            )
                         except Exception:
                             pass  # Don't fail on notification error
 
@@ -407,61 +488,56 @@ class ScrcpyManager:
         logger.warning(f"No process found for {serial}, nothing to stop")
         return False
 
-    def is_mirroring(self, address: str, port: int) -> bool:
+    def snapshot_active(self):
+        """
+        Collect the running scrcpy processes in a single pass.
+
+        Finished processes are cleaned up along the way.
+
+        Returns:
+            tuple[set[str], set[str]]: The serials being mirrored, and the
+            addresses (serial without the port) being mirrored.
+        """
+        serials = set()
+        for s, proc in list(self.processes.items()):
+            if proc.poll() is None:
+                serials.add(s)
+            elif self.processes.get(s) is proc:
+                # Process finished, clean up; the reaper may get there first
+                self.processes.pop(s, None)
+        addresses = {s.rpartition(":")[0] for s in serials if ":" in s}
+        return serials, addresses
+
+    def is_mirroring(self, address: str, port: int, active=None) -> bool:
         """
         Check if scrcpy is running for the device.
 
         Args:
             address (str): Device IP address.
             port (int): Device connection port.
+            active (tuple, optional): A result of snapshot_active() to reuse.
 
         Returns:
             bool: True if running, False otherwise.
         """
-        serial = f"{address}:{port}"
-
-        # Check exact match
-        proc = self.processes.get(serial)
-        if proc:
-            poll_status = proc.poll()
-            if poll_status is None:
-                return True
-            else:
-                # Process finished, clean up
-                del self.processes[serial]
-
-        # Fallback: check if any process is running for this IP
-        # This handles cases where the port changed but scrcpy is still running on old port
-        for s in list(self.processes.keys()):
-            if s.startswith(f"{address}:"):
-                proc = self.processes[s]
-                if proc.poll() is None:
-                    return True
-                else:
-                    # Process finished, clean up
-                    del self.processes[s]
-
-        return False
+        serials, addresses = active or self.snapshot_active()
+        # A process for the same IP also counts: this handles cases where the
+        # port changed but scrcpy is still running on the old port
+        return f"{address}:{port}" in serials or address in addresses
 
-    def is_mirroring_serial(self, serial: str) -> bool:
+    def is_mirroring_serial(self, serial: str, active=None) -> bool:
         """
         Check if scrcpy is running for the device by serial.
 
         Args:
             serial (str): Device serial number.
+            active (tuple, optional): A result of snapshot_active() to reuse.
 
         Returns:
             bool: True if running, False otherwise.
         """
-        proc = self.processes.get(serial)
-        if proc:
-            poll_status = proc.poll()
-            if poll_status is None:
-                return True
-            else:
-                # Process finished, clean up
-                del self.processes[serial]
-        return False
+        serials, _ = active or self.snapshot_active()
+        return serial in serials
 
     def stop_mirror_by_serial(self, serial: str) -> bool:
         """
@@ -502,9 +578,9 @@ class ScrcpyManager:
                 settings = SettingsManager()
                 if settings.get("app", "notify_device_on_mirroring", True):
                     try:
-                        from aurynk.utils.adb_utils import send_device_notification
+                        from aurynk.utils.adb_utils import send_device_notification_async
 
-                        send_device_notification(serial, "Screen mirroring stopped")
+                        send_device_notification_async(serial, "Screen mirroring stopped")
                     except Exception:
                         pass  # Don't fail on notification error
 
@@ -731,23 +807,41 @@ class ScrcpyManager:
             # Send notification to device that mirroring started
             if settings.get("app", "notify_device_on_mirroring", True):
                 try:
-                    from aurynk.utils.adb_utils import send_device_notification
+                    from aurynk.utils.adb_utils import send_device_notification_async
 
-                    send_device_notification(serial, "Screen mirroring started")
+                    send_device_notification_async(serial, "Screen mirroring started")
                 except Exception:
                     pass  # Don't fail mirroring if notification fails
 
-            # Start monitoring thread
-            monitor_thread = threading.Thread(
-                target=self._monitor_process, args=(serial, proc), daemon=True
-            )
-            monitor_thread.start()
+            # Watch for the process exiting
+            self._watch_process(serial, proc)
 
             return True
         except Exception as e:
             logger.error(f"Error starting USB mirror: {e}")
             return False
 
+    def _watch_process(self, serial: str, proc: subprocess.Popen):
+        """
+        Arrange for _on_process_exit to run once the process exits.
+
+        Real processes share the pidfd reaper thread; elsewhere each one gets
+        a monitoring thread of its own.
+
+        Args:
+            serial (str): Device serial identifier.
+            proc (subprocess.Popen): The process object.
+        """
+        # Only a real process has an int pid to open a pidfd on
+        reaper = _get_reaper() if isinstance(getattr(proc, "pid", None), int) else None
+        if reaper is not None:
+            reaper.watch(serial, proc, self._on_process_exit)
+            return
+        monitor_thread = threading.Thread(
+            target=self._monitor_process, args=(serial, proc), daemon=True
+        )
+        monitor_thread.start()
+
     def _monitor_process(self, serial: str, proc: subprocess.Popen):
         """
         Monitor the process and clean up when it exits.
@@ -761,12 +855,23 @@ class ScrcpyManager:
         except Exception as e:
             logger.error(f"Error monitoring process {serial}: {e}")
         finally:
-            # Only remove if it's still the same process object (handle race with restart)
-            if serial in self.processes and self.processes[serial] == proc:
-                del self.processes[serial]
-                # Notify callbacks
-                for callback in self.stop_callbacks:
-                    try:
-                        callback(serial)
-                    except Exception as e:
-                        logger.error(f"Error in stop callback: {e}")
+            self._on_process_exit(serial, proc)
+
+    def _on_process_exit(self, serial: str, proc: subprocess.Popen):
+        """
+        Forget an exited process and notify the stop callbacks.
+
+        Args:
+            serial (str): Device serial identifier.
+            proc (subprocess.Popen): The process object.
+        """
+        # Only remove if it's still the same process object (handle race with restart)
+        # snapshot_active() may drop the entry concurrently, so never index it
+        if self.processes.get(serial) is proc:
+            self.processes.pop(serial, None)
+            # Notify callbacks
+            for callback in self.stop_callbacks:
+                try:
+                    callback(serial)
+                except Exception as e:
+                    logger.error(f"Error in stop callback: {e}")
@@ -1,8 +1,32 @@
 import subprocess
 import threading
+import time
 
 from gi.repository import GLib, GObject
 
+# Build properties read by fetch_details(), as (getprop name, data key)
+_PROPS = (
+    ("ro.product.manufacturer", "manufacturer"),
+    ("ro.product.model", "model"),
+    ("ro.build.version.release", "android_version"),
+)
+
+# Commands run by fetch_details(), in _PROPS order
+_PROPS_COMMANDS = [f"getprop {prop}" for prop, _key in _PROPS]
+
+# Seconds read props are reused per adb serial; ro.* props are fixed until reboot
+_PROPS_TTL = 3600.0
+
+# adb serial -> (monotonic time, {data key: value}) of the last successful read,
+# shared by every Device; dropped on unplug, as a reboot (e.g. an OTA update)
+# shows up as a remove and re-add
+_props_cache = {}
+
+
+def forget_props(adb_serial):
+    """Drop the cached props of a device, e.g. once it is unplugged."""
+    _props_cache.pop(adb_serial, None)
+
 
 class Device(GObject.Object):
     """Lightweight device object that emits 'info-updated' when ADB-backed
@@ -16,10 +40,14 @@ class Device(GObject.Object):
         "info-updated": (GObject.SignalFlags.RUN_FIRST, None, ()),
     }
 
-    def __init__(self, initial=None, adb_serial=None):
+    def __init__(self, initial=None, adb_serial=None, adb_controller=None):
         super().__init__()
         self._data = dict(initial or {})
         self.adb_serial = adb_serial or self._data.get("adb_serial")
+        # ADBController whose persistent shell fetch_details() reads props over
+        self._adb_controller = adb_controller
+        # time.monotonic() of the last completed fetch_details(), if any
+        self._last_fetch_monotonic = None
 
     def to_dict(self):
         return dict(self._data)
@@ -37,36 +65,39 @@ class Device(GObject.Object):
         # Run in a background thread
         def _task():
             try:
-                if not self.adb_serial:
+                if not self.adb_serial or self._adb_controller is None:
                     return
 
-                props_to_fetch = [
-                    ("ro.product.manufacturer", "manufacturer"),
-                    ("ro.product.model", "model"),
-                    ("ro.build.version.release", "android_version"),
-                ]
-
-                for prop, key in props_to_fetch:
-                    try:
-                        result = subprocess.run(
-                            ["adb", "-s", self.adb_serial, "shell", "getprop", prop],
-                            capture_output=True,
-                            text=True,
-                            timeout=timeout,
-                        )
-                        value = result.stdout.strip()
-                        if value:
-                            self._data[key] = value
-                    except Exception:
-                        pass
+                cached = _props_cache.get(self.adb_serial)
+                if cached is not None and time.monotonic() - cached[0] < _PROPS_TTL:
+                    self._data.update(cached[1])
+                else:
+                    self._read_props(timeout)
 
                 # Update name if model present
                 if self._data.get("model"):
                     self._data["name"] = self._data.get("model")
 
+                self._last_fetch_monotonic = time.monotonic()
                 # Emit signal on main thread
                 GLib.idle_add(self.emit, "info-updated")
             except Exception:
                 pass
 
         threading.Thread(target=_task, daemon=True).start()
+
+    def _read_props(self, timeout):
+        """Read _PROPS from the device into _data and the shared cache."""
+        # All props in one round-trip on the serial's persistent adb shell
+        try:
+            values = self._adb_controller.run_shell_batch(self.adb_serial, _PROPS_COMMANDS, timeout)
+        except (OSError, subprocess.SubprocessError):
+            return
+        props = {}
+        for (_prop, key), value in zip(_PROPS, values):
+            value = value.strip()
+            if value:
+                props[key] = value
+        self._data.update(props)
+        if props:
+            _props_cache[self.adb_serial] = (time.monotonic(), props)
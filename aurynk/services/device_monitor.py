@@ -1,5 +1,6 @@
 """Background service for monitoring and auto-connecting to paired devices."""
 
+import queue
 import subprocess
 import threading
 import time
@@ -7,6 +8,7 @@ from typing import Callable, Dict, Optional
 
 from zeroconf import IPVersion, ServiceBrowser, ServiceStateChange, Zeroconf
 
+from aurynk.core.adb_manager import resolve_service
 from aurynk.i18n import _
 from aurynk.utils.logger import get_logger
 from aurynk.utils.settings import SettingsManager
@@ -42,6 +44,8 @@ class DeviceMonitor:
         self._device_by_address = {}  # {address: model} - for quick IP lookups
         self._connected_devices = set()  # Addresses of currently connected devices
         self._discovered_services = {}  # Temporary storage for mDNS discoveries
+        # (handler, args) for resolved mDNS services, run in order by the discovery thread
+        self._discovery_events = None
 
         # Initialize callbacks dict here
         self._callbacks = {
@@ -157,6 +161,10 @@ class DeviceMonitor:
                 logger.debug(f"Error closing zeroconf: {e}")
             self._zeroconf = None
 
+        if self._discovery_events is not None:
+            self._discovery_events.put(None)
+            self._discovery_events = None
+
         logger.info("Device monitor stopped")
 
     def _start_mdns_discovery(self):
@@ -164,31 +172,48 @@ class DeviceMonitor:
         try:
             self._zeroconf = Zeroconf(ip_version=IPVersion.V4Only)
 
+            # Services are resolved on zeroconf's event loop rather than in these
+            # handlers, and handled on our discovery thread rather than on that
+            # loop, so neither the browsers nor zeroconf ever wait on our work
+            events = self._discovery_events = queue.Queue()
+            threading.Thread(
+                target=self._process_discovery_events,
+                args=(events,),
+                name="mdns-discovery",
+                daemon=True,
+            ).start()
+
+            def discovered(service_type):
+                def on_resolved(info):
+                    if info.addresses:
+                        address = ".".join(map(str, info.addresses[0]))
+                        # Extract device model from service name (format: "adb-<model>-<random>._adb-tls-connect._tcp.local.")
+                        model = self._extract_model_from_service_name(info.name)
+                        events.put(
+                            (
+                                self._handle_device_discovered,
+                                (address, info.port, service_type, model),
+                            )
+                        )
+
+                return on_resolved
+
+            def on_lost(info):
+                if info.addresses:
+                    address = ".".join(map(str, info.addresses[0]))
+                    events.put((self._handle_device_lost, (address,)))
+
             # Handler for connect services (these are the ones we want to auto-connect to)
             def on_connect_service_change(zeroconf, service_type, name, state_change):
                 if state_change == ServiceStateChange.Added:
-                    info = zeroconf.get_service_info(service_type, name)
-                    if info and info.addresses:
-                        address = ".".join(map(str, info.addresses[0]))
-                        port = info.port
-                        # Extract device model from service name (format: "adb-<model>-<random>._adb-tls-connect._tcp.local.")
-                        model = self._extract_model_from_service_name(name)
-                        self._handle_device_discovered(address, port, "connect", model)
+                    resolve_service(zeroconf, service_type, name, discovered("connect"))
                 elif state_change == ServiceStateChange.Removed:
-                    info = zeroconf.get_service_info(service_type, name)
-                    if info and info.addresses:
-                        address = ".".join(map(str, info.addresses[0]))
-                        self._handle_device_lost(address)
+                    resolve_service(zeroconf, service_type, name, on_lost)
 
             # Handler for pairing services
             def on_pair_service_change(zeroconf, service_type, name, state_change):
                 if state_change == ServiceStateChange.Added:
-                    info = zeroconf.get_service_info(service_type, name)
-                    if info and info.addresses:
-                        address = ".".join(map(str, info.addresses[0]))
-                        port = info.port
-                        model = self._extract_model_from_service_name(name)
-                        self._handle_device_discovered(address, port, "pair", model)
+                    resolve_service(zeroconf, service_type, name, discovered("pair"))
 
             # Browse for both service types
             browser_connect = ServiceBrowser(
@@ -208,6 +233,18 @@ class DeviceMonitor:
         except Exception as e:
             logger.error(f"Failed to start mDNS discovery: {e}")
 
+    def _process_discovery_events(self, events: queue.Queue):
+        """Run queued discovery handlers in arrival order until stop() queues None."""
+        while True:
+            event = events.get()
+            if event is None:
+                return
+            handler, args = event
+            try:
+                handler(*args)
+            except Exception as e:
+                logger.error(f"Error handling mDNS event: {e}")
+
     def _extract_model_from_service_name(self, service_name: str) -> str:
         """Extract device model from mDNS service name.
 
@@ -10,6 +10,7 @@ from aurynk.core.scrcpy_runner import ScrcpyManager
 from aurynk.i18n import _
 from aurynk.services.usb_monitor import USBMonitor
 from aurynk.ui.windows.main_window import AurynkWindow
+from aurynk.utils.adb_utils import invalidate_adb_cache
 from aurynk.utils.logger import get_logger
 
 logger = get_logger("TrayController")
@@ -23,51 +24,6 @@ _subscription_lock = threading.Lock()
 _usb_monitor = None
 
 
-def _update_device_row_labels(row_widget, device_data):
-    """Update the labels in a device row widget to reflect updated device data.
-    This is used when tray canonicalization merges new data into an existing
-    row widget, ensuring the UI displays the latest information.
-    """
-    try:
-        from gi.repository import Gtk
-
-        # Find the info_box containing the labels (second child after icon)
-        child = row_widget.get_first_child()
-        if child:
-            child = child.get_next_sibling()  # Skip icon, get info_box
-
-        if not child or not isinstance(child, Gtk.Box):
-            return
-
-        # Update name label (first child of info_box)
-        name_label = child.get_first_child()
-        if name_label and isinstance(name_label, Gtk.Label):
-            dev_name = device_data.get("name", _("Unknown Device"))
-            # Strip the "* " prefix if present (helper adds it for USB devices)
-            if dev_name.startswith("* "):
-                dev_name = dev_name[2:]
-            name_label.set_markup(f'<span size="large" weight="bold">{dev_name}</span>')
-
-        # Update details label (second child of info_box)
-        details_label = name_label.get_next_sibling() if name_label else None
-        if details_label and isinstance(details_label, Gtk.Label):
-            details = []
-            if device_data.get("manufacturer"):
-                details.append(device_data["manufacturer"])
-            if device_data.get("model"):
-                details.append(device_data["model"])
-            if device_data.get("android_version"):
-                details.append(f"Android {device_data['android_version']}")
-
-            if details:
-                details_label.set_label(" • ".join(details))
-                details_label.set_visible(True)
-            else:
-                details_label.set_visible(False)
-    except Exception as e:
-        logger.debug(f"Failed to update device row labels: {e}")
-
-
 def _get_udev_client():
     """Legacy helper retained for compatibility; proxy helper removed."""
     return None
@@ -85,9 +41,19 @@ def start_udev_subscription(app):
             return
         _subscription_started = True
 
+    # One idle refresh serves every USB event that arrives before it runs
+    pending = {"id": None}
+
+    def _run_refresh():
+        pending["id"] = None
+        send_status_to_tray(app)
+        return False
+
     def _queue_refresh(*_args):
+        if pending["id"] is not None:
+            return False
         try:
-            GLib.idle_add(send_status_to_tray, app)
+            pending["id"] = GLib.idle_add(_run_refresh)
         except Exception:
             logger.debug("Failed to schedule tray refresh from USB event", exc_info=True)
         return False
@@ -112,6 +78,30 @@ _last_tray_update = 0
 _tray_update_lock = __import__("threading").Lock()
 _pending_tray_update = None
 _TRAY_UPDATE_MIN_INTERVAL = 0.2  # Minimum 200ms between tray updates
+# Checks for a tray helper socket that is not there yet, e.g. right after launch
+_TRAY_SOCKET_RETRIES = 5
+_TRAY_SOCKET_RETRY_MS = 500
+_tray_socket_retry = None
+
+
+def _status_entry(name, address, connected, mirroring, data=None, is_usb=False):
+    """Build one device entry of a tray status update, always in the same shape."""
+    data = data or {}
+    return {
+        "name": name,
+        "address": address,
+        "connected": connected,
+        "mirroring": mirroring,
+        "model": data.get("model"),
+        "manufacturer": data.get("manufacturer"),
+        "android_version": data.get("android_version"),
+        "is_usb": is_usb,
+    }
+
+
+def _encode_devices(device_status):
+    """Serialize a tray status update; compact, as the helper only parses it."""
+    return json.dumps({"devices": device_status}, separators=(",", ":"))
 
 
 def _safe_idle_call(func, *args, **kwargs):
@@ -169,15 +159,26 @@ def send_status_to_tray(app, status: str = None):
     _do_tray_update(app, status)
 
 
-def _do_tray_update(app, status: str = None):
+def _do_tray_update(app, status: str = None, retries: int = _TRAY_SOCKET_RETRIES):
     """Internal function that actually performs the tray update."""
-    global _last_tray_update, _pending_tray_update
+    global _last_tray_update, _pending_tray_update, _tray_socket_retry
 
     # Update timestamp and clear pending flag
     with _tray_update_lock:
         _last_tray_update = time.time()
         _pending_tray_update = None
 
+    if not os.path.exists(TRAY_SOCKET):
+        # No helper listening: don't build a status nobody receives, look again later
+        with _tray_update_lock:
+            if retries and _tray_socket_retry is None:
+                _tray_socket_retry = GLib.timeout_add(
+                    _TRAY_SOCKET_RETRY_MS, _retry_tray_update, app, status, retries - 1
+                )
+            elif not retries:
+                logger.warning("Tray helper socket not available after retries.")
+        return False
+
     try:
         win = app.props.active_window
         if not win:
@@ -190,11 +191,12 @@ def _do_tray_update(app, status: str = None):
         if not win:
             win = AurynkWindow(application=app)
 
-        devices = win.adb_controller.load_paired_devices()
         device_status = []
         from aurynk.utils.adb_utils import is_device_connected
 
         scrcpy = ScrcpyManager()
+        # Listed once per update rather than copied into every row's debug line
+        logger.debug(f"Building tray status; scrcpy processes: {', '.join(scrcpy.processes)}")
         # Query helper for running processes (non-blocking small timeout)
         helper_processes = {}
         client = _get_udev_client()
@@ -210,7 +212,7 @@ def _do_tray_update(app, status: str = None):
         wireless_devices_processed = False
         if hasattr(win, "_wireless_rows") and win._wireless_rows:
             try:
-                for row in win._wireless_rows:
+                for row in win._wireless_rows.values():
                     # Skip placeholder rows or rows without device data
                     if not hasattr(row, "_device_data") or not row._device_data:
                         continue
@@ -231,20 +233,14 @@ def _do_tray_update(app, status: str = None):
                         else:
                             mirroring = scrcpy.is_mirroring(address, connect_port)
                         logger.debug(
-                            f"Wireless {address}:{connect_port}: connected={connected}, mirroring={mirroring}, processes={list(scrcpy.processes.keys())}"
+                            f"Wireless {address}:{connect_port}: connected={connected}, "
+                            f"mirroring={mirroring}"
                         )
 
                     device_status.append(
-                        {
-                            "name": d.get("name", _("Unknown Device")),
-                            "address": address,
-                            "connected": connected,
-                            "mirroring": mirroring,
-                            "model": d.get("model"),
-                            "manufacturer": d.get("manufacturer"),
-                            "android_version": d.get("android_version"),
-                            "is_usb": False,
-                        }
+                        _status_entry(
+                            d.get("name", _("Unknown Device")), address, connected, mirroring, d
+                        )
                     )
                 wireless_devices_processed = True
             except Exception as e:
@@ -262,27 +258,19 @@ def _do_tray_update(app, status: str = None):
                     connected = is_device_connected(address, connect_port)
                     mirroring = scrcpy.is_mirroring(address, connect_port)
                 device_status.append(
-                    {
-                        "name": d.get("name", _("Unknown Device")),
-                        "address": address,
-                        "connected": connected,
-                        "mirroring": mirroring,
-                        "model": d.get("model"),
-                        "manufacturer": d.get("manufacturer"),
-                        "android_version": d.get("android_version"),
-                        "is_usb": False,
-                    }
+                    _status_entry(
+                        d.get("name", _("Unknown Device")), address, connected, mirroring, d
+                    )
                 )
 
         # Add USB devices from main window state
         # This avoids blocking 'adb devices' calls and ensures consistency with UI
         if hasattr(win, "usb_rows"):
-            for udev_serial, row_data in win.usb_rows.items():
+            for udev_serial, entry in win.usb_rows.items():
                 try:
-                    # Handle both old format (just row) and new format (dict with data)
-                    if isinstance(row_data, dict) and "data" in row_data:
-                        data = row_data["data"]
-                        adb_serial = data.get("adb_serial")
+                    if entry.data is not None:
+                        data = entry.data
+                        adb_serial = entry.adb_serial
 
                         # Only list devices that have an ADB serial (are actually connected via ADB)
                         if adb_serial:
@@ -294,34 +282,27 @@ def _do_tray_update(app, status: str = None):
                                 mirroring = True
                             else:
                                 mirroring = scrcpy.is_mirroring_serial(adb_serial)
-                            logger.debug(
-                                f"USB Device {adb_serial}: mirroring={mirroring}, processes={list(scrcpy.processes.keys())}"
-                            )
+                            logger.debug(f"USB Device {adb_serial}: mirroring={mirroring}")
                             device_status.append(
-                                {
-                                    "name": display_name,
-                                    "address": adb_serial,
-                                    "connected": True,
-                                    "mirroring": mirroring,
-                                    "model": data.get("model"),
-                                    "manufacturer": data.get("manufacturer"),
-                                    "android_version": data.get("android_version"),
-                                    "is_usb": True,
-                                }
+                                _status_entry(
+                                    display_name, adb_serial, True, mirroring, data, is_usb=True
+                                )
                             )
                 except Exception as e:
                     logger.error(f"Error adding USB device to tray status: {e}")
 
-        msg = json.dumps({"devices": device_status})
+        msg = _encode_devices(device_status)
         # logger.info(f"Sending tray status: {msg}")
     except Exception as e:
         logger.error(f"Error building device status for tray: {e}")
         msg = status if status else ""
+    # Encoded once; retries resend the same buffer
+    data = msg.encode()
     for attempt in range(5):
         try:
             with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
                 s.connect(TRAY_SOCKET)
-                s.sendall(msg.encode())
+                s.sendall(data)
             return False  # Don't repeat if called from GLib.timeout_add
         except FileNotFoundError:
             time.sleep(0.5)
@@ -332,6 +313,13 @@ def _do_tray_update(app, status: str = None):
     return False
 
 
+def _retry_tray_update(app, status, retries):
+    global _tray_socket_retry
+    with _tray_update_lock:
+        _tray_socket_retry = None
+    return _do_tray_update(app, status, retries)
+
+
 def send_devices_to_tray(devices):
     """Send a list of device dicts directly to the tray helper socket.
 
@@ -340,15 +328,16 @@ def send_devices_to_tray(devices):
     compute the `connected` state for each device and send the same JSON
     payload the tray helper expects.
     """
-    import subprocess
-
     try:
-        from aurynk.utils.adb_utils import is_device_connected
+        from aurynk.utils.adb_utils import get_adb_devices, is_device_connected
     except Exception:
         # If import fails, fallback to assuming devices are disconnected
         def is_device_connected(a, p):
             return False
 
+        def get_adb_devices():
+            return {}
+
     from aurynk.core.scrcpy_runner import ScrcpyManager
 
     scrcpy = ScrcpyManager()
@@ -376,78 +365,56 @@ def send_devices_to_tray(devices):
             except Exception:
                 connected = False
         device_status.append(
-            {
-                "name": d.get("name", _("Unknown Device")),
-                "address": address,
-                "connected": connected,
-                "mirroring": mirroring,
-                "model": d.get("model"),
-                "manufacturer": d.get("manufacturer"),
-                "android_version": d.get("android_version"),
-                "is_usb": False,
-            }
+            _status_entry(d.get("name", _("Unknown Device")), address, connected, mirroring, d)
         )
 
     # Add USB devices
     try:
-        result = subprocess.run(["adb", "devices"], capture_output=True, text=True, timeout=2)
-        lines = result.stdout.strip().split("\n")[1:]  # Skip header
-        for line in lines:
-            if "\t" in line:
-                serial, status_str = line.split("\t", 1)
-                # USB devices don't have : in serial (wireless have ip:port)
-                if ":" not in serial and status_str.strip() == "device":
-                    # Try to get device name from active window if possible
-                    device_name = None
-                    try:
-                        from gi.repository import Gtk
-
-                        app = Gtk.Application.get_default()
-                        if app and hasattr(app, "props") and app.props.active_window:
-                            win = app.props.active_window
-                            if hasattr(win, "usb_rows"):
-                                for usb_serial, row_data in win.usb_rows.items():
-                                    if isinstance(row_data, dict) and "data" in row_data:
-                                        if row_data["data"].get("adb_serial") == serial:
-                                            device_name = row_data["data"].get("name", "USB Device")
-                                            break
-                    except Exception:
-                        pass
+        # Shares the cached/tracked listing instead of spawning adb again
+        for serial, status_str in get_adb_devices().items():
+            # USB devices don't have : in serial (wireless have ip:port)
+            if ":" not in serial and status_str == "device":
+                # Try to get device name from active window if possible
+                device_name = None
+                try:
+                    from gi.repository import Gtk
+
+                    app = Gtk.Application.get_default()
+                    if app and hasattr(app, "props") and app.props.active_window:
+                        win = app.props.active_window
+                        if hasattr(win, "usb_rows"):
+                            for usb_serial, entry in win.usb_rows.items():
+                                if entry.adb_serial == serial:
+                                    device_name = entry.data.get("name", "USB Device")
+                                    break
+                except Exception:
+                    pass
 
-                    # Fallback to generic name if not found
-                    if not device_name:
-                        device_name = "USB Device"
+                # Fallback to generic name if not found
+                if not device_name:
+                    device_name = "USB Device"
 
-                    # Add asterisk prefix to indicate USB device
-                    device_name = f"* {device_name}"
+                # Add asterisk prefix to indicate USB device
+                device_name = f"* {device_name}"
 
-                    mirroring = False
-                    if serial in helper_processes:
-                        mirroring = True
-                    else:
-                        mirroring = scrcpy.is_mirroring_serial(serial)
-                    device_status.append(
-                        {
-                            "name": device_name,
-                            "address": serial,
-                            "connected": True,
-                            "mirroring": mirroring,
-                            "model": None,
-                            "manufacturer": None,
-                            "android_version": None,
-                            "is_usb": True,
-                        }
-                    )
+                mirroring = False
+                if serial in helper_processes:
+                    mirroring = True
+                else:
+                    mirroring = scrcpy.is_mirroring_serial(serial)
+                device_status.append(
+                    _status_entry(device_name, serial, True, mirroring, is_usb=True)
+                )
     except Exception as e:
         logger.debug(f"Could not get USB devices: {e}")
 
-    msg = json.dumps({"devices": device_status})
+    data = _encode_devices(device_status).encode()
 
     for attempt in range(6):
         try:
             with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
                 s.connect(TRAY_SOCKET)
-                s.sendall(msg.encode())
+                s.sendall(data)
             return
         except FileNotFoundError:
             time.sleep(0.25)
@@ -467,7 +434,9 @@ def tray_command_listener(app):
     server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     try:
         server.bind(APP_SOCKET)
-        server.listen(1)
+        # Commands are handled one at a time, but a burst of tray clicks must
+        # queue up rather than have its connects refused
+        server.listen(socket.SOMAXCONN)
         # Allow accept to timeout periodically so we can check app state and exit cleanly
         server.settimeout(1.0)
         logger.info(f"Command listener ready on {APP_SOCKET}")
@@ -487,27 +456,15 @@ def tray_command_listener(app):
                 if data:
                     msg = data.decode()
                     logger.debug(f"Received command: {msg}")
-                    if msg == "show":
-                        GLib.idle_add(_safe_idle_call, app.present_main_window)
-                    elif msg == "pair_new":
-                        GLib.idle_add(_safe_idle_call, app.show_pair_dialog)
-                    elif msg == "about":
-                        GLib.idle_add(_safe_idle_call, app.show_about_dialog)
-                    elif msg == "quit":
-                        logger.info("Received quit from tray. Exiting.")
-                        GLib.idle_add(_safe_idle_call, app.quit)
-                    elif msg.startswith("connect:"):
-                        address = msg.split(":", 1)[1]
-                        GLib.idle_add(tray_connect_device, app, address)
-                    elif msg.startswith("disconnect:"):
-                        address = msg.split(":", 1)[1]
-                        GLib.idle_add(tray_disconnect_device, app, address)
-                    elif msg.startswith("mirror:"):
-                        address = msg.split(":", 1)[1]
-                        GLib.idle_add(tray_mirror_device, app, address)
-                    elif msg.startswith("unpair:"):
-                        address = msg.split(":", 1)[1]
-                        GLib.idle_add(tray_unpair_device, app, address)
+                    command, sep, address = msg.partition(":")
+                    if sep:
+                        handler = _DEVICE_COMMANDS.get(command)
+                        if handler:
+                            GLib.idle_add(handler, app, address)
+                    elif msg in _APP_COMMANDS:
+                        if msg == "quit":
+                            logger.info("Received quit from tray. Exiting.")
+                        GLib.idle_add(_safe_idle_call, getattr(app, _APP_COMMANDS[msg]))
             except Exception as e:
                 logger.error(f"Error reading tray command: {e}")
             finally:
@@ -540,6 +497,7 @@ def tray_connect_device(app, address):
             import subprocess
 
             subprocess.run(["adb", "connect", f"{address}:{connect_port}"])
+            invalidate_adb_cache()
         win._refresh_device_list()
         send_status_to_tray(app)
 
@@ -556,6 +514,7 @@ def tray_disconnect_device(app, address):
             import subprocess
 
             subprocess.run(["adb", "disconnect", f"{address}:{connect_port}"])
+            invalidate_adb_cache()
         win._refresh_device_list()
         send_status_to_tray(app)
 
@@ -581,7 +540,7 @@ def tray_mirror_device(app, address):
     # Check UI rows first for most up-to-date state (especially connect_port)
     if hasattr(win, "_wireless_rows") and win._wireless_rows:
         try:
-            for row in win._wireless_rows:
+            for row in win._wireless_rows.values():
                 if hasattr(row, "_device_data") and row._device_data:
                     d = row._device_data
                     if d.get("address") == address:
@@ -630,7 +589,7 @@ def tray_mirror_device(app, address):
                         try:
                             # find matching wireless row and clear override
                             if hasattr(win, "_wireless_rows") and win._wireless_rows:
-                                for row in win._wireless_rows:
+                                for row in win._wireless_rows.values():
                                     if hasattr(row, "_device_data") and row._device_data:
                                         if row._device_data.get("address") == address:
                                             row._device_data.pop("_mirroring_override", None)
@@ -665,7 +624,7 @@ def tray_mirror_device(app, address):
                         # Mark a transient UI override so main window shows mirroring
                         try:
                             if hasattr(win, "_wireless_rows") and win._wireless_rows:
-                                for row in win._wireless_rows:
+                                for row in win._wireless_rows.values():
                                     if hasattr(row, "_device_data") and row._device_data:
                                         if row._device_data.get("address") == address:
                                             row._device_data["_mirroring_override"] = True
@@ -728,12 +687,10 @@ def tray_mirror_device(app, address):
         device_name = "USB Device"
         # Try to get device name from USB monitor
         if hasattr(win, "usb_rows"):
-            for usb_serial, row_data in win.usb_rows.items():
-                # Handle both old format (just row) and new format (dict with data)
-                if isinstance(row_data, dict) and "data" in row_data:
-                    if row_data["data"].get("adb_serial") == address:
-                        device_name = row_data["data"].get("name", "USB Device")
-                        break
+            for usb_serial, entry in win.usb_rows.items():
+                if entry.adb_serial == address:
+                    device_name = entry.data.get("name", "USB Device")
+                    break
 
         # Check if currently mirroring (prefer helper)
         client = _get_udev_client()
@@ -760,8 +717,8 @@ def tray_mirror_device(app, address):
                     try:
                         if hasattr(win, "usb_rows") and win.usb_rows:
                             entry = win.usb_rows.get(address)
-                            if isinstance(entry, dict) and "data" in entry:
-                                entry["data"].pop("_mirroring_override", None)
+                            if entry is not None:
+                                entry.data.pop("_mirroring_override", None)
                     except Exception:
                         pass
                 except Exception:
@@ -783,8 +740,8 @@ def tray_mirror_device(app, address):
                     try:
                         if hasattr(win, "usb_rows") and win.usb_rows:
                             entry = win.usb_rows.get(address)
-                            if isinstance(entry, dict) and "data" in entry:
-                                entry["data"]["_mirroring_override"] = True
+                            if entry is not None:
+                                entry.data["_mirroring_override"] = True
                     except Exception:
                         pass
                 except Exception:
@@ -840,3 +797,19 @@ def tray_unpair_device(app, address):
     win.adb_controller.device_store.remove_device(address)
     win._refresh_device_list()
     send_status_to_tray(app)
+
+
+# Tray helper commands: "<command>" runs an app method, "<command>:<address>"
+# a per-device action
+_APP_COMMANDS = {
+    "show": "present_main_window",
+    "pair_new": "show_pair_dialog",
+    "about": "show_about_dialog",
+    "quit": "quit",
+}
+_DEVICE_COMMANDS = {
+    "connect": tray_connect_device,
+    "disconnect": tray_disconnect_device,
+    "mirror": tray_mirror_device,
+    "unpair": tray_unpair_device,
+}
@@ -1,6 +1,6 @@
 """USB monitor service for detecting Android devices."""
 
-from typing import Optional, Set
+from typing import Dict, Optional, Set
 
 import pyudev
 
@@ -94,11 +94,14 @@ class USBMonitor(GObject.Object):
         super().__init__()
         self._context = pyudev.Context()
         self._monitor = pyudev.Monitor.from_netlink(self._context)
-        self._monitor.filter_by(subsystem="usb")
+        # Only whole devices: interfaces, which fire their own events for
+        # every plug, are dropped by the socket filter before reaching us
+        self._monitor.filter_by(subsystem="usb", device_type="usb_device")
         self._watch_id: Optional[int] = None
         self._running = False
-        # Cache connected device paths so we can emit disconnect even when metadata is missing
-        self._connected_devices: Set[str] = set()
+        # Connected Android devices by path, kept as the udev objects themselves so
+        # disconnects are recognised even when the remove event lacks metadata
+        self._connected_devices: Dict[str, pyudev.Device] = {}
 
     def start(self) -> None:
         """Start monitoring for USB events."""
@@ -106,9 +109,9 @@ class USBMonitor(GObject.Object):
             return
 
         # Populate cache with currently connected Android devices
-        for device in self._context.list_devices(subsystem="usb"):
+        for device in self._context.list_devices(subsystem="usb", DEVTYPE="usb_device"):
             if self._is_android_device(device):
-                self._connected_devices.add(device.device_path)
+                self._connected_devices[device.device_path] = device
 
         # Start the monitor (binds the socket)
         self._monitor.start()
@@ -121,10 +124,16 @@ class USBMonitor(GObject.Object):
         logger.info("USB Monitor started")
 
     def get_connected_devices(self) -> list[pyudev.Device]:
-        """Get currently connected Android devices."""
+        """Get currently connected Android devices.
+
+        While monitoring, the cache kept current by udev events is returned
+        instead of enumerating the USB subsystem again.
+        """
+        if self._running:
+            return list(self._connected_devices.values())
         devices = []
         try:
-            for device in self._context.list_devices(subsystem="usb"):
+            for device in self._context.list_devices(subsystem="usb", DEVTYPE="usb_device"):
                 if self._is_android_device(device):
                     devices.append(device)
         except Exception as e:
@@ -148,6 +157,9 @@ class USBMonitor(GObject.Object):
     def _on_monitor_event(self, source: int, condition: int) -> bool:
         """Handle monitor event from GLib main loop.
 
+        Every event already queued on the netlink socket is handled in this
+        wakeup, so a hotplug burst costs one main loop dispatch, not one per event.
+
         Args:
             source: The file descriptor.
             condition: The IO condition.
@@ -156,8 +168,7 @@ class USBMonitor(GObject.Object):
             True to keep watching, False to stop.
         """
         if condition & GLib.IO_IN:
-            device = self._monitor.poll(timeout=0)
-            if device:
+            for device in iter(lambda: self._monitor.poll(timeout=0), None):
                 self._process_device(device)
         return True
 
@@ -174,8 +185,8 @@ class USBMonitor(GObject.Object):
             if self._is_android_device(device):
                 serial = device.get("ID_SERIAL", "unknown")
                 logger.info(f"Android device connected: {serial}")
-                # Cache the device path so we can detect its removal even if metadata is gone
-                self._connected_devices.add(device_path)
+                # Cache the device so we can detect its removal even if metadata is gone
+                self._connected_devices[device_path] = device
                 self.emit("device-connected", device)
         elif action == "remove":
             # On remove, metadata like ID_SERIAL and ID_VENDOR_ID are often missing.
@@ -183,7 +194,7 @@ class USBMonitor(GObject.Object):
             if device_path in self._connected_devices:
                 serial = device.get("ID_SERIAL", "unknown")
                 logger.info(f"Android device disconnected: {serial} (path: {device_path})")
-                self._connected_devices.discard(device_path)
+                del self._connected_devices[device_path]
                 self.emit("device-disconnected", device)
             elif self._is_android_device(device):
                 # Fallback: if metadata is still present and matches, emit disconnect
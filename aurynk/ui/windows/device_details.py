@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import gi
 
@@ -6,26 +7,71 @@ from aurynk.i18n import _
 
 gi.require_version("Gtk", "4.0")
 gi.require_version("Adw", "1")
-import threading
 
-from gi.repository import Adw, Gtk
+from gi.repository import Adw, Gdk, GLib, Gtk
 
-from aurynk.core.adb_manager import ADBController
+from aurynk.core.adb_manager import ADBController, get_thumbnail_path
+from aurynk.utils.adb_utils import get_adb_devices, peek_adb_devices
+
+# Flat styling for the details window when GTK falls back to software rendering
+_LITE_CSS = b"""
+    window.details-lite row,
+    window.details-lite preferencesgroup,
+    window.details-lite list {
+        box-shadow: none;
+        transition: none;
+    }
+    """
+_lite_css_installed = False
+
+# Shared worker pool for adb queries issued from details windows
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="aurynk-adb")
+# Screenshots taken alongside a specs query; a separate pool, since jobs on
+# _EXECUTOR wait for these
+_CAPTURE_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="aurynk-capture")
+
+# Most recycled info rows kept between windows; one window uses eight
+_ROW_POOL_MAX = 16
+
+
+def _is_software_rendering(renderer=None):
+    """Return True when GTK is (or has been told to be) rendering with Cairo."""
+    if os.environ.get("GSK_RENDERER", "").lower() == "cairo":
+        return True
+    if os.environ.get("LIBGL_ALWAYS_SOFTWARE") == "1":
+        return True
+    return renderer is not None and renderer.__gtype__.name == "GskCairoRenderer"
 
 
 class DeviceDetailsWindow(Adw.Window):
     """Window showing detailed device information."""
 
+    # Info rows recycled between window instances to avoid GObject churn
+    _row_pool = []
+
     def __init__(self, device, parent):
         super().__init__(transient_for=parent)
 
         self.device = device
         self.adb_controller = ADBController()
-
-        self.set_title(_("Device: {name}").format(name=device.get("name", _("Unknown"))))
+        # Translated strings reused on every refresh
+        self._unknown = _("Unknown")
+        self._loading = _("Loading...")
+        self._info_rows = []
+        self._closed = False
+        self._busy = False
+        self.name_row = None
+        self.manufacturer_row = None
+        self.android_version_row = None
+        self.connection_row = None
+        self.ram_row = None
+
+        self.set_title(_("Device: {name}").format(name=device.get("name", self._unknown)))
         self.set_default_size(900, 600)
 
         self._setup_ui()
+        self.connect("close-request", self._on_close_request)
+        self.connect("realize", self._on_realize)
 
         # Load device specs if not already loaded
         if not device.get("spec"):
@@ -64,19 +110,18 @@ class DeviceDetailsWindow(Adw.Window):
         self.screenshot_image = Gtk.Image()
         self.screenshot_image.set_pixel_size(360)
 
-        # Load thumbnail if available
+        # Show the fallback icon right away (Flatpak-compliant GResource path);
+        # the thumbnail, if any, is checked and decoded off the main thread
+        self.screenshot_image.set_from_resource(
+            "/io/github/IshuSinghSE/aurynk/icons/io.github.IshuSinghSE.aurynk.device.png"
+        )
         thumbnail = self.device.get("thumbnail")
-        if thumbnail and not os.path.isabs(thumbnail):
-            thumbnail = os.path.expanduser(
-                os.path.join("~/.local/share/aurynk/screenshots", thumbnail)
-            )
-        if not thumbnail or not os.path.exists(thumbnail):
-            # Use Flatpak-compliant GResource path for fallback icon
-            self.screenshot_image.set_from_resource(
-                "/io/github/IshuSinghSE/aurynk/icons/io.github.IshuSinghSE.aurynk.device.png"
-            )
-        else:
-            self.screenshot_image.set_from_file(thumbnail)
+        if thumbnail:
+            if not os.path.isabs(thumbnail):
+                thumbnail = os.path.expanduser(
+                    os.path.join("~/.local/share/aurynk/screenshots", thumbnail)
+                )
+            _EXECUTOR.submit(self._load_thumbnail_async, thumbnail)
 
         left_box.append(self.screenshot_image)
 
@@ -120,68 +165,156 @@ class DeviceDetailsWindow(Adw.Window):
         right_box.set_hexpand(True)
         right_box.set_valign(Gtk.Align.START)
 
-        # Basic info section
+        # Info sections are built in idle ticks so the first frame renders quickly
+        self._info_spinner = Gtk.Spinner()
+        self._info_spinner.set_size_request(32, 32)
+        self._info_spinner.set_halign(Gtk.Align.CENTER)
+        self._info_spinner.start()
+        right_box.append(self._info_spinner)
+
+        self._right_box = right_box
+        content.append(right_box)
+
+        scrolled.set_child(content)
+        main_box.append(scrolled)
+
+        self.set_content(main_box)
+
+        GLib.idle_add(self._build_info_sections, [self._build_basic_group, self._build_specs_group])
+
+    def _load_thumbnail_async(self, thumbnail):
+        """Decode the stored thumbnail on a worker and hand it to the UI thread."""
+        if not os.path.exists(thumbnail):
+            return
+        try:
+            texture = Gdk.Texture.new_from_filename(self._get_preview_path(thumbnail))
+        except GLib.Error:
+            return
+        GLib.idle_add(self.screenshot_image.set_from_paintable, texture)
+
+    def _get_preview_path(self, screenshot_path):
+        """Prefer the pre-scaled thumbnail over the full-resolution screenshot."""
+        thumb_path = get_thumbnail_path(screenshot_path)
+        if os.path.exists(thumb_path):
+            return thumb_path
+        return screenshot_path
+
+    def _build_info_sections(self, builders):
+        """Build one info section per idle tick."""
+        if self._closed:
+            return False
+        builders.pop(0)()
+        if builders:
+            return True
+        self._right_box.remove(self._info_spinner)
+        self._info_spinner.stop()
+        return False
+
+    def _build_basic_group(self):
+        """Build the basic information section."""
         basic_group = Adw.PreferencesGroup()
         basic_group.set_title(_("Basic Information"))
 
         self.name_row = self._add_info_row(
-            basic_group, _("Device Name"), self.device.get("name", _("Unknown"))
+            basic_group, _("Device Name"), self.device.get("name", self._unknown)
         )
         self.manufacturer_row = self._add_info_row(
-            basic_group, _("Manufacturer"), self.device.get("manufacturer", _("Unknown"))
+            basic_group, _("Manufacturer"), self.device.get("manufacturer", self._unknown)
         )
         self.android_version_row = self._add_info_row(
-            basic_group, _("Android Version"), self.device.get("android_version", _("Unknown"))
+            basic_group,
+            _("Android Version"),
+            self.device.get("android_version", self._unknown),
         )
 
         # Show different field based on device type
         if self.device.get("is_usb"):
             # For USB devices, show the ADB serial or connection type
-            serial = self.device.get("adb_serial") or self.device.get("short_serial", _("Unknown"))
+            serial = self.device.get("adb_serial") or self.device.get("short_serial", self._unknown)
             self.connection_row = self._add_info_row(basic_group, _("USB Serial"), serial)
         else:
             # For wireless devices, show IP address
             self.connection_row = self._add_info_row(
-                basic_group, _("IP Address"), self.device.get("address", _("Unknown"))
+                basic_group, _("IP Address"), self.device.get("address", self._unknown)
             )
 
-        right_box.append(basic_group)
+        self._right_box.insert_child_after(basic_group, None)
 
-        # Specifications section
+    def _build_specs_group(self):
+        """Build the specifications section."""
         specs_group = Adw.PreferencesGroup()
         specs_group.set_title(_("Specifications"))
 
         spec = self.device.get("spec", {})
-        self.ram_row = self._add_info_row(specs_group, _("RAM"), spec.get("ram", _("Loading...")))
+        self.ram_row = self._add_info_row(specs_group, _("RAM"), spec.get("ram", self._loading))
         self.storage_row = self._add_info_row(
-            specs_group, _("Storage"), spec.get("storage", _("Loading..."))
+            specs_group, _("Storage"), spec.get("storage", self._loading)
         )
         self.battery_row = self._add_info_row(
-            specs_group, _("Battery"), spec.get("battery", _("Loading..."))
+            specs_group, _("Battery"), spec.get("battery", self._loading)
         )
 
-        right_box.append(specs_group)
-        content.append(right_box)
-
-        scrolled.set_child(content)
-        main_box.append(scrolled)
-
-        self.set_content(main_box)
+        self._right_box.insert_child_after(specs_group, self._right_box.get_first_child())
 
     def _add_info_row(self, group, label, value):
         """Add an information row to a preferences group."""
-        row = Adw.ActionRow()
+        row = self._row_pool.pop() if self._row_pool else Adw.ActionRow()
         row.set_title(label)
         row.set_subtitle(str(value))
         group.add(row)
+        self._info_rows.append((group, row))
         return row
 
-    def _update_button_states(self):
-        """Enable or disable buttons based on device connection status."""
-        is_connected = self._check_device_connected()
+    def _on_realize(self, window):
+        """Drop shadows and transitions when rendering falls back to software."""
+        global _lite_css_installed
 
-        self.refresh_screenshot_btn.set_sensitive(is_connected)
-        self.refresh_btn.set_sensitive(is_connected)
+        if not _is_software_rendering(self.get_renderer()):
+            return
+        if not _lite_css_installed:
+            css_provider = Gtk.CssProvider()
+            try:
+                css_provider.load_from_data(_LITE_CSS)
+                Gtk.StyleContext.add_provider_for_display(
+                    Gdk.Display.get_default(),
+                    css_provider,
+                    Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION,
+                )
+                _lite_css_installed = True
+            except Exception:
+                # If CSS cannot be loaded for any reason, keep the default styling
+                return
+        self.add_css_class("details-lite")
+
+    def _on_close_request(self, window):
+        """Detach info rows and return them to the pool for the next window."""
+        self._closed = True
+        for group, row in self._info_rows:
+            group.remove(row)
+            if len(self._row_pool) < _ROW_POOL_MAX:
+                self._row_pool.append(row)
+        self._info_rows.clear()
+        return False
+
+    def _update_button_states(self, devices=None):
+        """Enable or disable buttons based on device connection status.
+
+        Args:
+            devices: {serial: state} from adb; the cached listing when omitted.
+        """
+        if self._closed:
+            return False
+        if devices is None:
+            devices = peek_adb_devices()
+        if devices is None:
+            # No fresh listing; ask adb off the main thread and come back
+            _EXECUTOR.submit(self._poll_connection)
+            return False
+        is_connected = devices.get(self._device_id()) == "device"
+
+        # A running job re-enables the buttons once it finishes
+        self.refresh_screenshot_btn.set_sensitive(is_connected and not self._busy)
+        self.refresh_btn.set_sensitive(is_connected and not self._busy)
 
         if not is_connected:
             self.refresh_screenshot_btn.set_tooltip_text(_("Device not connected"))
@@ -189,30 +322,33 @@ class DeviceDetailsWindow(Adw.Window):
         else:
             self.refresh_screenshot_btn.set_tooltip_text(_("Capture screenshot only"))
             self.refresh_btn.set_tooltip_text(_("Refresh device info and screenshot"))
+        return False
 
-    def _check_device_connected(self):
-        """Check if the device is currently connected via ADB."""
-        import subprocess
-
+    def _poll_connection(self):
+        """Worker thread: refresh the adb listing, then update the buttons."""
         try:
-            result = subprocess.run(["adb", "devices"], capture_output=True, text=True, timeout=2)
+            devices = get_adb_devices()
+        except Exception:
+            return
+        GLib.idle_add(self._update_button_states, devices)
 
-            # Get the device identifier to check
-            if self.device.get("is_usb"):
-                device_id = self.device.get("adb_serial", "")
-            else:
-                device_id = f"{self.device.get('address')}:{self.device.get('connect_port')}"
+    def _device_id(self):
+        """Return the adb serial this device is listed under."""
+        if self.device.get("is_usb"):
+            return self.device.get("adb_serial", "")
+        return f"{self.device.get('address')}:{self.device.get('connect_port')}"
 
-            # Check if device is in the list
-            for line in result.stdout.strip().split("\n")[1:]:
-                if "\t" in line:
-                    serial, status = line.split("\t", 1)
-                    if serial.strip() == device_id and status.strip() == "device":
-                        return True
+    def _check_device_connected(self):
+        """Check if the device is currently connected via ADB.
 
-            return False
-        except Exception:
-            return False
+        Only the cached listing is consulted, so this never blocks the main
+        thread; without one the device is assumed connected and the action's
+        own adb call reports the failure.
+        """
+        devices = peek_adb_devices()
+        if devices is None:
+            return True
+        return devices.get(self._device_id()) == "device"
 
     def _fetch_device_data(self):
         """Fetch device specifications in background."""
@@ -225,18 +361,12 @@ class DeviceDetailsWindow(Adw.Window):
 
                 # If no adb_serial, try to find it
                 if not adb_serial:
-                    import subprocess
-
                     try:
-                        result = subprocess.run(
-                            ["adb", "devices"], capture_output=True, text=True, timeout=5
-                        )
-                        adb_devices = []
-                        for line in result.stdout.strip().split("\n")[1:]:
-                            if "\t" in line:
-                                s, st = line.split("\t", 1)
-                                if ":" not in s and st.strip() == "device":
-                                    adb_devices.append(s)
+                        adb_devices = [
+                            s
+                            for s, st in get_adb_devices().items()
+                            if ":" not in s and st == "device"
+                        ]
 
                         # Try to match with short_serial or use first device
                         short_serial = self.device.get("short_serial")
@@ -258,8 +388,6 @@ class DeviceDetailsWindow(Adw.Window):
                     if not self.device.get("android_version") or not self.device.get(
                         "manufacturer"
                     ):
-                        import subprocess
-
                         try:
                             props_to_fetch = [
                                 ("ro.product.model", "model"),
@@ -267,19 +395,15 @@ class DeviceDetailsWindow(Adw.Window):
                                 ("ro.build.version.release", "android_version"),
                             ]
 
-                            for prop, key in props_to_fetch:
-                                try:
-                                    result = subprocess.run(
-                                        ["adb", "-s", adb_serial, "shell", "getprop", prop],
-                                        capture_output=True,
-                                        text=True,
-                                        timeout=5,
-                                    )
-                                    value = result.stdout.strip()
-                                    if value:
-                                        self.device[key] = value
-                                except Exception:
-                                    pass
+                            values = self.adb_controller.run_shell_batch(
+                                adb_serial,
+                                [f"getprop {prop}" for prop, _key in props_to_fetch],
+                                timeout=5,
+                            )
+                            for (_prop, key), value in zip(props_to_fetch, values):
+                                value = value.strip()
+                                if value:
+                                    self.device[key] = value
 
                             # Update name to use the actual model if available
                             if self.device.get("model") and not self.device.get("name"):
@@ -287,58 +411,93 @@ class DeviceDetailsWindow(Adw.Window):
                         except Exception:
                             pass
                 else:
-                    specs = {"ram": _("Unknown"), "storage": _("Unknown"), "battery": _("Unknown")}
+                    specs = {
+                        "ram": self._unknown,
+                        "storage": self._unknown,
+                        "battery": self._unknown,
+                    }
             else:
                 # Wireless device - use address:port
                 # Be defensive: ensure address/connect_port exist
                 addr = self.device.get("address")
                 port = self.device.get("connect_port")
                 if not addr or not port:
-                    specs = {"ram": _("Unknown"), "storage": _("Unknown"), "battery": _("Unknown")}
+                    specs = {
+                        "ram": self._unknown,
+                        "storage": self._unknown,
+                        "battery": self._unknown,
+                    }
                 else:
                     specs = self.adb_controller.fetch_device_specs(addr, port)
 
-            # Update device info
-            self.device["spec"] = specs
-            if not self.device.get("is_usb"):
-                self.adb_controller.save_paired_device(self.device)
+            # Update device info, saving only when something changed
+            if specs != self.device.get("spec"):
+                self.device["spec"] = specs
+                if not self.device.get("is_usb"):
+                    self.adb_controller.save_paired_device(self.device)
 
             # Update UI on main thread
-            from gi.repository import GLib
-
             GLib.idle_add(self._update_all_device_info, specs)
 
-        threading.Thread(target=fetch, daemon=True).start()
+        self._submit(fetch)
+
+    def _submit(self, job):
+        """Run a background job on the shared pool, one at a time per window.
+
+        The refresh buttons stay insensitive until the job finishes, so clicks
+        are never silently dropped while one runs.
+        """
+        if self._busy:
+            return
+        self._busy = True
+        self.refresh_screenshot_btn.set_sensitive(False)
+        self.refresh_btn.set_sensitive(False)
+
+        def run():
+            try:
+                job()
+            finally:
+                self._busy = False
+                GLib.idle_add(self._update_button_states)
+
+        _EXECUTOR.submit(run)
 
     def _update_all_device_info(self, specs):
         """Update all device information in the UI."""
+        if self._closed:
+            return
         # Update specs
         self._update_specs_ui(specs)
 
-        # Update basic info if it was fetched
-        if hasattr(self, "name_row"):
-            self.name_row.set_subtitle(self.device.get("name", _("Unknown")))
-        if hasattr(self, "manufacturer_row"):
-            self.manufacturer_row.set_subtitle(self.device.get("manufacturer", _("Unknown")))
-        if hasattr(self, "android_version_row"):
-            self.android_version_row.set_subtitle(self.device.get("android_version", _("Unknown")))
+        # Update basic info if its section has been built
+        if self.name_row:
+            self.name_row.set_subtitle(self.device.get("name", self._unknown))
+        if self.manufacturer_row:
+            self.manufacturer_row.set_subtitle(self.device.get("manufacturer", self._unknown))
+        if self.android_version_row:
+            self.android_version_row.set_subtitle(self.device.get("android_version", self._unknown))
 
     def _update_specs_ui(self, specs):
         """Update specifications UI."""
+        # The specs section picks up device["spec"] itself if not built yet
+        if self._closed or self.ram_row is None:
+            return
         # Use fallback 'Unknown' when values are empty or falsy
-        self.ram_row.set_subtitle(specs.get("ram") or _("Unknown"))
-        self.storage_row.set_subtitle(specs.get("storage") or _("Unknown"))
-        self.battery_row.set_subtitle(specs.get("battery") or _("Unknown"))
+        self.ram_row.set_subtitle(specs.get("ram") or self._unknown)
+        self.storage_row.set_subtitle(specs.get("storage") or self._unknown)
+        self.battery_row.set_subtitle(specs.get("battery") or self._unknown)
 
     def _on_refresh_screenshot(self, button):
         """Handle refresh screenshot button click."""
+        # Ignore clicks while a previous job is still running
+        if self._busy:
+            return
+
         # Check if device is connected
         if not self._check_device_connected():
             self._update_button_states()
             return
 
-        button.set_sensitive(False)
-
         def capture():
             # Check if this is a USB device or wireless device
             if self.device.get("is_usb"):
@@ -354,102 +513,110 @@ class DeviceDetailsWindow(Adw.Window):
                     self.device["address"], self.device["connect_port"]
                 )
 
-            if screenshot_path:
+            # Screenshots overwrite the same file, so only a new path needs saving
+            if screenshot_path and screenshot_path != self.device.get("thumbnail"):
                 self.device["thumbnail"] = screenshot_path
                 if not self.device.get("is_usb"):
                     self.adb_controller.save_paired_device(self.device)
 
+            # Resolve the preview here, keeping its stat off the main thread
+            preview_path = self._get_preview_path(screenshot_path) if screenshot_path else None
             # Update UI on main thread
-            from gi.repository import GLib
-
-            GLib.idle_add(self._update_screenshot_ui, screenshot_path, button)
+            GLib.idle_add(self._update_screenshot_ui, preview_path)
 
-        threading.Thread(target=capture, daemon=True).start()
+        self._submit(capture)
 
-    def _update_screenshot_ui(self, screenshot_path, button):
+    def _update_screenshot_ui(self, preview_path):
         """Update screenshot UI."""
-        if screenshot_path:
-            self.screenshot_image.set_from_file(screenshot_path)
-        # Re-check connection state and update button states
-        self._update_button_states()
+        if self._closed:
+            return
+        if preview_path:
+            self.screenshot_image.set_from_file(preview_path)
 
     def _on_refresh_all(self, button):
         """Handle refresh all data button click."""
+        # Ignore clicks while a previous job is still running
+        if self._busy:
+            return
+
         # Check if device is connected
         if not self._check_device_connected():
             self._update_button_states()
             return
 
-        button.set_sensitive(False)
-
         def refresh():
             # Check if this is a USB device or wireless device
             if self.device.get("is_usb"):
                 # USB device - use adb_serial
                 adb_serial = self.device.get("adb_serial")
                 if adb_serial:
+                    # The screenshot and the specs query are independent adb round-trips
+                    capture = _CAPTURE_EXECUTOR.submit(
+                        self.adb_controller.capture_screenshot_by_serial, adb_serial
+                    )
                     specs = self.adb_controller.fetch_device_specs_by_serial(adb_serial)
-                    screenshot_path = self.adb_controller.capture_screenshot_by_serial(adb_serial)
+                    screenshot_path = capture.result()
                 else:
-                    specs = {"ram": _("Unknown"), "storage": _("Unknown"), "battery": _("Unknown")}
+                    specs = {
+                        "ram": self._unknown,
+                        "storage": self._unknown,
+                        "battery": self._unknown,
+                    }
                     screenshot_path = None
             else:
                 # Wireless device - use address:port
-                specs = self.adb_controller.fetch_device_specs(
-                    self.device["address"], self.device["connect_port"]
-                )
-                screenshot_path = self.adb_controller.capture_screenshot(
-                    self.device["address"], self.device["connect_port"]
+                address, connect_port = self.device["address"], self.device["connect_port"]
+                capture = _CAPTURE_EXECUTOR.submit(
+                    self.adb_controller.capture_screenshot, address, connect_port
                 )
-
-            self.device["spec"] = specs
-            if screenshot_path:
+                specs = self.adb_controller.fetch_device_specs(address, connect_port)
+                screenshot_path = capture.result()
+
+            # Apply specs and screenshot, then write the store at most once
+            dirty = False
+            if specs != self.device.get("spec"):
+                self.device["spec"] = specs
+                dirty = True
+            if screenshot_path and screenshot_path != self.device.get("thumbnail"):
                 self.device["thumbnail"] = screenshot_path
+                dirty = True
 
             # Save (only for wireless devices)
-            if not self.device.get("is_usb"):
+            if dirty and not self.device.get("is_usb"):
                 self.adb_controller.save_paired_device(self.device)
 
+            # Resolve the preview here, keeping its stat off the main thread
+            preview_path = self._get_preview_path(screenshot_path) if screenshot_path else None
             # Update UI
-            from gi.repository import GLib
-
-            GLib.idle_add(self._update_all_ui, specs, screenshot_path, button)
+            GLib.idle_add(self._update_all_ui, specs, preview_path)
 
-        threading.Thread(target=refresh, daemon=True).start()
+        self._submit(refresh)
 
-    def _update_all_ui(self, specs, screenshot_path, button):
+    def _update_all_ui(self, specs, preview_path):
         """Update all UI elements."""
+        if self._closed:
+            return
         self._update_specs_ui(specs)
-        if screenshot_path:
-            self.screenshot_image.set_from_file(screenshot_path)
-        # Re-check connection state and update button states
-        self._update_button_states()
+        if preview_path:
+            self.screenshot_image.set_from_file(preview_path)
 
     def _on_remove_device(self, button):
         """Handle remove device button click."""
-        # Show confirmation dialog with improved layout
-        dialog = Adw.MessageDialog.new(self)
-        dialog.set_heading(_("Remove Device"))
-        # Use line break and wrapping for the body label
+        # Show confirmation dialog; the body label wraps on its own
         body_text = _("Are you sure you want to remove \n {device} ?").format(
             device=self.device.get("name", _("this device"))
         )
-        dialog.set_body(body_text)
-        # Set minimum width for dialog
-        dialog.set_default_size(340, 120)
-        # Enable label wrapping (Adw.MessageDialog uses a GtkLabel internally)
-        body_label = dialog.get_body_label() if hasattr(dialog, "get_body_label") else None
-        if body_label:
-            body_label.set_line_wrap(True)
-            body_label.set_max_width_chars(40)
+        dialog = Adw.AlertDialog.new(_("Remove Device"), body_text)
         dialog.add_response("cancel", _("Cancel"))
         dialog.add_response("remove", _("Remove"))
         dialog.set_response_appearance("remove", Adw.ResponseAppearance.DESTRUCTIVE)
-        dialog.connect("response", self._on_remove_confirmed)
-        dialog.present()
+        dialog.set_default_response("cancel")
+        dialog.set_close_response("cancel")
+        dialog.choose(self, None, self._on_remove_confirmed)
 
-    def _on_remove_confirmed(self, dialog, response):
+    def _on_remove_confirmed(self, dialog, result):
         """Handle remove confirmation."""
+        response = dialog.choose_finish(result)
         if response == "remove":
             self.adb_controller.remove_device(self.device["address"])
             # DeviceStore now centrally notifies the tray helper after saving,
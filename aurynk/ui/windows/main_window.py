@@ -1,5 +1,15 @@
+import functools
 import os
+import queue
+import re
+import socket
+import subprocess
 import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
 
 import gi
 
@@ -11,34 +21,188 @@ from gi.repository import Adw, Gdk, Gio, GLib, Gtk
 
 from aurynk.core.adb_manager import ADBController
 from aurynk.core.scrcpy_runner import ScrcpyManager
-from aurynk.models.device import Device
+from aurynk.models.device import Device, forget_props
 from aurynk.services.usb_monitor import USBMonitor
+from aurynk.ui.dialogs.pairing_dialog import PairingDialog
 from aurynk.ui.windows.about_window import AboutWindow
+from aurynk.ui.windows.device_details import DeviceDetailsWindow
 from aurynk.ui.windows.settings_window import SettingsWindow
 from aurynk.ui.windows.shortcuts_window import show_shortcuts_window
-from aurynk.utils.adb_utils import is_device_connected
+from aurynk.utils.adb_utils import (
+    get_adb_devices,
+    get_adb_path,
+    invalidate_adb_cache,
+    peek_adb_devices,
+    store_adb_devices,
+)
 from aurynk.utils.device_events import (
     register_device_change_callback,
     unregister_device_change_callback,
 )
 from aurynk.utils.logger import get_logger
+from aurynk.utils.notify import show_notification_with_action
+from aurynk.utils.settings import get_settings_manager
 
 logger = get_logger("MainWindow")
 
+# Seconds a parsed `adb devices` listing is reused across bursts of USB events
+_ADB_DEVICES_TTL = 0.5
+
+# Seconds the same listing may serve the mirror button's serial lookup
+_MIRROR_ADB_DEVICES_TTL = 2.0
+
+# `adb connect` output meaning the adb server itself is down
+_ADB_DAEMON_ERRORS = ("daemon not running", "cannot connect to daemon", "failed to start daemon")
+
+# adb connect error keywords; the group number is the rule's priority (1 is highest).
+# Whole words only, so e.g. "unabridged" does not count as "unable".
+_CONN_ERROR_RE = re.compile(
+    r"\b(?:(refused|cannot connect)|(timed out|timeout)|(no route|unreachable)|(unable))\b",
+    re.IGNORECASE,
+)
+
+# Seconds between background polls of wireless connection states
+_CONN_POLL_INTERVAL = 2
+
+# Seconds ADB-fetched details of a USB device are reused across reconnects
+_DETAILS_TTL = 60.0
+
+# Devices whose fetched details are remembered; the least recently fetched go first
+_DETAILS_MAX = 32
+
+# Row fields filled in by Device.fetch_details()
+_DETAIL_FIELDS = ("manufacturer", "model", "android_version", "name")
+
+# ASCII bytes dropped when normalizing serials into usb_rows keys
+_SERIAL_DROP = bytes(b for b in range(128) if not chr(b).isdigit() and not "a" <= chr(b) <= "z")
+
+# GResource path of the main window template
+_UI_RESOURCE = "/io/github/IshuSinghSE/aurynk/ui/main_window.ui"
+
+# Fallback row icon for devices without a screenshot
+_DEVICE_ICON_RESOURCE = (
+    "/io/github/IshuSinghSE/aurynk/icons/io.github.IshuSinghSE.aurynk.device.png"
+)
+
+# Relative thumbnails are stored under this directory
+_SCREENSHOT_DIR = os.path.expanduser("~/.local/share/aurynk/screenshots")
+
+# Maximum number of queued UI callbacks run per drain tick
+_UI_DRAIN_BATCH = 32
+
+# Queued UI callbacks are drained at most once per frame, ahead of GTK redraws
+_UI_DRAIN_INTERVAL_MS = 16
+_UI_DRAIN_PRIORITY = GLib.PRIORITY_HIGH_IDLE - 10
+
+# Window of time over which tray status updates are coalesced
+_TRAY_DEBOUNCE_MS = 50
+# Successive delays between checks that a stopped mirror's process is gone
+# before syncing the tray; the last one syncs regardless
+_STOP_PROBE_DELAYS_MS = (30, 80, 200, 500)
+
+# Control socket of the tray helper process
+_TRAY_SOCKET = "/tmp/aurynk_tray.sock"
+
+# Whether the app stylesheet has been added to the default display
+_CSS_LOADED = False
+
+
+@functools.lru_cache(maxsize=512)
+def _norm_serial(s):
+    """Normalize a serial for consistent usb_rows keys."""
+    if not s:
+        return None
+    # Non-ASCII is dropped by the encode, everything else outside [0-9a-z] here
+    return s.lower().encode("ascii", "ignore").translate(None, _SERIAL_DROP).decode("ascii")
+
+
+def _device_details_text(device):
+    """Return the "manufacturer • model • Android N" line for a device, or ""."""
+    version = device.get("android_version")
+    return " • ".join(
+        p
+        for p in (
+            device.get("manufacturer"),
+            device.get("model"),
+            f"Android {version}" if version else None,
+        )
+        if p
+    )
+
+
+def _update_device_row_labels(row_widget, device_data):
+    """Update the labels in a device row widget to reflect updated device data.
+    This is used when tray canonicalization merges new data into an existing
+    row widget, ensuring the UI displays the latest information.
+    """
+    try:
+        # Find the info_box containing the labels (second child after icon)
+        child = row_widget.get_first_child()
+        if child:
+            child = child.get_next_sibling()  # Skip icon, get info_box
+
+        if not child or not isinstance(child, Gtk.Box):
+            return
+
+        # Update name label (first child of info_box)
+        name_label = child.get_first_child()
+        if name_label and isinstance(name_label, Gtk.Label):
+            dev_name = device_data.get("name", _("Unknown Device"))
+            # Strip the "* " prefix if present (helper adds it for USB devices)
+            if dev_name.startswith("* "):
+                dev_name = dev_name[2:]
+            name_label.set_label(dev_name)
+
+        # Update details label (second child of info_box)
+        details_label = name_label.get_next_sibling() if name_label else None
+        if details_label and isinstance(details_label, Gtk.Label):
+            details = _device_details_text(device_data)
+            if details:
+                details_label.set_label(details)
+                details_label.set_visible(True)
+            else:
+                details_label.set_visible(False)
+    except Exception as e:
+        logger.debug(f"Failed to update device row labels: {e}")
+
+
+@dataclass(slots=True)
+class UsbRowEntry:
+    """A USB device row tracked by the main window, with its hot identifiers."""
+
+    row: Gtk.Widget
+    data: dict
+    device_obj: Device | None = None
+    adb_serial: str | None = None
+    short_serial: str | None = None
+    norm_serial: str | None = None
+
 
 class AurynkWindow(Adw.ApplicationWindow):
     """Main application window."""
 
     __gtype_name__ = "AurynkWindow"
 
+    # Template XML read from the GResource once, on first window creation
+    _ui_xml = None
+    # Decoded fallback device icon, shared by every row
+    _fallback_icon = None
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Worker -> UI handoffs go through one queue drained by a single frame-rate source
+        self._ui_queue = queue.SimpleQueue()
+        self._ui_drain_source = None
+        self._ui_drain_lock = threading.Lock()
+        # Tray sync callable resolved once; bursts of updates are debounced
+        self._notify_tray = getattr(self.get_application(), "send_status_to_tray", None)
+        self._tray_update_source = None
         # Initialize ADB controller
         self.adb_controller = ADBController()
+        # Created on first use by _get_scrcpy_manager()
+        self._scrcpy_manager: ScrcpyManager | None = None
 
         # Initialize USB monitor even inside Flatpak now that --device=all is granted.
-        import os
-
         self._is_flatpak = os.path.exists("/.flatpak-info")
 
         self.usb_monitor = None
@@ -49,7 +213,7 @@ class AurynkWindow(Adw.ApplicationWindow):
             monitor.start()
             for existing in monitor.get_connected_devices():
                 try:
-                    GLib.idle_add(self._add_usb_device_row, existing)
+                    self._post_to_ui(self._add_usb_device_row, existing)
                 except Exception:
                     logger.debug("Failed to seed USB device row", exc_info=True)
             self.usb_monitor = monitor
@@ -62,18 +226,33 @@ class AurynkWindow(Adw.ApplicationWindow):
         self.usb_rows = {}
         # Track device path to key mapping for reliable disconnect detection
         self.usb_device_paths = {}
+        # Row keys awaiting removal; interfaces of one device collapse to one entry
+        self._pending_removals = set()
+        # ID_SERIALs with an adb lookup in flight. Devices present at startup are
+        # submitted both by the monitor seeding and by _refresh_usb_list(), so
+        # this keeps them to a single lookup
+        self._pending_additions = set()
+        # Inverted indexes over usb_rows identifiers -> key, for O(1) dedup
+        self._by_adb_serial = {}
+        self._by_short_serial = {}
+        self._by_norm_serial = {}
+        # key -> (monotonic time, details) of the last ADB fetch, kept across reconnects
+        self._fetched_at = OrderedDict()
+        # thumbnail value -> absolute path, for screenshots known to exist
+        self._screenshot_paths = {}
+        # Small pool for adb lookups triggered by USB hotplug bursts
+        self._adb_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="aurynk-usb")
+        # Cancels async adb calls still running on the main loop when the window closes
+        self._adb_cancellable = Gio.Cancellable()
+        # (address, connect_port) -> connected, polled off the main thread
+        self._conn_state = {}
+        self._conn_probe_pending = False
+        # Polling runs only while the window is mapped, not while hidden in the tray
+        self._conn_poll_source = None
+        self.connect("map", self._on_map_start_conn_poll)
+        self.connect("unmap", self._on_unmap_stop_conn_poll)
 
         # Helper: normalize serials for consistent keys
-        def _norm_serial(s):
-            import re
-
-            if not s:
-                return None
-            try:
-                return re.sub(r"[^0-9a-z]", "", str(s).lower())
-            except Exception:
-                return str(s).lower()
-
         self._norm_serial = _norm_serial
         # If the tray helper already reported devices before the window was
         # constructed, cache that list and apply it once the UI is ready.
@@ -97,42 +276,9 @@ class AurynkWindow(Adw.ApplicationWindow):
             # best-effort
             self._initial_cached_devices = None
 
-        # If we have cached usb_rows data create corresponding UI rows now
-        try:
-            if self.usb_rows:
-                for usn, entry in list(self.usb_rows.items()):
-                    try:
-                        if isinstance(entry, dict) and "data" in entry and "row" not in entry:
-                            dev_data = entry["data"]
-                            # Create a UI row from data (do not call adb here)
-                            row = self._create_device_row(dev_data, is_usb=True)
-                            self.usb_group.add(row)
-                            entry["row"] = row
-                            self.usb_group.set_visible(True)
-                    except Exception:
-                        logger.debug("Failed creating UI row for cached USB device %s", usn)
-        except Exception:
-            pass
-        # If we have cached usb_rows data create corresponding UI rows now
-        try:
-            if self.usb_rows:
-                for usn, entry in list(self.usb_rows.items()):
-                    try:
-                        if isinstance(entry, dict) and "data" in entry and "row" not in entry:
-                            dev_data = entry["data"]
-                            # Create a UI row from data (do not call adb here)
-                            row = self._create_device_row(dev_data, is_usb=True)
-                            self.usb_group.add(row)
-                            entry["row"] = row
-                            self.usb_group.set_visible(True)
-                    except Exception:
-                        logger.debug("Failed creating UI row for cached USB device %s", usn)
-        except Exception:
-            logger.debug("Error applying cached USB devices at window init", exc_info=True)
-
         # Register for device change events
         def safe_refresh():
-            GLib.idle_add(self._refresh_device_list)
+            self._post_to_ui(self._refresh_device_list)
 
         self._device_change_callback = safe_refresh
         register_device_change_callback(self._device_change_callback)
@@ -161,19 +307,71 @@ class AurynkWindow(Adw.ApplicationWindow):
         except Exception:
             pass
 
+    def _post_to_ui(self, fn, *args):
+        """Queue fn(*args) to run on the GTK main thread; safe from any thread."""
+        self._ui_queue.put((fn, args))
+        with self._ui_drain_lock:
+            if self._ui_drain_source is None:
+                self._ui_drain_source = GLib.timeout_add(
+                    _UI_DRAIN_INTERVAL_MS, self._drain_ui_queue, priority=_UI_DRAIN_PRIORITY
+                )
+
+    def _drain_ui_queue(self):
+        """Run a batch of queued UI callbacks; keep the source alive while work remains."""
+        for _i in range(_UI_DRAIN_BATCH):
+            try:
+                fn, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception:
+                logger.exception("Queued UI callback failed")
+        with self._ui_drain_lock:
+            if not self._ui_queue.empty():
+                return True
+            self._ui_drain_source = None
+            return False
+
+    def _schedule_tray_update(self, delay_ms=_TRAY_DEBOUNCE_MS):
+        """Send the tray status once per burst of device changes."""
+        if self._notify_tray and self._tray_update_source is None:
+            self._tray_update_source = GLib.timeout_add(delay_ms, self._flush_tray_update)
+
+    def _probe_mirror_stopped(self, is_stopped, step=0):
+        """Sync the tray once is_stopped() holds, checking on a widening schedule.
+
+        A process that exits quickly is reported after the first short delay,
+        while a slow one is not polled more often than needed.
+        """
+
+        def _check():
+            if is_stopped() or step + 1 == len(_STOP_PROBE_DELAYS_MS):
+                self._schedule_tray_update()
+            else:
+                self._probe_mirror_stopped(is_stopped, step + 1)
+            return False
+
+        GLib.timeout_add(_STOP_PROBE_DELAYS_MS[step], _check)
+
+    def _flush_tray_update(self):
+        self._tray_update_source = None
+        self._notify_tray()
+        return False
+
     def _apply_initial_cached_devices(self):
         """Create UI rows for devices received from the helper before
         the window was constructed.
         Returns False so the idle source is removed after running once.
         """
-        try:
-            if not self._initial_cached_devices:
-                return False
-            # Ensure usb_group exists
-            if not hasattr(self, "usb_group") or self.usb_group is None:
-                return False
+        devices, self._initial_cached_devices = self._initial_cached_devices, None
+        # Ensure usb_group exists
+        if not devices or getattr(self, "usb_group", None) is None:
+            return False
 
-            for dev in self._initial_cached_devices:
+        try:
+            active = self._get_scrcpy_manager().snapshot_active()
+            for dev in devices:
                 serial = dev.get("serial") or dev.get("adb_serial") or dev.get("address")
                 if not serial:
                     continue
@@ -194,19 +392,21 @@ class AurynkWindow(Adw.ApplicationWindow):
                     "model": adb_props.get("model"),
                     "manufacturer": adb_props.get("manufacturer"),
                 }
-                try:
-                    row = self._create_device_row(dev_data, is_usb=True)
-                    self.usb_group.add(row)
-                    self.usb_rows[key] = {"row": row, "data": dev_data}
-                    self.usb_group.set_visible(True)
-                except Exception:
-                    logger.debug("Failed creating UI row for cached USB device %s", serial)
+                row = self._create_device_row(dev_data, is_usb=True, active=active)
+                self.usb_group.add(row)
+                entry = UsbRowEntry(
+                    row=row,
+                    data=dev_data,
+                    adb_serial=dev_data["adb_serial"],
+                    norm_serial=key,
+                )
+                self.usb_rows[key] = entry
+                self._index_usb_entry(key, entry)
+                row._key = key
+                self.usb_group.set_visible(True)
         except Exception:
-            logger.exception("Error applying cached devices")
-        finally:
-            # Clear cache after applying
-            self._initial_cached_devices = None
-            return False
+            logger.debug("Error applying cached devices", exc_info=True)
+        return False
 
     def _setup_actions(self):
         """Setup window actions."""
@@ -307,12 +507,6 @@ class AurynkWindow(Adw.ApplicationWindow):
 
         def capture():
             try:
-                import os
-                import subprocess
-                from datetime import datetime
-
-                from aurynk.utils.adb_utils import get_adb_path
-
                 logger.info(f"Starting screenshot capture for device: {serial}")
 
                 # Create screenshots directory
@@ -365,11 +559,6 @@ class AurynkWindow(Adw.ApplicationWindow):
     def _show_screenshot_notification(self, filepath):
         """Show a GNOME notification for the screenshot."""
         try:
-            import os
-            import subprocess
-
-            from aurynk.utils.notify import show_notification_with_action
-
             folder_path = os.path.dirname(filepath)
             opened = [False]  # Use list to allow modification in nested function
 
@@ -423,15 +612,15 @@ class AurynkWindow(Adw.ApplicationWindow):
     def do_close(self):
         if hasattr(self, "usb_monitor") and self.usb_monitor:
             self.usb_monitor.stop()
+        self._on_unmap_stop_conn_poll(self)
+        self._adb_pool.shutdown(wait=False)
+        self._adb_cancellable.cancel()
         unregister_device_change_callback(self._device_change_callback)
         super().do_close()
 
     def _on_close_request(self, window):
         """Handle close request - hide window to tray if 'close_to_tray' is enabled, else quit."""
-        from aurynk.utils.settings import SettingsManager
-
-        settings = SettingsManager()
-        close_to_tray = settings.get("app", "close_to_tray", True)
+        close_to_tray = get_settings_manager().get("app", "close_to_tray", True)
         if close_to_tray:
             logger.info(
                 "Close requested - hiding window instead of closing app (Close to Tray enabled)"
@@ -443,12 +632,9 @@ class AurynkWindow(Adw.ApplicationWindow):
             # Remove tray icon if present, and terminate tray helper process if running
             app = self.get_application()
             # Attempt to terminate tray helper by sending 'quit' command to its socket
-            import socket
-
-            tray_socket = "/tmp/aurynk_tray.sock"
             try:
                 with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
-                    s.connect(tray_socket)
+                    s.connect(_TRAY_SOCKET)
                     s.sendall(b"quit")
                     logger.info("Sent 'quit' command to tray helper via socket.")
             except Exception as e:
@@ -458,14 +644,17 @@ class AurynkWindow(Adw.ApplicationWindow):
             return False  # Allow default close (app will quit)
 
     def show_pairing_dialog(self):
-        from aurynk.ui.dialogs.pairing_dialog import PairingDialog
-
         dialog = PairingDialog(self)
         dialog.present()
 
     def _setup_ui_from_template(self):
         """Load UI from XML template (GResource)."""
-        builder = Gtk.Builder.new_from_resource("/io/github/IshuSinghSE/aurynk/ui/main_window.ui")
+        # The resource bundle is registered after this module is imported, so
+        # the lookup happens lazily and is shared by later windows.
+        if AurynkWindow._ui_xml is None:
+            data = Gio.resources_lookup_data(_UI_RESOURCE, Gio.ResourceLookupFlags.NONE)
+            AurynkWindow._ui_xml = data.get_data().decode("utf-8")
+        builder = Gtk.Builder.new_from_string(AurynkWindow._ui_xml, -1)
         main_content = builder.get_object("main_content")
         if main_content:
             self.set_content(main_content)
@@ -503,13 +692,18 @@ class AurynkWindow(Adw.ApplicationWindow):
             raise Exception("Could not find main_content in UI template")
 
     def _load_custom_css(self):
+        global _CSS_LOADED
+        display = Gdk.Display.get_default()
+        if _CSS_LOADED or display is None:
+            return
         css_provider = Gtk.CssProvider()
         css_path = "/io/github/IshuSinghSE/aurynk/styles/aurynk.css"
         try:
             css_provider.load_from_resource(css_path)
             Gtk.StyleContext.add_provider_for_display(
-                Gdk.Display.get_default(), css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+                display, css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
             )
+            _CSS_LOADED = True
         except Exception as e:
             logger.warning(f"Could not load CSS from {css_path}: {e}")
 
@@ -617,7 +811,7 @@ class AurynkWindow(Adw.ApplicationWindow):
 
         self.wireless_group = Adw.PreferencesGroup(title=_("Wireless Devices"))
         self.device_list_box.append(self.wireless_group)
-        self._wireless_rows = []
+        self._wireless_rows = {}
 
     def _refresh_device_list(self):
         """Refresh the device list from storage and sync tray."""
@@ -636,19 +830,16 @@ class AurynkWindow(Adw.ApplicationWindow):
             if not app.device_monitor._running:
                 app.device_monitor.start()
 
-        # Clear existing wireless rows
-        self._wireless_rows = getattr(self, "_wireless_rows", [])
-        for row in self._wireless_rows:
-            self.wireless_group.remove(row)
-        self._wireless_rows = []
+        self._sync_wireless_rows(devices)
+        # Pick up connection changes (e.g. after Connect) without waiting a poll
+        self._schedule_conn_probe()
 
-        # Add device rows
+        empty_state = getattr(self, "_wireless_empty_state", None)
         if devices:
-            for device in devices:
-                device_row = self._create_device_row(device)
-                self.wireless_group.add(device_row)
-                self._wireless_rows.append(device_row)
-        else:
+            if empty_state is not None:
+                self.wireless_group.remove(empty_state)
+                self._wireless_empty_state = None
+        elif empty_state is None:
             # Show empty state with image and text
             empty_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=16)
             empty_box.set_valign(Gtk.Align.CENTER)
@@ -686,17 +877,7 @@ class AurynkWindow(Adw.ApplicationWindow):
             )
             empty_image.add_controller(gesture)
 
-            # Load CSS for scaling effect from external file if not already loaded
-            css_provider = Gtk.CssProvider()
-            css_path = "/io/github/IshuSinghSE/aurynk/styles/aurynk.css"
-            try:
-                css_provider.load_from_resource(css_path)
-                Gtk.StyleContext.add_provider_for_display(
-                    Gdk.Display.get_default(), css_provider, Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-                )
-            except Exception as e:
-                logger.warning(f"Could not load CSS from {css_path}: {e}")
-
+            # Scaling styles come from the provider installed by _load_custom_css
             empty_box.append(empty_image)
 
             empty_label = Gtk.Label()
@@ -709,12 +890,113 @@ class AurynkWindow(Adw.ApplicationWindow):
             empty_box.append(empty_label)
 
             self.wireless_group.add(empty_box)
-            self._wireless_rows.append(empty_box)
+            self._wireless_empty_state = empty_box
 
         # Always sync tray after device list changes
-        app = self.get_application()
-        if hasattr(app, "send_status_to_tray"):
-            app.send_status_to_tray()
+        self._schedule_tray_update()
+
+    def _sync_wireless_rows(self, devices):
+        """Diff wireless rows against devices by address, touching only changes."""
+        old_rows = getattr(self, "_wireless_rows", {})
+        old_order = list(old_rows)
+        new_rows = {}
+        active = None
+        for device in devices:
+            address = device.get("address")
+            row = old_rows.pop(address, None)
+            if row is not None and not self._update_wireless_row(row, device):
+                self.wireless_group.remove(row)
+                row = None
+            if row is None:
+                if active is None:
+                    active = self._get_scrcpy_manager().snapshot_active()
+                row = self._create_device_row(device, active=active)
+            new_rows[address] = row
+        for row in old_rows.values():
+            self.wireless_group.remove(row)
+
+        # Re-append rows from the first position whose order changed so the
+        # group keeps the store's ordering; unchanged leading rows stay put.
+        kept = [a for a in old_order if a in new_rows and new_rows[a].get_parent()]
+        order = list(new_rows)
+        start = 0
+        while start < len(kept) and kept[start] == order[start]:
+            start += 1
+        for address in order[start:]:
+            row = new_rows[address]
+            if row.get_parent() is not None:
+                self.wireless_group.remove(row)
+            self.wireless_group.add(row)
+        self._wireless_rows = new_rows
+
+    def _on_map_start_conn_poll(self, widget):
+        """Probe connection states now, then poll them while the window is shown."""
+        if self._conn_poll_source is None:
+            self._schedule_conn_probe()
+            self._conn_poll_source = GLib.timeout_add_seconds(
+                _CONN_POLL_INTERVAL, self._schedule_conn_probe
+            )
+
+    def _on_unmap_stop_conn_poll(self, widget):
+        if self._conn_poll_source is not None:
+            GLib.source_remove(self._conn_poll_source)
+            self._conn_poll_source = None
+
+    def _schedule_conn_probe(self):
+        """Start a background poll of wireless connection states unless one is running."""
+        if not self._conn_probe_pending:
+            pairs = [
+                (d.get("address"), d.get("connect_port"))
+                for d in (row._device_data for row in getattr(self, "_wireless_rows", {}).values())
+                if d.get("address") and d.get("connect_port")
+            ]
+            if pairs:
+                self._conn_probe_pending = True
+                self._adb_pool.submit(self._probe_connections_bg, pairs)
+        return True
+
+    def _probe_connections_bg(self, pairs):
+        """Worker thread: read `adb devices` once and map each pair to its state."""
+        state = None
+        try:
+            devices = get_adb_devices(_ADB_DEVICES_TTL)
+            state = {(a, p): devices.get(f"{a}:{p}") == "device" for a, p in pairs}
+        except Exception as e:
+            logger.debug(f"Could not poll wireless connection states: {e}")
+        self._post_to_ui(self._apply_conn_state, state)
+
+    def _apply_conn_state(self, state):
+        """Store polled connection states and refresh rows whose state flipped."""
+        self._conn_probe_pending = False
+        if not state:
+            return
+        changed = any(self._conn_state.get(pair, False) != up for pair, up in state.items())
+        self._conn_state.update(state)
+        if changed:
+            rows = getattr(self, "_wireless_rows", {})
+            self._sync_wireless_rows([row._device_data for row in rows.values()])
+            self._update_all_mirror_buttons()
+
+    def _update_wireless_row(self, row, device):
+        """Relabel a wireless row in place; return False if it must be rebuilt."""
+        old = row._device_data
+        # Icon and button bindings are fixed at creation time
+        for field in ("connect_port", "thumbnail"):
+            if old.get(field) != device.get(field):
+                return False
+        # The details label only exists when some detail was known
+        detail_fields = ("manufacturer", "model", "android_version")
+        if any(map(old.get, detail_fields)) != any(map(device.get, detail_fields)):
+            return False
+        connected = self._conn_state.get((device.get("address"), device.get("connect_port")), False)
+        if connected != getattr(row, "_connected", False):
+            return False
+        if old != device:
+            # Button handlers hold this dict, so update it rather than rebinding
+            old.clear()
+            old.update(device)
+            _update_device_row_labels(row, old)
+        return True
 
     def _refresh_usb_list(self):
         if self.usb_monitor:
@@ -723,74 +1005,61 @@ class AurynkWindow(Adw.ApplicationWindow):
                 self._add_usb_device_row(device)
 
     def _add_usb_device_row(self, device):
+        """Schedule a row for a USB device; the adb lookup runs on a worker thread."""
         serial = device.get("ID_SERIAL")
         if not serial:
-            return
-
-        # Initially assume we will key by the normalized ID_SERIAL, but if
-        # we can determine an ADB serial for this device, prefer using the
-        # normalized ADB serial as the canonical key so it matches helper
-        # state which uses adb_serial-based keys.
-        provisional_key = self._norm_serial(serial) or serial
-
-        # If any existing entry corresponds to the same physical device
-        # (match by adb_serial, short_serial, or normalized stored serial),
-        # skip creating a new row to avoid duplicates from multiple udev
-        # interfaces being reported for the same device.
-        try:
-            for k, entry in list(self.usb_rows.items()):
-                try:
-                    data = entry["data"] if isinstance(entry, dict) and "data" in entry else {}
-                    # Match by adb serial (best)
-                    adb = data.get("adb_serial")
-                    if adb and adb == device.get("ID_SERIAL_SHORT"):
-                        return
-                    if adb and adb == device.get("ID_SERIAL"):
-                        return
-                    # Match by short_serial
-                    short = data.get("short_serial")
-                    if short and short == device.get("ID_SERIAL_SHORT"):
-                        return
-                    # Match by normalized stored serial
-                    stored = data.get("serial")
-                    if stored and (self._norm_serial(stored) or stored) == (
-                        self._norm_serial(serial) or serial
-                    ):
-                        return
-                except Exception:
-                    pass
-        except Exception:
-            pass
-
-        if provisional_key in self.usb_rows:
-            return  # Already added
-
-        # Fetch detailed device info via ADB
-        import subprocess
-
-        dev_data = {
-            "name": device.get("ID_MODEL", "Unknown Model"),
-            "manufacturer": device.get("ID_VENDOR", "Unknown Vendor"),
-            "model": device.get("ID_MODEL"),
-            "serial": serial,
-            "short_serial": device.get("ID_SERIAL_SHORT"),
-            "is_usb": True,
-        }
+            return False
+        if serial in self._pending_additions or self._is_known_usb_device(device):
+            return False
+        self._pending_additions.add(serial)
+        self._adb_pool.submit(self._resolve_adb_serial_bg, device)
+        return False
 
+    def _is_known_usb_device(self, device):
+        """Return True if a row already exists for this physical device."""
+        target_id = device.get("ID_SERIAL")
+        target_short = device.get("ID_SERIAL_SHORT")
+        target_norm = self._norm_serial(target_id) or target_id
+
+        # A device may be listed under its udev ID_SERIAL or the serial adb
+        # reports; match any existing entry by adb_serial, short_serial, or
+        # normalized serial.
+        # Every usb_rows key is also in _by_norm_serial, so the indexes suffice.
+        if target_short and (
+            target_short in self._by_short_serial or target_short in self._by_adb_serial
+        ):
+            return True
+        return target_id in self._by_adb_serial or target_norm in self._by_norm_serial
+
+    def _index_usb_entry(self, key, entry):
+        """Record an entry's identifiers in the inverted indexes."""
+        adb = entry.adb_serial
+        short = entry.short_serial
+        if adb:
+            self._by_adb_serial[adb] = key
+        if short:
+            self._by_short_serial[short] = key
+        if entry.norm_serial:
+            self._by_norm_serial[entry.norm_serial] = key
+        for ident in (short, adb):
+            if ident:
+                self._by_norm_serial[self._norm_serial(ident) or ident] = key
+
+    def _unindex_usb_entry(self, key):
+        """Drop every inverted-index mapping that points at key."""
+        for index in (self._by_adb_serial, self._by_short_serial, self._by_norm_serial):
+            for ident in [i for i, k in index.items() if k == key]:
+                del index[ident]
+
+    def _resolve_adb_serial_bg(self, device):
+        """Worker thread: match a udev device to an `adb devices` serial."""
+        matched_serial = None
         # Try to get actual Android device serial from adb devices
         try:
-            result = subprocess.run(["adb", "devices"], capture_output=True, text=True, timeout=5)
-            adb_devices = []
-            # Parse for USB device (no colon in serial)
-            for line in result.stdout.strip().split("\n")[1:]:
-                if "\t" in line:
-                    s, st = line.split("\t", 1)
-                    if ":" not in s and st.strip() == "device":
-                        adb_devices.append(s)
+            adb_devices = self._get_adb_usb_serials()
 
             # Try to match using ID_SERIAL_SHORT from udev
-            short_serial = dev_data.get("short_serial")
-            matched_serial = None
+            short_serial = device.get("ID_SERIAL_SHORT")
 
             if short_serial and short_serial in adb_devices:
                 matched_serial = short_serial
@@ -800,28 +1069,65 @@ class AurynkWindow(Adw.ApplicationWindow):
             elif adb_devices:
                 # Fallback: just pick the first one if we can't match
                 matched_serial = adb_devices[0]
-
-            if matched_serial:
-                dev_data["adb_serial"] = matched_serial
-                # Use normalized ADB serial as canonical key when available
-                try:
-                    adb_key = self._norm_serial(matched_serial) or matched_serial
-                except Exception:
-                    adb_key = matched_serial
-                key = adb_key
-            else:
-                # Fallback to normalized ID_SERIAL
-                key = provisional_key
         except Exception as e:
             logger.debug(f"Could not fetch USB device info: {e}")
 
+        self._post_to_ui(self._add_usb_device_row_ui, device, matched_serial)
+
+    def _add_usb_device_row_ui(self, device, adb_serial):
+        """Create the row for a USB device on the GTK main thread."""
+        self._pending_additions.discard(device.get("ID_SERIAL"))
+        # Another event for the same device may have been handled meanwhile
+        if self._is_known_usb_device(device):
+            return False
+
+        serial = device.get("ID_SERIAL")
+        # Key by the normalized ID_SERIAL unless an ADB serial is known, in
+        # which case prefer the normalized ADB serial so it matches helper
+        # state which uses adb_serial-based keys.
+        key = self._norm_serial(serial) or serial
+
+        dev_data = {
+            "name": device.get("ID_MODEL", "Unknown Model"),
+            "manufacturer": device.get("ID_VENDOR", "Unknown Vendor"),
+            "model": device.get("ID_MODEL"),
+            "serial": serial,
+            "short_serial": device.get("ID_SERIAL_SHORT"),
+            "is_usb": True,
+        }
+        if adb_serial:
+            dev_data["adb_serial"] = adb_serial
+            key = self._norm_serial(adb_serial) or adb_serial
+            if key in self.usb_rows:
+                return False
+
+        # A device that reconnects shortly after a fetch reuses those details
+        fetched = self._fetched_at.get(key)
+        fresh = fetched is not None and time.monotonic() - fetched[0] < _DETAILS_TTL
+        if fresh:
+            dev_data.update(fetched[1])
+
         # Create the UI row immediately with whatever data we have.
         row = self._create_device_row(dev_data, is_usb=True)
         self.usb_group.add(row)
         # Create a Device object to manage ADB-backed details and signals.
-        device_obj = Device(initial=dev_data, adb_serial=dev_data.get("adb_serial"))
+        device_obj = Device(
+            initial=dev_data,
+            adb_serial=dev_data.get("adb_serial"),
+            adb_controller=self.adb_controller,
+        )
         # Attach device_obj to row and store in usb_rows so other code can access it
-        self.usb_rows[key] = {"row": row, "data": dev_data, "device_obj": device_obj}
+        entry = UsbRowEntry(
+            row=row,
+            data=dev_data,
+            device_obj=device_obj,
+            adb_serial=adb_serial,
+            short_serial=dev_data["short_serial"],
+            norm_serial=self._norm_serial(serial) or serial,
+        )
+        self.usb_rows[key] = entry
+        self._index_usb_entry(key, entry)
+        row._key = key
         row._device = device_obj
         # Store device path -> key mapping for disconnect detection
         device_path = device.device_path
@@ -831,49 +1137,52 @@ class AurynkWindow(Adw.ApplicationWindow):
         self.usb_group.set_visible(True)
 
         # When the Device object emits 'info-updated', refresh the row labels
-        try:
-
-            def _on_info_updated(devobj):
-                try:
-                    new_data = devobj.to_dict()
-                    # update stored data and refresh labels
-                    if key in self.usb_rows:
-                        self.usb_rows[key]["data"] = new_data
-                        try:
-                            from aurynk.services.tray_service import _update_device_row_labels
+        def _on_info_updated(devobj):
+            entry = self.usb_rows.get(key)
+            if entry is None:
+                return
+            # update stored data and refresh labels
+            entry.data = devobj.to_dict()
+            if devobj._last_fetch_monotonic is not None:
+                details = {f: entry.data[f] for f in _DETAIL_FIELDS if entry.data.get(f)}
+                self._fetched_at[key] = (devobj._last_fetch_monotonic, details)
+                self._fetched_at.move_to_end(key)
+                if len(self._fetched_at) > _DETAILS_MAX:
+                    self._fetched_at.popitem(last=False)
+            _update_device_row_labels(row, entry.data)
+            self._schedule_tray_update()
+
+        device_obj.connect("info-updated", _on_info_updated)
+        # Start the background fetch asynchronously (non-blocking)
+        if device_obj.adb_serial and not fresh:
+            device_obj.fetch_details()
 
-                            _update_device_row_labels(row, new_data)
-                        except Exception:
-                            pass
-                        app = self.get_application()
-                        if hasattr(app, "send_status_to_tray"):
-                            app.send_status_to_tray()
-                except Exception:
-                    pass
+        # Update tray status after adding USB device
+        self._schedule_tray_update()
+        return False
 
-            device_obj.connect("info-updated", _on_info_updated)
-            # Start the background fetch asynchronously (non-blocking)
-            if device_obj.adb_serial:
-                device_obj.fetch_details()
-        except Exception:
-            pass
+    def _get_adb_usb_serials(self, max_age=_ADB_DEVICES_TTL):
+        """Return serials of authorized USB devices from `adb devices`.
 
-        # Update tray status after adding USB device
-        app = self.get_application()
-        if hasattr(app, "send_status_to_tray"):
-            app.send_status_to_tray()
+        The parsed listing is cached for max_age seconds so that the several
+        udev events fired for one physical device share a single adb invocation.
+        """
+        devices = get_adb_devices(max_age)
+        # USB devices have no colon in their serial
+        return tuple(s for s, st in devices.items() if ":" not in s and st == "device")
 
     def _on_usb_device_connected(self, monitor, device):
-        GLib.idle_add(self._add_usb_device_row, device)
+        self._post_to_ui(self._add_usb_device_row, device)
 
     def _on_usb_device_disconnected(self, monitor, device):
+        invalidate_adb_cache()
         device_path = device.device_path
 
         # First, try to find the key using device path (most reliable)
-        if device_path in self.usb_device_paths:
-            key = self.usb_device_paths[device_path]
+        key = self.usb_device_paths.pop(device_path, None)
+        if key is not None:
             logger.debug(f"Found device to remove by path: {device_path} -> {key}")
-            GLib.idle_add(self._remove_usb_device_row, key, device_path)
+            self._queue_usb_removal(key)
             return
 
         # Fallback: try to match by serial if metadata is present
@@ -884,55 +1193,48 @@ class AurynkWindow(Adw.ApplicationWindow):
 
         norm = self._norm_serial(serial) or serial
 
-        # If a direct key exists, remove it. Otherwise, search for matching
-        # entries by comparing normalized ID_SERIAL, short_serial, or adb_serial
-        keys_to_remove = []
+        # If a direct key exists, remove it. Otherwise, look up entries whose
+        # normalized ID_SERIAL, short_serial, or adb_serial matches
         if norm in self.usb_rows:
-            keys_to_remove.append(norm)
-        else:
-            for k, entry in list(self.usb_rows.items()):
-                try:
-                    data = entry["data"] if isinstance(entry, dict) and "data" in entry else {}
-                    # Compare normalized stored serials
-                    stored_serial = data.get("serial")
-                    if (
-                        stored_serial
-                        and (self._norm_serial(stored_serial) or stored_serial) == norm
-                    ):
-                        keys_to_remove.append(k)
-                        continue
-                    short = data.get("short_serial")
-                    if short and (self._norm_serial(short) or short) == norm:
-                        keys_to_remove.append(k)
-                        continue
-                    adb = data.get("adb_serial")
-                    if adb and (self._norm_serial(adb) or adb) == norm:
-                        keys_to_remove.append(k)
-                        continue
-                except Exception:
-                    pass
-
-        for key in keys_to_remove:
-            GLib.idle_add(self._remove_usb_device_row, key, None)
+            self._queue_usb_removal(norm)
+        elif norm in self._by_norm_serial:
+            self._queue_usb_removal(self._by_norm_serial[norm])
+
+    def _queue_usb_removal(self, key):
+        """Schedule removal of a USB row, once per key per burst of events."""
+        if not self._pending_removals:
+            self._post_to_ui(self._drain_usb_removals)
+        self._pending_removals.add(key)
+
+    def _drain_usb_removals(self):
+        """Remove every USB row queued since the last drain."""
+        keys, self._pending_removals = self._pending_removals, set()
+        for key in keys:
+            self._remove_usb_device_row(key)
 
     def _remove_usb_device_row(self, serial, device_path=None):
         # `serial` here is already a normalized key
         key = serial
         if key in self.usb_rows:
-            row_data = self.usb_rows[key]
-            row = row_data["row"] if isinstance(row_data, dict) else row_data
             try:
-                self.usb_group.remove(row)
+                self.usb_group.remove(self.usb_rows[key].row)
             except Exception:
                 pass
+            adb_serial = self.usb_rows[key].adb_serial
+            if adb_serial:
+                forget_props(adb_serial)
+                # close_shell waits out any command still running on the shell
+                self._adb_pool.submit(self.adb_controller.close_shell, adb_serial)
             del self.usb_rows[key]
+            self._unindex_usb_entry(key)
 
         # Clean up device path mapping
         if device_path and device_path in self.usb_device_paths:
             del self.usb_device_paths[device_path]
         else:
-            # Find and remove by key
-            for path, k in list(self.usb_device_paths.items()):
+            # Find and remove by key; the loop stops at the deletion, so the
+            # live view is never advanced after the dict changes size
+            for path, k in self.usb_device_paths.items():
                 if k == key:
                     del self.usb_device_paths[path]
                     break
@@ -942,109 +1244,30 @@ class AurynkWindow(Adw.ApplicationWindow):
             self.usb_group.set_visible(False)
 
         # Update tray status after removing USB device
-        app = self.get_application()
-        if hasattr(app, "send_status_to_tray"):
-            app.send_status_to_tray()
+        self._schedule_tray_update()
 
-    def _background_fetch_and_update(self, key, adb_serial):
-        """Background thread: fetch ADB-backed device info and update UI."""
-        try:
-            # Ensure we have a dev_data object to populate
-            entry = self.usb_rows.get(key)
-            if not entry:
-                return
-            dev_data = entry.get("data", {})
-
-            # Reuse existing helper to fetch properties (this blocks but runs off-main-thread)
-            try:
-                self._fetch_usb_device_info(dev_data, adb_serial)
-            except Exception:
-                pass
-
-            # Update stored data and refresh labels on the main thread
-            GLib.idle_add(self._apply_updated_usb_info, key, dev_data)
-        except Exception:
-            pass
+    def _resolve_screenshot(self, thumbnail):
+        """Return the absolute path of a row thumbnail if the file exists.
 
-    def _apply_updated_usb_info(self, key, dev_data):
-        """Apply updated dev_data to the row and refresh labels.
-
-        Called on the GTK main thread via GLib.idle_add.
+        Hits are memoized; misses are not, so a screenshot captured later is
+        picked up on the next row build.
         """
-        try:
-            entry = self.usb_rows.get(key)
-            if not entry:
-                return False
-            row = entry.get("row") if isinstance(entry, dict) else entry
-            # Update stored data
-            try:
-                self.usb_rows[key]["data"] = dev_data
-            except Exception:
-                pass
-
-            # Update the row labels using the shared helper from tray_service
-            try:
-                from aurynk.services.tray_service import _update_device_row_labels
-
-                _update_device_row_labels(row, dev_data)
-            except Exception:
-                # Best-effort: no-op on failure
-                pass
-
-            # Update tray status if available
-            app = self.get_application()
-            if hasattr(app, "send_status_to_tray"):
-                app.send_status_to_tray()
-
-        except Exception:
-            pass
-        finally:
-            # return False to remove idle source if needed
-            return False
-
-    def _fetch_usb_device_info(self, dev_data, adb_serial):
-        """Fetch detailed USB device information via ADB."""
-        import subprocess
-
-        try:
-            timeout = 5
-
-            # Get device properties
-            props_to_fetch = [
-                ("ro.product.model", "model"),
-                ("ro.product.manufacturer", "manufacturer"),
-                ("ro.build.version.release", "android_version"),
-            ]
-
-            for prop, key in props_to_fetch:
-                try:
-                    result = subprocess.run(
-                        ["adb", "-s", adb_serial, "shell", "getprop", prop],
-                        capture_output=True,
-                        text=True,
-                        timeout=timeout,
-                    )
-                    value = result.stdout.strip()
-                    if value:
-                        dev_data[key] = value
-                        logger.info(f"Fetched USB {key} = '{value}' for device {adb_serial}")
-                except Exception as e:
-                    logger.debug(f"Error fetching {prop}: {e}")
-
-            # Update name to use the actual model if available (prefer real model over udev ID_MODEL)
-            if dev_data.get("model") and dev_data.get("model") != dev_data.get("ID_MODEL"):
-                dev_data["name"] = dev_data["model"]
-                logger.info(f"Updated USB device name to '{dev_data['name']}'")
-
-        except Exception as e:
-            logger.debug(f"Error fetching USB device properties: {e}")
+        if not thumbnail:
+            return None
+        path = self._screenshot_paths.get(thumbnail)
+        if path is None:
+            path = os.path.join(_SCREENSHOT_DIR, thumbnail)
+            if not os.path.exists(path):
+                return None
+            self._screenshot_paths[thumbnail] = path
+        return path
 
-        # logger.info(
-        #     f"Final USB dev_data for {adb_serial}: name='{dev_data.get('name')}', manufacturer='{dev_data.get('manufacturer')}', model='{dev_data.get('model')}', android_version='{dev_data.get('android_version')}'"
-        # )
+    def _create_device_row(self, device, is_usb=False, active=None):
+        """Create a row widget for a device.
 
-    def _create_device_row(self, device, is_usb=False):
-        """Create a row widget for a device."""
+        active is an optional scrcpy snapshot_active() result; callers creating
+        several rows take it once and pass it to each.
+        """
         row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=12)
         row.set_margin_start(24)
         row.set_margin_end(24)
@@ -1057,16 +1280,12 @@ class AurynkWindow(Adw.ApplicationWindow):
 
         # Device icon
         # Use permanent location for screenshots
-        screenshot_path = device.get("thumbnail")
-        if screenshot_path and not os.path.isabs(screenshot_path):
-            screenshot_path = os.path.expanduser(
-                os.path.join("~/.local/share/aurynk/screenshots", screenshot_path)
-            )
-        if not screenshot_path or not os.path.exists(screenshot_path):
+        screenshot_path = self._resolve_screenshot(device.get("thumbnail"))
+        if not screenshot_path:
             # Use Flatpak-compliant GResource path for fallback icon
-            icon = Gtk.Image.new_from_resource(
-                "/io/github/IshuSinghSE/aurynk/icons/io.github.IshuSinghSE.aurynk.device.png"
-            )
+            if AurynkWindow._fallback_icon is None:
+                AurynkWindow._fallback_icon = Gdk.Texture.new_from_resource(_DEVICE_ICON_RESOURCE)
+            icon = Gtk.Image.new_from_paintable(AurynkWindow._fallback_icon)
         else:
             icon = Gtk.Image.new_from_file(screenshot_path)
         icon.set_margin_top(4)
@@ -1082,23 +1301,16 @@ class AurynkWindow(Adw.ApplicationWindow):
         info_box.set_hexpand(True)
 
         # Device name
-        name_label = Gtk.Label()
-        dev_name = device.get("name", _("Unknown Device"))
-        name_label.set_markup(f'<span size="large" weight="bold">{dev_name}</span>')
+        # Styled by the .device-name CSS class; plain text needs no markup escaping
+        name_label = Gtk.Label(label=device.get("name", _("Unknown Device")))
+        name_label.add_css_class("device-name")
         name_label.set_halign(Gtk.Align.START)
         info_box.append(name_label)
 
         # Device details (show for both USB and wireless)
-        details = []
-        if device.get("manufacturer"):
-            details.append(device["manufacturer"])
-        if device.get("model"):
-            details.append(device["model"])
-        if device.get("android_version"):
-            details.append(f"Android {device['android_version']}")
-
+        details = _device_details_text(device)
         if details:
-            details_label = Gtk.Label(label=" • ".join(details))
+            details_label = Gtk.Label(label=details)
             details_label.set_halign(Gtk.Align.START)
             details_label.add_css_class("dim-label")
             info_box.append(details_label)
@@ -1122,9 +1334,8 @@ class AurynkWindow(Adw.ApplicationWindow):
             # Wireless devices can connect/disconnect
             address = device.get("address")
             connect_port = device.get("connect_port")
-            connected = False
-            if address and connect_port:
-                connected = is_device_connected(address, connect_port)
+            connected = self._conn_state.get((address, connect_port), False)
+            row._connected = connected
             if connected:
                 status_btn.set_label(_("Disconnect"))
                 status_btn.add_css_class("destructive-action")
@@ -1142,41 +1353,21 @@ class AurynkWindow(Adw.ApplicationWindow):
 
         if is_usb:
             # USB devices are always ready to mirror
-            mirror_btn.set_sensitive(True)
             # Check if already mirroring and set appropriate style
             adb_serial = device.get("adb_serial")
-            if adb_serial:
-                scrcpy = self._get_scrcpy_manager()
-                if scrcpy.is_mirroring_serial(adb_serial):
-                    mirror_btn.set_label(_("Mirroring"))
-                    mirror_btn.add_css_class("destructive-action")
-                else:
-                    mirror_btn.set_label(_("Mirror"))
-                    mirror_btn.add_css_class("suggested-action")
-            else:
-                mirror_btn.set_label(_("Mirror"))
-                mirror_btn.add_css_class("suggested-action")
+            mirroring = bool(adb_serial) and self._get_scrcpy_manager().is_mirroring_serial(
+                adb_serial, active
+            )
+            self._render_mirror_button(mirror_btn, "mirroring" if mirroring else "mirror")
             mirror_btn.connect("clicked", self._on_usb_mirror_clicked, device)
         else:
             # Wireless devices need to be connected first
             address = device.get("address")
             connect_port = device.get("connect_port")
-            connected = False
-            if address and connect_port:
-                connected = is_device_connected(address, connect_port)
-            mirror_btn.set_sensitive(connected)
-            if connected:
-                # Check if already mirroring and set appropriate style
-                scrcpy = self._get_scrcpy_manager()
-                if scrcpy.is_mirroring(address, connect_port):
-                    mirror_btn.set_label(_("Mirroring"))
-                    mirror_btn.add_css_class("destructive-action")
-                else:
-                    mirror_btn.set_label(_("Mirror"))
-                    mirror_btn.add_css_class("suggested-action")
-            else:
-                mirror_btn.set_label(_("Mirror"))
-                mirror_btn.add_css_class("suggested-action")
+            connected = self._conn_state.get((address, connect_port), False)
+            self._render_mirror_button(
+                mirror_btn, self._wireless_mirror_state(connected, address, connect_port, active)
+            )
             mirror_btn.connect("clicked", self._on_mirror_clicked, device)
 
         status_box.append(mirror_btn)
@@ -1192,6 +1383,11 @@ class AurynkWindow(Adw.ApplicationWindow):
         # being passed when tray_service creates a Device object later.
         def _details_clicked(btn):
             try:
+                # USB rows know their usb_rows key, so their entry is one dict hit
+                entry = self.usb_rows.get(getattr(row, "_key", None))
+                if entry is not None:
+                    self._on_device_details_clicked(btn, entry.device_obj or entry.data)
+                    return
                 # Prefer a Device object attached to the row
                 target = getattr(row, "_device", None)
                 if target and hasattr(target, "to_dict"):
@@ -1209,6 +1405,10 @@ class AurynkWindow(Adw.ApplicationWindow):
         status_box.append(details_btn)
 
         row.append(status_box)
+        # Direct handles so later updates skip walking the widget tree
+        row._status_box = status_box
+        row._status_btn = status_btn
+        row._mirror_btn = mirror_btn
         return row
 
     def _on_status_clicked(self, button, device, connected):
@@ -1216,60 +1416,30 @@ class AurynkWindow(Adw.ApplicationWindow):
         connect_port = device.get("connect_port")
         if not address or not connect_port:
             return
-        from aurynk.utils.settings import SettingsManager
-
-        settings = SettingsManager()
+        settings = get_settings_manager()
         auto_unpair = settings.get("adb", "auto_unpair_on_disconnect", False)
         require_confirm = settings.get("adb", "require_confirmation_for_unpair", True)
         if connected:
             # Disconnect logic
-            import subprocess
-
             subprocess.run(["adb", "disconnect", f"{address}:{connect_port}"])
+            invalidate_adb_cache()
             # Immediately trigger unpair/confirmation if auto-unpair is enabled
             if auto_unpair:
                 if require_confirm:
-                    from gi.repository import Adw
-
-                    dialog = Adw.MessageDialog.new(self)
-                    dialog.set_heading(_("Remove Device?"))
-                    body_text = _("Are you sure you want to remove\n{device} ?").format(
-                        device=address
-                    )
-                    dialog.set_body(body_text)
-                    dialog.set_default_size(340, 120)
-                    body_label = (
-                        dialog.get_body_label() if hasattr(dialog, "get_body_label") else None
-                    )
-                    if body_label:
-                        body_label.set_line_wrap(True)
-                        body_label.set_max_width_chars(40)
-                    dialog.add_response("cancel", _("Cancel"))
-                    dialog.add_response("remove", _("Remove"))
-                    dialog.set_response_appearance("remove", Adw.ResponseAppearance.DESTRUCTIVE)
-
-                    def on_response(dlg, response):
-                        if response == "remove":
-                            from aurynk.core.adb_manager import ADBController
 
+                    def on_confirm(confirmed):
+                        if confirmed:
                             ADBController().remove_device(address)
                             self._refresh_device_list()
-                        dlg.destroy()
 
-                    dialog.connect("response", on_response)
-                    dialog.present()
+                    self.show_unpair_confirmation_dialog(address, on_confirm)
                 else:
-                    from aurynk.core.adb_manager import ADBController
-
                     ADBController().remove_device(address)
                     self._refresh_device_list()
         else:
             # Connect logic with loading indicator - run in thread to not block UI
             def do_connection():
                 nonlocal connect_port  # Declare at the top
-                import subprocess
-                import time
-
                 app = self.get_application()
                 discovered_port = None
 
@@ -1286,9 +1456,9 @@ class AurynkWindow(Adw.ApplicationWindow):
 
                 logger.info(f"Attempting to connect to {address}:{connect_port}...")
 
-                # Try connection with one retry (sometimes ADB needs a moment)
-                max_attempts = 2
-                for attempt in range(max_attempts):
+                # Retry only when the adb server itself was down, after starting it
+                connection_success = False
+                for attempt in range(2):
                     result = subprocess.run(
                         ["adb", "connect", f"{address}:{connect_port}"],
                         capture_output=True,
@@ -1298,29 +1468,23 @@ class AurynkWindow(Adw.ApplicationWindow):
 
                     output = (result.stdout + result.stderr).lower()
 
-                    # Check if connection succeeded
-                    if (
-                        "connected" in output or "already connected" in output
-                    ) and "unable" not in output:
+                    # Check if connection succeeded ("already connected" included)
+                    connection_success = "connected" in output and "unable" not in output
+                    if connection_success:
                         if attempt > 0:
                             logger.info(f"✓ Connected successfully on attempt {attempt + 1}")
                         else:
                             logger.info(f"✓ Connected successfully to {address}:{connect_port}")
                         break
-                    elif attempt < max_attempts - 1:
-                        # First attempt failed, wait a moment and retry
-                        logger.debug(f"Connection attempt {attempt + 1} failed, retrying...")
-                        time.sleep(0.5)
-                    else:
-                        # All attempts failed
-                        logger.warning(f"Connection failed: {output.strip()}")
+                    if attempt == 0 and any(err in output for err in _ADB_DAEMON_ERRORS):
+                        logger.debug("adb server not running, starting it and retrying...")
+                        subprocess.run(["adb", "start-server"], capture_output=True, timeout=10)
+                        continue
+                    break
 
+                invalidate_adb_cache()
                 # Check final connection status
-                connection_success = False
-                if (
-                    "connected" in output or "already connected" in output
-                ) and "unable" not in output:
-                    connection_success = True
+                if connection_success:
                     # Update stored port if it changed
                     if discovered_port and discovered_port != device.get("connect_port"):
                         device["connect_port"] = discovered_port
@@ -1342,6 +1506,7 @@ class AurynkWindow(Adw.ApplicationWindow):
                             capture_output=True,
                             text=True,
                         )
+                        invalidate_adb_cache()
 
                         if result.returncode == 0:
                             device["connect_port"] = new_port
@@ -1388,17 +1553,15 @@ class AurynkWindow(Adw.ApplicationWindow):
         """Animate button label with dots: Connecting -> Connecting. -> Connecting.. -> Connecting..."""
         self._animation_counter = 0
         self._animation_active = True
+        # "Connecting" should be translated; the dots are appended per frame.
+        base_label = _("Connecting")
+        labels = [base_label + "." * n for n in range(4)]
 
         def animate_dots():
             if not self._animation_active:
                 return False  # Stop the animation
 
-            dots = "." * (self._animation_counter % 4)
-            # connecting is a status message, we can wrap it, but it has dynamic dots.
-            # "Connecting" should be translated.
-            base_label = _("Connecting")
-            dots = "." * (self._animation_counter % 4)
-            button.set_label(f"{base_label}{dots}")
+            button.set_label(labels[self._animation_counter & 3])
             self._animation_counter += 1
             return True  # Continue animation
 
@@ -1414,8 +1577,6 @@ class AurynkWindow(Adw.ApplicationWindow):
 
     def _on_add_device_clicked(self, button):
         """Handle Add Device button click."""
-        from aurynk.ui.dialogs.pairing_dialog import PairingDialog
-
         dialog = PairingDialog(self)
         dialog.present()
 
@@ -1431,8 +1592,6 @@ class AurynkWindow(Adw.ApplicationWindow):
 
     def _on_device_details_clicked(self, button, device):
         """Handle device details button click."""
-        from aurynk.ui.windows.device_details import DeviceDetailsWindow
-
         # If caller passed a Device object, prefer its live data. If a dict
         # was passed (common when tray_service created the row), attempt to
         # locate an associated Device object from `self.usb_rows` so we can
@@ -1451,14 +1610,11 @@ class AurynkWindow(Adw.ApplicationWindow):
                 )
                 data = device
                 if serial:
-                    try:
-                        key = self._norm_serial(serial) or serial
-                    except Exception:
-                        key = serial
+                    key = self._norm_serial(serial) or serial
                     entry = self.usb_rows.get(key) if hasattr(self, "usb_rows") else None
-                    if entry and isinstance(entry, dict) and entry.get("device_obj"):
+                    if entry and entry.device_obj:
                         try:
-                            data = entry.get("device_obj").to_dict()
+                            data = entry.device_obj.to_dict()
                             data["is_usb"] = True
                         except Exception:
                             data = device
@@ -1481,116 +1637,105 @@ class AurynkWindow(Adw.ApplicationWindow):
         logger.debug(f"Search: {search_text}")
 
     def _get_scrcpy_manager(self):
-        if not hasattr(self, "_scrcpy_manager"):
-            self._scrcpy_manager = ScrcpyManager()
-            self._scrcpy_manager.add_stop_callback(self._on_mirror_stopped)
+        return self._scrcpy_manager or self._init_scrcpy_manager()
+
+    def _init_scrcpy_manager(self):
+        self._scrcpy_manager = ScrcpyManager()
+        self._scrcpy_manager.add_stop_callback(self._on_mirror_stopped)
         return self._scrcpy_manager
 
     def _on_mirror_stopped(self, serial):
         """Callback when scrcpy process exits."""
         logger.info(f"Mirror stopped for {serial}, refreshing UI")
-        GLib.idle_add(self._handle_mirror_stop_ui_update)
+        GLib.idle_add(self._handle_single_mirror_stop, serial)
+
+    def _handle_single_mirror_stop(self, serial):
+        """Update the mirror button of the row whose scrcpy session stopped."""
+        # Screenshots may have been replaced while mirroring
+        self._screenshot_paths.clear()
+        scrcpy = self._get_scrcpy_manager()
+        active = scrcpy.snapshot_active()
 
-    def _handle_mirror_stop_ui_update(self):
-        # Use _update_all_mirror_buttons to ensure both wireless (via refresh)
-        # and USB buttons (via iteration) are updated
-        self._update_all_mirror_buttons()
+        key = self._by_adb_serial.get(serial) or self._by_norm_serial.get(self._norm_serial(serial))
+        entry = self.usb_rows.get(key)
+        if entry is not None:
+            is_mirroring = entry.data.get("_mirroring_override") or scrcpy.is_mirroring_serial(
+                entry.adb_serial or key, active
+            )
+            state = "mirroring" if is_mirroring else "mirror"
+            self._render_mirror_button(entry.row._mirror_btn, state)
+
+        # Wireless serials are "address:port"; rows are keyed by address
+        row = getattr(self, "_wireless_rows", {}).get(serial.rpartition(":")[0])
+        if row is not None:
+            address = row._device_data.get("address")
+            connect_port = row._device_data.get("connect_port")
+            connected = self._conn_state.get((address, connect_port), False)
+            self._render_mirror_button(
+                row._mirror_btn,
+                self._wireless_mirror_state(connected, address, connect_port, active),
+            )
         # No tray sync needed here - the stop handler already did it with proper timing
+        return False
 
-    def _update_all_mirror_buttons(self):
+    def _update_all_mirror_buttons(self, active=None):
         """Update only mirror button states without rebuilding UI.
-        This is called when tray triggers mirroring to sync main window."""
-        scrcpy = self._get_scrcpy_manager()
-        from aurynk.utils.adb_utils import is_device_connected
+        This is called when tray triggers mirroring to sync main window; a
+        single stopped session goes through _handle_single_mirror_stop.
+        active is an optional fresh scrcpy snapshot_active() result."""
+        # One pass over scrcpy's process table serves every row below
+        active = active or self._get_scrcpy_manager().snapshot_active()
+        active_serials = active[0]
 
         # Update wireless device rows
-        if hasattr(self, "_wireless_rows"):
-            for row in self._wireless_rows:
-                if not hasattr(row, "_device_data"):
-                    continue
+        for row in getattr(self, "_wireless_rows", {}).values():
+            device = row._device_data
+            address = device.get("address")
+            connect_port = device.get("connect_port")
+            mirror_btn = row._mirror_btn
 
-                device = row._device_data
-                address = device.get("address")
-                connect_port = device.get("connect_port")
-
-                # Find mirror button
-                child = row.get_first_child()
-                while child:
-                    if isinstance(child, Gtk.Box):
-                        btn_child = child.get_first_child()
-                        mirror_btn = None
-                        while btn_child:
-                            if isinstance(btn_child, Gtk.Button) and btn_child.has_css_class(
-                                "mirror-button"
-                            ):
-                                mirror_btn = btn_child
-                                break
-                            btn_child = btn_child.get_next_sibling()
-
-                        if mirror_btn:
-                            connected = False
-                            if address and connect_port:
-                                connected = is_device_connected(address, connect_port)
-
-                            mirror_btn.set_sensitive(connected)
-                            if connected:
-                                if scrcpy.is_mirroring(address, connect_port):
-                                    mirror_btn.set_label(_("Mirroring"))
-                                    mirror_btn.remove_css_class("suggested-action")
-                                    mirror_btn.add_css_class("destructive-action")
-                                else:
-                                    mirror_btn.set_label(_("Mirror"))
-                                    mirror_btn.remove_css_class("destructive-action")
-                                    mirror_btn.add_css_class("suggested-action")
-                            else:
-                                mirror_btn.set_label(_("Mirror"))
-                                mirror_btn.remove_css_class("destructive-action")
-                                mirror_btn.add_css_class("suggested-action")
-                            break
-                    child = child.get_next_sibling()
+            connected = self._conn_state.get((address, connect_port), False)
+            self._render_mirror_button(
+                mirror_btn, self._wireless_mirror_state(connected, address, connect_port, active)
+            )
 
         # Also update USB device mirror buttons
-        for serial, row_data in self.usb_rows.items():
-            if isinstance(row_data, dict) and "row" in row_data:
-                row = row_data["row"]
-                # Find the mirror button in this row
-                # Row structure: icon -> info_box -> status_box (contains buttons)
-                child = row.get_first_child()
-                while child:
-                    if isinstance(child, Gtk.Box):
-                        # Check if this is the status_box by looking for buttons
-                        btn_child = child.get_first_child()
-                        mirror_btn = None
-                        while btn_child:
-                            if isinstance(btn_child, Gtk.Button):
-                                # Check if this is the mirror button
-                                if btn_child.has_css_class("mirror-button"):
-                                    mirror_btn = btn_child
-                                    break
-                            btn_child = btn_child.get_next_sibling()
-
-                        if mirror_btn:
-                            # Update button state based on mirroring status
-                            adb_serial = row_data["data"].get("adb_serial", serial)
-                            # Honor transient override set when tray started mirroring via helper
-                            is_mirroring = False
-                            try:
-                                if row_data["data"].get("_mirroring_override"):
-                                    is_mirroring = True
-                                else:
-                                    is_mirroring = scrcpy.is_mirroring_serial(adb_serial)
-                            except Exception:
-                                is_mirroring = scrcpy.is_mirroring_serial(adb_serial)
-                            if is_mirroring:
-                                mirror_btn.set_label(_("Mirroring"))
-                                mirror_btn.remove_css_class("suggested-action")
-                                mirror_btn.add_css_class("destructive-action")
-                            else:
-                                mirror_btn.set_label(_("Mirror"))
-                                mirror_btn.remove_css_class("destructive-action")
-                                mirror_btn.add_css_class("suggested-action")
-                            break
-                    child = child.get_next_sibling()
+        for serial, entry in self.usb_rows.items():
+            mirror_btn = entry.row._mirror_btn
+            # Update button state based on mirroring status
+            adb_serial = entry.adb_serial or serial
+            # Honor transient override set when tray started mirroring via helper
+            is_mirroring = entry.data.get("_mirroring_override") or adb_serial in active_serials
+            self._render_mirror_button(mirror_btn, "mirroring" if is_mirroring else "mirror")
+
+    def _wireless_mirror_state(self, connected, address, connect_port, active=None):
+        """Return the mirror button state for a wireless device.
+
+        active is an optional scrcpy snapshot_active() result to reuse.
+        """
+        if not connected:
+            return "disabled"
+        scrcpy = self._get_scrcpy_manager()
+        return "mirroring" if scrcpy.is_mirroring(address, connect_port, active) else "mirror"
+
+    def _render_mirror_button(self, mirror_btn, state):
+        """Show state ("mirroring", "mirror" or "disabled") on a mirror button.
+
+        The last rendered state is remembered so steady-state refreshes skip
+        the label and style-class updates.
+        """
+        if getattr(mirror_btn, "_last_state", None) == state:
+            return
+        mirror_btn._last_state = state
+        mirror_btn.set_sensitive(state != "disabled")
+        if state == "mirroring":
+            mirror_btn.set_label(_("Mirroring"))
+            mirror_btn.remove_css_class("suggested-action")
+            mirror_btn.add_css_class("destructive-action")
+        else:
+            mirror_btn.set_label(_("Mirror"))
+            mirror_btn.remove_css_class("destructive-action")
+            mirror_btn.add_css_class("suggested-action")
 
     def _on_mirror_clicked(self, button, device):
         address = device.get("address")
@@ -1609,55 +1754,24 @@ class AurynkWindow(Adw.ApplicationWindow):
         else:
             scrcpy.start_mirror(address, connect_port, device_name)
 
-        # Update UI immediately using _update_all_mirror_buttons
-        self._update_all_mirror_buttons()
+        # Update UI immediately from one post-toggle snapshot
+        self._update_all_mirror_buttons(scrcpy.snapshot_active())
 
-        # Sync tray - with small delay only when stopping to let process cleanup complete
-        app = self.get_application()
-        if hasattr(app, "send_status_to_tray"):
-            if is_currently_mirroring:
-                # Stopping - wait for process to fully terminate
-                GLib.timeout_add(100, lambda: app.send_status_to_tray())
-            else:
-                # Starting - sync immediately
-                app.send_status_to_tray()
+        # Sync tray - once the process is gone when stopping
+        if is_currently_mirroring:
+            self._probe_mirror_stopped(lambda: not scrcpy.is_mirroring(address, connect_port))
+        elif self._notify_tray:
+            # Starting - sync immediately
+            self._notify_tray()
 
     def _on_usb_mirror_clicked(self, button, device):
         """Handle mirror click for USB devices."""
         # Try to use the stored ADB serial first
         usb_serial = device.get("adb_serial")
 
-        # If not found, try to find it via adb devices (fallback)
-        if not usb_serial:
-            import subprocess
-
-            try:
-                result = subprocess.run(
-                    ["adb", "devices"], capture_output=True, text=True, timeout=5
-                )
-                adb_devices = []
-                for line in result.stdout.strip().split("\n")[1:]:
-                    if "\t" in line:
-                        s, st = line.split("\t", 1)
-                        if ":" not in s and st.strip() == "device":
-                            adb_devices.append(s)
-
-                short_serial = device.get("short_serial")
-                if short_serial and short_serial in adb_devices:
-                    usb_serial = short_serial
-                elif len(adb_devices) == 1:
-                    usb_serial = adb_devices[0]
-                elif adb_devices:
-                    usb_serial = adb_devices[0]
-
-                if usb_serial:
-                    # Store it for future use to ensure consistency
-                    device["adb_serial"] = usb_serial
-            except Exception as e:
-                logger.error(f"Error finding USB serial: {e}")
-
+        # If not found, look it up via adb devices off the GTK thread and retry
         if not usb_serial:
-            logger.warning("No USB device serial found")
+            self._adb_pool.submit(self._resolve_usb_mirror_serial_bg, button, device)
             return
 
         try:
@@ -1673,59 +1787,95 @@ class AurynkWindow(Adw.ApplicationWindow):
             if is_mirroring:
                 logger.info(f"Stopping mirror for USB device {usb_serial}")
                 scrcpy.stop_mirror_by_serial(usb_serial)
+                # Update UI immediately from one post-toggle snapshot
+                self._update_all_mirror_buttons(scrcpy.snapshot_active())
+                # Sync tray once the process is gone
+                self._probe_mirror_stopped(lambda: not scrcpy.is_mirroring_serial(usb_serial))
             else:
                 logger.info(f"Starting mirror for USB device {usb_serial}")
+                # A recent listing that already shows the device unauthorized
+                # saves starting scrcpy just to watch it fail
+                devices = peek_adb_devices(_MIRROR_ADB_DEVICES_TTL)
+                if devices is not None and devices.get(usb_serial) == "unauthorized":
+                    self._show_usb_unauthorized_dialog(device_name)
+                    return
+                self._start_usb_mirror(usb_serial, device_name)
+        except Exception as e:
+            logger.error(f"Error starting USB mirror: {e}")
 
-                # Check if USB device is authorized before attempting to mirror
-                is_authorized, state = self._check_usb_authorization(usb_serial)
-
-                if not is_authorized:
-                    if state == "unauthorized":
-                        # Show USB authorization dialog
-                        self._show_usb_unauthorized_dialog(device_name)
-                        return
-                    else:
-                        logger.warning(f"USB device {usb_serial} in unexpected state: {state}")
+    def _start_usb_mirror(self, usb_serial, device_name):
+        try:
+            scrcpy = self._get_scrcpy_manager()
+            started = scrcpy.start_mirror_usb(usb_serial, device_name)
+            if not started:
+                # Only a failed start needs adb's view of the device, to tell an
+                # unauthorized device apart from scrcpy itself being unavailable
+                self._check_usb_authorization(
+                    usb_serial,
+                    lambda is_authorized, state: self._on_usb_mirror_failed(
+                        usb_serial, device_name, state
+                    ),
+                )
 
-                started = scrcpy.start_mirror_usb(usb_serial, device_name)
-                if not started:
-                    # Show a user-facing dialog explaining common causes and remediation
-                    try:
-                        self._show_scrcpy_unavailable_dialog(usb_serial)
-                    except Exception:
-                        logger.exception("Failed to show scrcpy unavailable dialog")
+            # Update UI immediately from one post-toggle snapshot
+            self._update_all_mirror_buttons(scrcpy.snapshot_active())
+            # Starting - sync tray immediately
+            if self._notify_tray:
+                self._notify_tray()
+        except Exception as e:
+            logger.error(f"Error starting USB mirror: {e}")
 
-            # Update UI immediately using _update_all_mirror_buttons
-            self._update_all_mirror_buttons()
+    def _on_usb_mirror_failed(self, usb_serial, device_name, state):
+        """Explain a failed USB mirror start once the device's adb state is known."""
+        if state == "unauthorized":
+            # Show USB authorization dialog
+            self._show_usb_unauthorized_dialog(device_name)
+            return
+        if state != "device":
+            logger.warning(f"USB device {usb_serial} in unexpected state: {state}")
+        # Show a user-facing dialog explaining common causes and remediation
+        try:
+            self._show_scrcpy_unavailable_dialog(usb_serial)
+        except Exception:
+            logger.exception("Failed to show scrcpy unavailable dialog")
 
-            # Sync tray - with small delay only when stopping to let process cleanup complete
-            app = self.get_application()
-            if hasattr(app, "send_status_to_tray"):
-                if is_mirroring:
-                    # Stopping - wait for process to fully terminate
-                    GLib.timeout_add(100, lambda: app.send_status_to_tray())
-                else:
-                    # Starting - sync immediately
-                    app.send_status_to_tray()
-        # end of try block for USB mirror click
-        except subprocess.TimeoutExpired:
-            logger.error("adb devices command timed out")
+    def _resolve_usb_mirror_serial_bg(self, button, device):
+        """Worker thread: find the adb serial for a USB row, then retry the click."""
+        try:
+            adb_devices = self._get_adb_usb_serials(max_age=_MIRROR_ADB_DEVICES_TTL)
         except Exception as e:
-            logger.error(f"Error starting USB mirror: {e}")
+            logger.error(f"Error finding USB serial: {e}")
+            return
+
+        short_serial = device.get("short_serial")
+        if short_serial and short_serial in adb_devices:
+            usb_serial = short_serial
+        elif adb_devices:
+            usb_serial = adb_devices[0]
+        else:
+            logger.warning("No USB device serial found")
+            return
+        self._post_to_ui(self._retry_usb_mirror_click, button, device, usb_serial)
+
+    def _retry_usb_mirror_click(self, button, device, usb_serial):
+        # Store it for future use to ensure consistency
+        device["adb_serial"] = usb_serial
+        self._on_usb_mirror_clicked(button, device)
 
     def _parse_connection_error(self, output: str) -> str:
         """Parse ADB connection error output and return user-friendly message."""
-        output_lower = output.lower()
+        # One scan of the output; the highest-priority rule that matched wins
+        rule = min((m.lastindex for m in _CONN_ERROR_RE.finditer(output)), default=None)
 
-        if "refused" in output_lower or "cannot connect" in output_lower:
+        if rule == 1:
             return _("Connection refused. Make sure Wireless Debugging is enabled on your device.")
-        elif "timed out" in output_lower or "timeout" in output_lower:
+        elif rule == 2:
             return _(
                 "Connection timed out. Check if your device is on the same network and Wireless Debugging is enabled."
             )
-        elif "no route" in output_lower or "unreachable" in output_lower:
+        elif rule == 3:
             return _("Cannot reach device. Verify the device is on the same Wi-Fi network.")
-        elif "unable" in output_lower:
+        elif rule == 4:
             return _(
                 "Unable to connect. The device may have changed ports. Try removing and re-pairing the device."
             )
@@ -1734,72 +1884,85 @@ class AurynkWindow(Adw.ApplicationWindow):
                 "Connection failed. Ensure Wireless Debugging is enabled and the device is on the same network."
             )
 
+    def _present_info_dialog(self, heading, body, width=400, height=200, chars=50):
+        """Show a message dialog with a single OK response."""
+        dialog = Adw.MessageDialog.new(self)
+        dialog.set_heading(heading)
+        dialog.set_body(body)
+        dialog.set_default_size(width, height)
+        body_label = dialog.get_body_label() if hasattr(dialog, "get_body_label") else None
+        if body_label:
+            body_label.set_line_wrap(True)
+            body_label.set_max_width_chars(chars)
+        dialog.add_response("ok", _("OK"))
+        dialog.connect("response", lambda d, r: d.destroy())
+        dialog.present()
+
     def _show_connection_error_dialog(self, device_name: str, error_message: str):
         """Show error dialog when wireless connection fails."""
         try:
-            from gi.repository import Adw
-
-            dialog = Adw.MessageDialog.new(self)
-            dialog.set_heading(_("Connection Failed"))
             body = _(
                 "Failed to connect to {device}.\n\n{error}\n\nTroubleshooting:\n"
                 "  • Ensure Wireless Debugging is enabled\n"
                 "  • Check both devices are on the same Wi-Fi\n"
                 "  • Try removing and re-pairing the device"
             ).format(device=device_name, error=error_message)
-
-            dialog.set_body(body)
-            dialog.set_default_size(400, 200)
-            body_label = dialog.get_body_label() if hasattr(dialog, "get_body_label") else None
-            if body_label:
-                body_label.set_line_wrap(True)
-                body_label.set_max_width_chars(50)
-
-            dialog.add_response("ok", _("OK"))
-            dialog.connect("response", lambda d, r: d.destroy())
-            dialog.present()
+            self._present_info_dialog(_("Connection Failed"), body)
         except Exception as e:
             logger.error(f"Failed to show connection error dialog: {e}")
 
-    def _check_usb_authorization(self, usb_serial: str) -> tuple[bool, str]:
-        """Check if USB device is authorized. Returns (is_authorized, state)."""
-        import subprocess
+    def _check_usb_authorization(self, usb_serial, callback):
+        """Check if USB device is authorized without blocking the main loop.
 
+        callback(is_authorized, state) is called on the main thread.
+        """
+        # A recent `adb devices` listing is enough
+        devices = peek_adb_devices(_MIRROR_ADB_DEVICES_TTL)
+        if devices is not None and usb_serial in devices:
+            state = devices[usb_serial]
+            callback(state == "device", state)
+            return
         try:
-            result = subprocess.run(["adb", "devices"], capture_output=True, text=True, timeout=3)
-            for line in result.stdout.strip().split("\n")[1:]:
-                if "\t" in line:
-                    serial, state = line.split("\t", 1)
-                    state = state.strip()
-                    if serial == usb_serial:
-                        return (state == "device", state)
-            return (False, "not_found")
-        except Exception:
-            return (False, "error")
+            proc = Gio.Subprocess.new(
+                [get_adb_path(), "devices"],
+                Gio.SubprocessFlags.STDOUT_PIPE | Gio.SubprocessFlags.STDERR_SILENCE,
+            )
+        except GLib.Error as e:
+            logger.error(f"Could not run adb devices: {e.message}")
+            callback(False, "error")
+            return
+        proc.communicate_utf8_async(
+            None,
+            self._adb_cancellable,
+            self._on_usb_authorization_done,
+            (usb_serial, callback),
+        )
+
+    def _on_usb_authorization_done(self, proc, result, user_data):
+        usb_serial, callback = user_data
+        try:
+            _ok, stdout, _err = proc.communicate_utf8_finish(result)
+        except GLib.Error as e:
+            proc.force_exit()
+            # Cancelled because the window closed: nothing left to update
+            if not e.matches(Gio.io_error_quark(), Gio.IOErrorEnum.CANCELLED):
+                callback(False, "error")
+            return
+        state = store_adb_devices(stdout or "").get(usb_serial)
+        if state is None:
+            callback(False, "not_found")
+        else:
+            callback(state == "device", state)
 
     def _show_usb_unauthorized_dialog(self, device_name: str):
         """Show dialog when USB device is not authorized."""
         try:
-            from gi.repository import Adw
-
-            dialog = Adw.MessageDialog.new(self)
-            dialog.set_heading(_("USB Debugging Not Authorized"))
             body = _(
                 "Device {device} is connected via USB but not authorized.\n\n"
                 "Please check your device and tap 'Allow' to authorize USB debugging.\n\n"
                 "Note: You may need to enable 'Always allow from this computer' for persistent authorization."
             ).format(device=device_name)
-
-            dialog.set_body(body)
-            dialog.set_default_size(400, 180)
-            body_label = dialog.get_body_label() if hasattr(dialog, "get_body_label") else None
-            if body_label:
-                body_label.set_line_wrap(True)
-                body_label.set_max_width_chars(50)
-
-            dialog.add_response("ok", _("OK"))
-            dialog.connect("response", lambda d, r: d.destroy())
-            dialog.present()
+            self._present_info_dialog(_("USB Debugging Not Authorized"), body, height=180)
         except Exception as e:
             logger.error(f"Failed to show USB unauthorized dialog: {e}")
 
@@ -1810,10 +1973,6 @@ class AurynkWindow(Adw.ApplicationWindow):
         or configure `scrcpy_path` in settings).
         """
         try:
-            from gi.repository import Adw
-
-            dialog = Adw.MessageDialog.new(self)
-            dialog.set_heading(_("Unable to start screen mirroring"))
             body = _(
                 "Aurynk was unable to start scrcpy for device: {serial}.\n\n"
                 "Common causes: scrcpy cannot see the ADB device (ADB does not list it), or "
@@ -1824,38 +1983,28 @@ class AurynkWindow(Adw.ApplicationWindow):
                 "    sudo snap connect scrcpy:raw-usb :raw-usb\n"
                 "  • Or set a full path to a non-snap `scrcpy` binary in Aurynk settings."
             ).format(serial=serial)
-
-            dialog.set_body(body)
-            dialog.set_default_size(420, 180)
-            body_label = dialog.get_body_label() if hasattr(dialog, "get_body_label") else None
-            if body_label:
-                body_label.set_line_wrap(True)
-                body_label.set_max_width_chars(60)
-
-            dialog.add_response("ok", _("OK"))
-
-            def _on_resp(dlg, resp):
-                dlg.destroy()
-
-            dialog.connect("response", _on_resp)
-            dialog.present()
+            self._present_info_dialog(
+                _("Unable to start screen mirroring"), body, width=420, height=180, chars=60
+            )
         except Exception:
             # If Adw isn't available or dialog creation fails, fall back to logging only
             logger.warning("scrcpy unavailable for %s and UI dialog could not be shown", serial)
 
-    def show_unpair_confirmation_dialog(address):
-        """Show a confirmation dialog before unpairing a device. Returns True if confirmed, False otherwise."""
-        # This is a blocking dialog for simplicity; can be made async if needed
-        dialog = Gtk.MessageDialog(
-            transient_for=None,
-            flags=0,
-            message_type=Gtk.MessageType.QUESTION,
-            buttons=Gtk.ButtonsType.YES_NO,
-            text=_("Unpair Device?"),
-        )
-        dialog.format_secondary_text(
-            _("Are you sure you want to unpair device {}?").format(address)
-        )
-        response = dialog.run()
-        dialog.destroy()
-        return response == Gtk.ResponseType.YES
+    def show_unpair_confirmation_dialog(self, address, on_confirm):
+        """Ask for confirmation before unpairing a device.
+
+        The dialog is non-blocking; on_confirm(confirmed) is called with True
+        or False once the user responds.
+        """
+        body_text = _("Are you sure you want to remove\n{device} ?").format(device=address)
+        dialog = Adw.AlertDialog.new(_("Remove Device?"), body_text)
+        dialog.add_response("cancel", _("Cancel"))
+        dialog.add_response("remove", _("Remove"))
+        dialog.set_response_appearance("remove", Adw.ResponseAppearance.DESTRUCTIVE)
+        dialog.set_default_response("cancel")
+        dialog.set_close_response("cancel")
+
+        def _on_chosen(dlg, result):
+            on_confirm(dlg.choose_finish(result) == "remove")
+
+        dialog.choose(self, None, _on_chosen)
@@ -5,11 +5,28 @@ import gi
 gi.require_version("Gtk", "4.0")
 from gi.repository import Gtk
 
+# The window built on first use; closing hides it so later calls just present it
+_cached_window = None
+
+
+def _on_destroy(window):
+    global _cached_window
+    if _cached_window is window:
+        _cached_window = None
+
 
 def show_shortcuts_window(parent=None):
     """Show the keyboard shortcuts window."""
-    builder = Gtk.Builder.new_from_resource("/io/github/IshuSinghSE/aurynk/ui/shortcuts_window.ui")
-    window = builder.get_object("shortcuts_window")
+    global _cached_window
+    window = _cached_window
+    if window is None:
+        builder = Gtk.Builder.new_from_resource(
+            "/io/github/IshuSinghSE/aurynk/ui/shortcuts_window.ui"
+        )
+        window = builder.get_object("shortcuts_window")
+        window.set_hide_on_close(True)
+        window.connect("destroy", _on_destroy)
+        _cached_window = window
 
     if parent:
         window.set_transient_for(parent)
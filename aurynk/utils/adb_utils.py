@@ -1,36 +1,295 @@
+import functools
+import os
+import shlex
+import socket
+import subprocess
+import threading
+import time
+
+from aurynk.utils.logger import get_logger
+from aurynk.utils.settings import SettingsManager
+
+logger = get_logger("ADBUtils")
+
+# Seconds a parsed `adb devices` listing stays valid for get_adb_devices()
+_ADB_DEVICES_TTL = 1.5
+
+# Seconds before a device notification's adb shell is killed
+_NOTIFY_TIMEOUT = 3
+
+# adb path -> (monotonic time, {serial: state}) of the last `adb devices` run
+_devices_cache = {}
+_devices_lock = threading.Lock()
+# Held while spawning `adb devices`, so concurrent pollers share one run
+_poll_lock = threading.Lock()
+
+# {serial: state} kept current by the host:track-devices reader. None while
+# no tracker runs, or after invalidate_adb_cache() until it is refreshed.
+_tracked_devices = None
+# Bumped on every tracker update, so a slower poll never overwrites a newer push
+_tracked_generation = 0
+_tracker = None
+
+# Bounds, in seconds, of the backoff before reconnecting to host:track-devices
+_TRACK_RETRY_MIN = 1.0
+_TRACK_RETRY_MAX = 30.0
+
+# Where the adb server listens for host service requests; adb honours the same variable
+_ADB_SERVER_ADDR = ("127.0.0.1", int(os.environ.get("ANDROID_ADB_SERVER_PORT", "5037")))
+
+# Whether get_adb_path's cache is hooked to changes of the adb.adb_path setting
+_adb_path_watched = False
+_adb_path_lock = threading.Lock()
+
+
+def _on_adb_path_changed(new_value, old_value):
+    get_adb_path.cache_clear()
+    if _tracker is not None:
+        _tracker.restart()
+
+
+@functools.lru_cache(maxsize=1)
 def get_adb_path():
-    """Return the custom ADB path from settings, or fallback to 'adb'."""
-    try:
-        from aurynk.utils.settings import SettingsManager
+    """Return the custom ADB path from settings, or fallback to 'adb'.
 
+    The result is cached until the adb.adb_path setting changes.
+    """
+    global _adb_path_watched
+    try:
         settings = SettingsManager()
+        with _adb_path_lock:
+            if not _adb_path_watched:
+                settings.register_callback("adb", "adb_path", _on_adb_path_changed)
+                _adb_path_watched = True
         adb_path = settings.get("adb", "adb_path", "").strip()
-        if adb_path:
-            import os
-
-            if os.path.isfile(adb_path) and os.access(adb_path, os.X_OK):
-                return adb_path
+        if adb_path and os.path.isfile(adb_path) and os.access(adb_path, os.X_OK):
+            return adb_path
     except Exception:
         pass
     return "adb"
 
 
-def is_device_connected(address, connect_port):
-    """Check if a device is connected via adb."""
-    import subprocess
+def _parse_device_lines(lines):
+    devices = {}
+    for line in lines:
+        serial, sep, state = line.partition("\t")
+        if sep:
+            devices[serial] = state.strip()
+    return devices
+
+
+def parse_adb_devices(output):
+    """Parse `adb devices` output into a {serial: state} dict."""
+    # Skip the "List of devices attached" header
+    return _parse_device_lines(output.splitlines()[1:])
+
+
+def read_track_devices(stream):
+    """Yield a {serial: state} dict per update from a track-devices stream.
 
-    serial = f"{address}:{connect_port}"
-    from aurynk.utils.adb_utils import get_adb_path
+    Each update is the full device list, framed by a 4-digit hex length.
+    Stops at end of stream or on a malformed frame.
+    """
+    while True:
+        header = stream.read(4)
+        if len(header) < 4:
+            return
+        try:
+            length = int(header, 16)
+        except ValueError:
+            return
+        body = stream.read(length) if length else b""
+        if len(body) < length:
+            return
+        yield _parse_device_lines(body.decode("utf-8", "replace").splitlines())
+
+
+def _set_tracked_devices(devices):
+    global _tracked_devices, _tracked_generation
+    with _devices_lock:
+        _tracked_devices = devices
+        _tracked_generation += 1
+
+
+def open_adb_service(service, timeout=3):
+    """Connect to the adb server and request a host service, e.g. host:track-devices.
+
+    Returns:
+        The connected socket, positioned after the server's OKAY reply.
 
+    Raises:
+        OSError: If the server is unreachable or rejects the request.
+    """
+    sock = socket.create_connection(_ADB_SERVER_ADDR, timeout=timeout)
     try:
-        result = subprocess.run([get_adb_path(), "devices"], capture_output=True, text=True)
-        if result.returncode != 0:
-            return False
-        for line in result.stdout.splitlines():
-            # Must have tab separator and "device" status (not "offline" or other states)
-            if serial in line and "\tdevice" in line:
-                return True
-        return False
+        request = service.encode()
+        sock.sendall(b"%04x%s" % (len(request), request))
+        status = sock.recv(4, socket.MSG_WAITALL)
+        if status != b"OKAY":
+            raise OSError(f"adb server rejected {service}: {status!r}")
+        sock.settimeout(None)
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+class DeviceTracker:
+    """Keeps the `adb devices` cache current from the adb server's device stream.
+
+    The tracker holds one connection to the adb server on host:track-devices,
+    which pushes the whole device list whenever it changes, so while it runs
+    get_adb_devices() answers without spawning adb. If the connection drops,
+    callers fall back to polling and the tracker reconnects after a backoff.
+    """
+
+    def __init__(self):
+        self._stopped = threading.Event()
+        self._sock = None
+        self._thread = None
+        # True while the host:track-devices stream is delivering updates
+        self.live = False
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="adb-track-devices", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self.restart()
+
+    def restart(self):
+        """End the current stream; the reader reconnects unless stopped."""
+        sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _run(self):
+        delay = _TRACK_RETRY_MIN
+        while not self._stopped.is_set():
+            try:
+                self._sock = open_adb_service("host:track-devices")
+                with self._sock.makefile("rb") as stream:
+                    for devices in read_track_devices(stream):
+                        self.live = True
+                        _set_tracked_devices(devices)
+                        delay = _TRACK_RETRY_MIN
+            except ConnectionRefusedError:
+                # No server yet; the adb client starts one, then we retry
+                _start_adb_server()
+            except OSError as e:
+                logger.debug(f"adb host:track-devices unavailable: {e}")
+            finally:
+                self.live = False
+                _set_tracked_devices(None)
+                if self._sock is not None:
+                    self._sock.close()
+                    self._sock = None
+            self._stopped.wait(delay)
+            delay = min(delay * 2, _TRACK_RETRY_MAX)
+
+
+def _start_adb_server():
+    try:
+        subprocess.run([get_adb_path(), "start-server"], capture_output=True, timeout=10)
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"Could not start the adb server: {e}")
+
+
+def start_device_tracking():
+    """Start the process-wide DeviceTracker, if it is not already running."""
+    global _tracker
+    if _tracker is None:
+        _tracker = DeviceTracker()
+        _tracker.start()
+
+
+def stop_device_tracking():
+    global _tracker
+    if _tracker is not None:
+        _tracker.stop()
+        _tracker = None
+
+
+def get_adb_devices(max_age=_ADB_DEVICES_TTL):
+    """Return {serial: state} from `adb devices`, cached for max_age seconds.
+
+    While a DeviceTracker runs, its pushed device list is returned instead.
+    Callers share one adb invocation per max_age window; concurrent callers
+    wait for the running one instead of spawning their own.
+
+    Raises:
+        subprocess.SubprocessError: If adb fails or times out.
+    """
+    global _tracked_devices
+    adb_path = get_adb_path()
+    with _devices_lock:
+        if _tracked_devices is not None:
+            return _tracked_devices
+        timestamp, devices = _devices_cache.get(adb_path, (0.0, None))
+        now = time.monotonic()
+        if devices is not None and now - timestamp < max_age:
+            return devices
+        generation = _tracked_generation
+    # Spawn outside the lock so tracker updates are never held up by it
+    with _poll_lock:
+        with _devices_lock:
+            timestamp, devices = _devices_cache.get(adb_path, (0.0, None))
+            if devices is not None and timestamp >= now:
+                # Another caller polled while we waited
+                return devices
+        result = subprocess.run(
+            [adb_path, "devices"], capture_output=True, text=True, timeout=3, check=True
+        )
+        devices = parse_adb_devices(result.stdout)
+        with _devices_lock:
+            _devices_cache[adb_path] = (time.monotonic(), devices)
+            # With a live tracker that saw no change meanwhile, this poll
+            # re-establishes its view after an invalidate_adb_cache()
+            if _tracker is not None and _tracker.live and _tracked_generation == generation:
+                _tracked_devices = devices
+        return devices
+
+
+def peek_adb_devices(max_age=_ADB_DEVICES_TTL):
+    """Return the cached {serial: state} if fresher than max_age, else None."""
+    with _devices_lock:
+        if _tracked_devices is not None:
+            return _tracked_devices
+        timestamp, devices = _devices_cache.get(get_adb_path(), (0.0, None))
+    if devices is not None and time.monotonic() - timestamp < max_age:
+        return devices
+    return None
+
+
+def store_adb_devices(output):
+    """Parse `adb devices` output obtained elsewhere and cache it."""
+    devices = parse_adb_devices(output)
+    with _devices_lock:
+        _devices_cache[get_adb_path()] = (time.monotonic(), devices)
+    return devices
+
+
+def invalidate_adb_cache():
+    """Drop cached `adb devices` listings after a connect, disconnect or pair.
+
+    The tracker's view is dropped too, since adb's update may not have
+    arrived yet; the next get_adb_devices() polls once and restores it.
+    """
+    global _tracked_devices
+    with _devices_lock:
+        _devices_cache.clear()
+        _tracked_devices = None
+
+
+def is_device_connected(address, connect_port):
+    """Check if a device is connected via adb."""
+    try:
+        # Only "device" counts, not "offline" or other states
+        return get_adb_devices().get(f"{address}:{connect_port}") == "device"
     except Exception:
         return False
 
@@ -44,8 +303,6 @@ def clear_device_notifications(serial: str) -> bool:
     Returns:
         True if cleared successfully, False otherwise
     """
-    import subprocess
-
     try:
         # Cancel notification with our specific tag
         cancel_cmd = "cmd notification cancel aurynk_status"
@@ -57,9 +314,29 @@ def clear_device_notifications(serial: str) -> bool:
         return False
 
 
+def _notification_script(message, title):
+    """Shell script that clears the old notification, posts the new one and
+    logs it to logcat in one session, exiting with the post's status.
+
+    adb joins its shell arguments with spaces and hands them to the device's
+    sh, so even a bare ``log`` argv would be re-parsed there; every user
+    string is quoted once instead, which also keeps ``$`` and quotes literal.
+    """
+    quoted = shlex.quote(message)
+    return (
+        "cmd notification cancel aurynk_status; "
+        f"cmd notification post -S bigtext -t {shlex.quote(title)} aurynk_status {quoted}; "
+        "status=$?; "
+        f"log -t Aurynk {quoted}; "
+        "exit $status"
+    )
+
+
 def send_device_notification(serial: str, message: str, title: str = "Aurynk") -> bool:
     """Send a notification/toast to the Android device via ADB.
 
+    Blocks until adb returns; GUI code should use send_device_notification_async.
+
     Args:
         serial: Device serial (address:port for wireless, or USB serial)
         message: Notification message to display
@@ -68,29 +345,57 @@ def send_device_notification(serial: str, message: str, title: str = "Aurynk") -
     Returns:
         True if notification was sent successfully, False otherwise
     """
-    import subprocess
-
     try:
-        # Clear old notifications first
-        clear_device_notifications(serial)
-
-        # Post a system notification using cmd notification
-        # Format: cmd notification post [flags] <tag> <text>
-        # Need to properly escape the message for shell parsing
-        import shlex
+        result = subprocess.run(
+            [get_adb_path(), "-s", serial, "shell", _notification_script(message, title)],
+            capture_output=True,
+            text=True,
+            timeout=_NOTIFY_TIMEOUT,
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
 
-        # Build the notification command with proper quoting
-        notification_cmd = f"cmd notification post -S bigtext -t {shlex.quote(title)} aurynk_status {shlex.quote(message)}"
 
-        cmd = [get_adb_path(), "-s", serial, "shell", notification_cmd]
+def send_device_notification_async(serial, message, title="Aurynk", callback=None):
+    """Send a notification/toast to the Android device without blocking.
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=3)
+    Args:
+        serial: Device serial (address:port for wireless, or USB serial)
+        message: Notification message to display
+        title: Notification title (default: "Aurynk")
+        callback: Optional callable receiving True/False once adb has
+            finished, called from the main loop
+    """
+    # GLib is only needed here; the rest of this module stays usable without gi
+    from gi.repository import Gio, GLib
 
-        # Also log to logcat for debugging
-        subprocess.run(
-            [get_adb_path(), "-s", serial, "shell", "log", "-t", "Aurynk", message], timeout=2
+    argv = [get_adb_path(), "-s", serial, "shell", _notification_script(message, title)]
+    try:
+        proc = Gio.Subprocess.new(
+            argv, Gio.SubprocessFlags.STDOUT_SILENCE | Gio.SubprocessFlags.STDERR_SILENCE
         )
+    except GLib.Error:
+        if callback:
+            callback(False)
+        return
 
-        return result.returncode == 0
-    except Exception:
+    timer = {"id": None}
+
+    def _on_timeout():
+        timer["id"] = None
+        proc.force_exit()
         return False
+
+    def _on_done(proc, result):
+        if timer["id"] is not None:
+            GLib.source_remove(timer["id"])
+        try:
+            ok = proc.wait_check_finish(result)
+        except GLib.Error:
+            ok = False
+        if callback:
+            callback(ok)
+
+    timer["id"] = GLib.timeout_add_seconds(_NOTIFY_TIMEOUT, _on_timeout)
+    proc.wait_check_async(None, _on_done)
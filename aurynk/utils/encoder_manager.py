@@ -1,7 +1,7 @@
 """Utility for managing encoder settings across device changes."""
 
 from aurynk.utils.logger import get_logger
-from aurynk.utils.settings import SettingsManager
+from aurynk.utils.settings import get_settings_manager
 
 logger = get_logger("EncoderManager")
 
@@ -13,7 +13,7 @@ def reset_encoders_to_default():
     encoder settings don't persist across different devices.
     """
     try:
-        settings = SettingsManager()
+        settings = get_settings_manager()
 
         # Get current values
         current_video = settings.get("scrcpy", "video_encoder", "")
@@ -22,8 +22,9 @@ def reset_encoders_to_default():
         # Only reset if there are custom encoders set
         if current_video or current_audio:
             logger.info("Resetting encoders to default due to device change")
-            settings.set("scrcpy", "video_encoder", "")
-            settings.set("scrcpy", "audio_encoder", "")
+            with settings.batch():
+                settings.set("scrcpy", "video_encoder", "")
+                settings.set("scrcpy", "audio_encoder", "")
             logger.debug(f"Cleared encoders: video='{current_video}', audio='{current_audio}'")
 
     except Exception as e:
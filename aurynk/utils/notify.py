@@ -1,13 +1,18 @@
+from collections import deque
 from typing import Optional
 
 from aurynk.i18n import _
 from aurynk.utils.logger import get_logger
+from aurynk.utils.settings import get_settings_manager
 
 logger = get_logger("Notify")
 
 _inited = False
-# Keep references to notifications with actions to prevent garbage collection
-_active_notifications = []
+# gi.repository.Notify, resolved by the first successful _ensure_init()
+_Notify = None
+# Keep references to notifications with actions to prevent garbage collection;
+# the bound keeps the oldest from piling up
+_active_notifications = deque(maxlen=10)
 
 
 def notify_device_event(event: str, device: str = "", extra: str = "", error: bool = False):
@@ -18,9 +23,7 @@ def notify_device_event(event: str, device: str = "", extra: str = "", error: bo
     extra: additional info (e.g. error message)
     error: if True, treat as error notification
     """
-    from aurynk.utils.settings import SettingsManager
-
-    settings = SettingsManager()
+    settings = get_settings_manager()
     if not settings.get("app", "show_notifications", True):
         logger.info("Notifications are disabled in settings.")
         return
@@ -47,7 +50,7 @@ def notify_device_event(event: str, device: str = "", extra: str = "", error: bo
 
 
 def _ensure_init(app_id: str) -> bool:
-    global _inited
+    global _inited, _Notify
     if _inited:
         return True
     try:
@@ -57,6 +60,7 @@ def _ensure_init(app_id: str) -> bool:
         from gi.repository import Notify
 
         Notify.init(app_id)
+        _Notify = Notify
         _inited = True
         return True
     except Exception as e:
@@ -78,9 +82,7 @@ def show_notification(
         print(f"[Notification] {title}: {body}", file=sys.stderr)
         return
     try:
-        from gi.repository import Notify
-
-        n = Notify.Notification.new(title, body, icon)
+        n = _Notify.Notification.new(title, body, icon)
         n.show()
     except Exception as e:
         logger.error(f"Exception in show_notification: {e}")
@@ -91,6 +93,13 @@ def show_notification(
         return
 
 
+def _forget_notification(notification) -> None:
+    try:
+        _active_notifications.remove(notification)
+    except ValueError:
+        pass
+
+
 def show_notification_with_action(
     title: str,
     body: str,
@@ -109,9 +118,7 @@ def show_notification_with_action(
         return
 
     try:
-        from gi.repository import Notify
-
-        n = Notify.Notification.new(title, body, icon)
+        n = _Notify.Notification.new(title, body, icon)
 
         # Wrap callback to clean up reference after action
         def wrapped_callback(notification, action, user_data):
@@ -119,13 +126,11 @@ def show_notification_with_action(
                 callback(notification, action, user_data)
             finally:
                 # Remove from active list after action is handled
-                if notification in _active_notifications:
-                    _active_notifications.remove(notification)
+                _forget_notification(notification)
 
         # Also clean up on close
         def on_closed(notification):
-            if notification in _active_notifications:
-                _active_notifications.remove(notification)
+            _forget_notification(notification)
 
         n.connect("closed", on_closed)
         n.add_action(action_id, action_label, wrapped_callback, None)
@@ -133,10 +138,6 @@ def show_notification_with_action(
         # Keep reference to prevent garbage collection
         _active_notifications.append(n)
 
-        # Limit active notifications to prevent memory leak
-        if len(_active_notifications) > 10:
-            _active_notifications.pop(0)
-
         n.show()
         logger.debug(f"Notification with action shown: {title}")
     except Exception as e:
@@ -1,5 +1,6 @@
 import json
 import os
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Callable, Dict, Optional
 
@@ -13,6 +14,9 @@ class SettingsManager:
 
     _instance: Optional["SettingsManager"] = None
     _initialized: bool = False
+    # Nesting depth of batch() blocks, and whether a save is owed when they end
+    _batch_depth: int = 0
+    _batch_dirty: bool = False
 
     # Default settings structure
     DEFAULT_SETTINGS = {
@@ -154,6 +158,18 @@ class SettingsManager:
             logger.error(f"Failed to save settings: {e}")
             return False
 
+    @contextmanager
+    def batch(self):
+        """Group several set() calls into a single save when the block exits."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self.save()
+
     def get(self, category: str, key: str, default: Any = None) -> Any:
         """
         Get a setting value.
@@ -196,9 +212,12 @@ class SettingsManager:
             # Set new value
             self._settings[category][key] = value
 
-            # Save if requested
+            # Save if requested; inside batch() the save happens once at the end
             if save_immediately:
-                self.save()
+                if self._batch_depth:
+                    self._batch_dirty = True
+                else:
+                    self.save()
 
             # Trigger callbacks if value changed
             if old_value != value:
@@ -353,5 +372,12 @@ class SettingsManager:
 
 # Convenience function to get the singleton instance
 def get_settings_manager() -> SettingsManager:
-    """Get the SettingsManager singleton instance."""
-    return SettingsManager()
+    """Get the SettingsManager singleton instance.
+
+    Once it is initialized this is a plain attribute read, skipping the
+    __new__/__init__ round trip of calling SettingsManager().
+    """
+    instance = SettingsManager._instance
+    if instance is None or not instance._initialized:
+        instance = SettingsManager()
+    return instance
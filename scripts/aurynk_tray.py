@@ -28,6 +28,16 @@ TRAY_SOCKET = "/tmp/aurynk_tray.sock"
 APP_SOCKET = "/tmp/aurynk_app.sock"
 
 
+def _recv_message(conn):
+    """Read one message; the app sends one per connection and then closes it."""
+    chunks = []
+    while True:
+        chunk = conn.recv(65536)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+
+
 class TrayHelper:
     def __init__(self):
         # Use absolute path to icon for development, falls back to theme name when installed
@@ -184,7 +194,7 @@ class TrayHelper:
             server.listen(1)
             while True:
                 conn, _ = server.accept()
-                data = conn.recv(4096)
+                data = _recv_message(conn)
                 if data:
                     msg = data.decode()
                     if msg.strip() == "quit":
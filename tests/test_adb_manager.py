@@ -1,3 +1,7 @@
+import os
+import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -15,9 +19,30 @@ class TestADBController(unittest.TestCase):
         self.assertEqual(len(code), 10)
         self.assertTrue(code.isalpha())
 
+    @patch("aurynk.core.adb_manager.get_adb_path", return_value="sh")
+    def test_run_shell_slow_device_does_not_block_others(self, mock_get_adb_path):
+        slow, fast = "test-slow-shell", "test-fast-shell"
+        started = threading.Event()
+
+        def run_slow():
+            started.set()
+            self.adb_controller.run_shell(slow, "sleep 1", timeout=5)
+
+        worker = threading.Thread(target=run_slow)
+        try:
+            worker.start()
+            started.wait(5)
+            time.sleep(0.1)
+            begin = time.monotonic()
+            self.assertEqual(self.adb_controller.run_shell(fast, "echo ok", timeout=5), "ok\n")
+            self.assertLess(time.monotonic() - begin, 0.8)
+        finally:
+            worker.join()
+            self.adb_controller.close_all_shells()
+
     @patch("aurynk.core.adb_manager.get_adb_path", return_value="adb")
     @patch("subprocess.run")
-    @patch("aurynk.core.adb_manager.SettingsManager")
+    @patch("aurynk.core.adb_manager.get_settings_manager")
     def test_pair_device_success(
         self, mock_settings_manager, mock_subprocess_run, mock_get_adb_path
     ):
@@ -60,7 +85,7 @@ class TestADBController(unittest.TestCase):
 
     @patch("aurynk.core.adb_manager.get_adb_path", return_value="adb")
     @patch("subprocess.run")
-    @patch("aurynk.core.adb_manager.SettingsManager")
+    @patch("aurynk.core.adb_manager.get_settings_manager")
     @patch("time.sleep")
     def test_pair_device_connect_fail(
         self, mock_sleep, mock_settings_manager, mock_subprocess_run, mock_get_adb_path
@@ -85,6 +110,32 @@ class TestADBController(unittest.TestCase):
         result = self.adb_controller.pair_device("192.168.1.5", 3000, 5555, "password")
         self.assertFalse(result)
 
+    @patch("aurynk.core.adb_manager.get_adb_path", return_value="adb")
+    @patch("subprocess.run")
+    @patch("aurynk.core.adb_manager.get_settings_manager")
+    @patch("time.sleep")
+    def test_pair_device_connect_backs_off(
+        self, mock_sleep, mock_settings_manager, mock_subprocess_run, mock_get_adb_path
+    ):
+        mock_settings_manager.return_value.get.side_effect = lambda section, key, default: default
+        refused = MagicMock(returncode=1, stdout="", stderr="failed to connect: Connection refused")
+        transient = MagicMock(returncode=1, stdout="unable to connect", stderr="")
+        mock_subprocess_run.side_effect = [
+            MagicMock(returncode=0, stdout="", stderr=""),  # pair
+            refused,
+            refused,
+            transient,
+            MagicMock(returncode=0, stdout="connected to 192.168.1.5:5555", stderr=""),
+        ]
+
+        with (
+            patch.object(self.adb_controller, "_fetch_device_info", return_value={}),
+            patch.object(self.adb_controller, "save_paired_device"),
+        ):
+            self.assertTrue(self.adb_controller.pair_device("192.168.1.5", 3000, 5555, "pw"))
+
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [0.5, 1.0, 1.125])
+
     @patch("aurynk.core.adb_manager.get_adb_path", return_value="adb")
     @patch("subprocess.run")
     def test_get_current_ports_success(self, mock_subprocess_run, mock_get_adb_path):
@@ -104,29 +155,81 @@ other-device._adb-tls-connect._tcp  192.168.1.6:6666
         ports = self.adb_controller.get_current_ports("192.168.1.5")
         self.assertIsNone(ports)
 
-    @patch("aurynk.core.adb_manager.get_adb_path", return_value="adb")
-    @patch("subprocess.run")
-    @patch("aurynk.core.adb_manager.SettingsManager")
-    def test_fetch_device_specs(self, mock_settings, mock_subprocess_run, mock_get_adb_path):
-        mock_settings.return_value.get.return_value = 10
-
+    def test_fetch_device_specs(self):
         # meminfo, df, dumpsys battery
-        mock_subprocess_run.side_effect = [
-            MagicMock(stdout="MemTotal:        8000000 kB\n"),
-            MagicMock(
-                stdout="Filesystem 1K-blocks Used Available Use% Mounted on\n/dev/block/dm-0 120000000 10000 110000000 1% /data\n"
-            ),
-            MagicMock(stdout="  level: 85\n"),
-        ]
+        with patch.object(self.adb_controller, "run_shell_batch") as mock_run_shell_batch:
+            mock_run_shell_batch.return_value = [
+                "MemTotal:        8000000 kB\n",
+                "Filesystem 1K-blocks Used Available Use% Mounted on\n/dev/block/dm-0 120000000 10000 110000000 1% /data\n",
+                "  level: 85\n",
+            ]
+
+            specs = self.adb_controller.fetch_device_specs("192.168.1.5", 5555)
+            self.assertEqual(specs["ram"], "8 GB")
+            self.assertEqual(specs["storage"], "120 GB")
+            self.assertEqual(specs["battery"], "85%")
+            mock_run_shell_batch.assert_called_once_with(
+                "192.168.1.5:5555", ["cat /proc/meminfo", "df /data", "dumpsys battery"]
+            )
+
+    @patch("aurynk.core.adb_manager.get_adb_path", return_value="sh")
+    def test_run_shell_batch_splits_outputs(self, mock_get_adb_path):
+        serial = "test-run-shell-batch"
+        try:
+            outputs = self.adb_controller.run_shell_batch(
+                serial, ["echo one", "true", "printf 'two\\nlines\\n'"], timeout=5
+            )
+        finally:
+            self.adb_controller.close_shell(serial)
+        self.assertEqual(outputs, ["one\n", "", "two\nlines\n"])
+
+    def test_fetch_device_info_uses_one_round_trip(self):
+        with patch.object(self.adb_controller, "run_shell_batch") as mock_run_shell_batch:
+            mock_run_shell_batch.return_value = ["\n", "redfin\n", "Google\n", "14\n"]
+            info = self.adb_controller._fetch_device_info("192.168.1.5", 5555)
+        mock_run_shell_batch.assert_called_once()
+        self.assertEqual(info["name"], "redfin")
+        self.assertEqual(info["manufacturer"], "Google")
+        self.assertEqual(info["android_version"], "14")
+
+    @patch("aurynk.core.adb_manager.get_adb_path", return_value="sh")
+    def test_run_shell_reuses_process(self, mock_get_adb_path):
+        # `sh -s <serial> shell` reads commands from stdin like `adb -s <serial> shell`
+        serial = "test-run-shell"
+        try:
+            self.assertEqual(self.adb_controller.run_shell(serial, "echo one", timeout=5), "one\n")
+            proc = ADBController._shells[serial]
+            self.assertEqual(self.adb_controller.run_shell(serial, "printf two", timeout=5), "two")
+            self.assertIs(ADBController._shells[serial], proc)
+        finally:
+            self.adb_controller.close_shell(serial)
+        self.assertNotIn(serial, ADBController._shells)
+
+    @patch("aurynk.core.adb_manager.get_adb_path", return_value="sh")
+    def test_close_all_shells(self, mock_get_adb_path):
+        serials = ("test-close-all-1", "test-close-all-2")
+        for serial in serials:
+            self.adb_controller.run_shell(serial, "true", timeout=5)
+        procs = [ADBController._shells[serial] for serial in serials]
+        self.adb_controller.close_all_shells()
+        for serial, proc in zip(serials, procs):
+            self.assertNotIn(serial, ADBController._shells)
+            self.assertIsNotNone(proc.poll())
 
-        specs = self.adb_controller.fetch_device_specs("192.168.1.5", 5555)
-        self.assertEqual(specs["ram"], "8 GB")
-        self.assertEqual(specs["storage"], "120 GB")
-        self.assertEqual(specs["battery"], "85%")
+    def test_write_thumbnail_drops_stale_thumbnail(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            screenshot = os.path.join(tmp, "screen.png")
+            stale = os.path.join(tmp, "screen.thumb.png")
+            for path in (screenshot, stale):
+                with open(path, "wb") as f:
+                    f.write(b"not a png")
+            # Neither a missing GdkPixbuf nor an undecodable capture may leave it behind
+            self.assertIsNone(self.adb_controller._write_thumbnail(screenshot))
+            self.assertFalse(os.path.exists(stale))
 
     @patch("aurynk.core.adb_manager.get_adb_path", return_value="adb")
     @patch("subprocess.run")
-    @patch("aurynk.core.adb_manager.SettingsManager")
+    @patch("aurynk.core.adb_manager.get_settings_manager")
     @patch("os.makedirs")
     @patch("os.path.exists", return_value=False)
     def test_capture_screenshot_success(
@@ -159,7 +262,7 @@ other-device._adb-tls-connect._tcp  192.168.1.6:6666
 
     @patch("aurynk.core.adb_manager.get_adb_path", return_value="adb")
     @patch("subprocess.run")
-    @patch("aurynk.core.adb_manager.SettingsManager")
+    @patch("aurynk.core.adb_manager.get_settings_manager")
     def test_capture_screenshot_locked(self, mock_settings, mock_subprocess_run, mock_get_adb_path):
         mock_settings.return_value.get.return_value = 10
         # Screen on, but locked
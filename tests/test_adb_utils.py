@@ -0,0 +1,120 @@
+import io
+import socket
+import threading
+from unittest.mock import MagicMock, patch
+
+from aurynk.utils import adb_utils
+
+OUTPUT = (
+    "List of devices attached\nABC123\tdevice\n192.168.1.5:5555\toffline\nXYZ789\tunauthorized\n\n"
+)
+
+
+def test_parse_adb_devices():
+    assert adb_utils.parse_adb_devices(OUTPUT) == {
+        "ABC123": "device",
+        "192.168.1.5:5555": "offline",
+        "XYZ789": "unauthorized",
+    }
+
+
+def test_get_adb_devices_is_cached_until_invalidated():
+    adb_utils.invalidate_adb_cache()
+    with (
+        patch.object(adb_utils, "get_adb_path", return_value="adb"),
+        patch("subprocess.run", return_value=MagicMock(stdout=OUTPUT)) as run,
+    ):
+        assert adb_utils.get_adb_devices()["ABC123"] == "device"
+        assert not adb_utils.is_device_connected("192.168.1.5", 5555)
+        assert run.call_count == 1
+
+        adb_utils.invalidate_adb_cache()
+        adb_utils.get_adb_devices()
+        assert run.call_count == 2
+    adb_utils.invalidate_adb_cache()
+
+
+def test_send_device_notification_uses_one_shell_call():
+    with (
+        patch.object(adb_utils, "get_adb_path", return_value="adb"),
+        patch("subprocess.run", return_value=MagicMock(returncode=0)) as run,
+    ):
+        assert adb_utils.send_device_notification("ABC123", "it's mirroring")
+    run.assert_called_once()
+    script = run.call_args[0][0][-1]
+    assert "cmd notification cancel aurynk_status" in script
+    assert "log -t Aurynk" in script
+    assert "'it'\"'\"'s mirroring'" in script
+
+
+def test_notification_script_keeps_shell_metacharacters_literal():
+    script = adb_utils._notification_script("cost $HOME; reboot", "Aurynk")
+    assert script.count("'cost $HOME; reboot'") == 2
+    assert "log -t Aurynk 'cost $HOME; reboot'; " in script
+
+
+def test_get_adb_path_cached_until_setting_changes():
+    settings = MagicMock()
+    settings.get.return_value = ""
+    adb_utils.get_adb_path.cache_clear()
+    with (
+        patch.object(adb_utils, "SettingsManager", return_value=settings),
+        patch.object(adb_utils, "_adb_path_watched", False),
+    ):
+        assert adb_utils.get_adb_path() == "adb"
+        assert adb_utils.get_adb_path() == "adb"
+        assert settings.get.call_count == 1
+
+        category, key, callback = settings.register_callback.call_args[0]
+        assert (category, key) == ("adb", "adb_path")
+        callback("/opt/adb", "")
+        adb_utils.get_adb_path()
+        assert settings.get.call_count == 2
+    adb_utils.get_adb_path.cache_clear()
+
+
+def test_read_track_devices_splits_framed_updates():
+    first = b"ABC123\tdevice\n192.168.1.5:5555\toffline\n"
+    stream = io.BytesIO(b"%04x" % len(first) + first + b"0000")
+    assert list(adb_utils.read_track_devices(stream)) == [
+        {"ABC123": "device", "192.168.1.5:5555": "offline"},
+        {},
+    ]
+
+
+def test_get_adb_devices_prefers_tracked_devices():
+    adb_utils.invalidate_adb_cache()
+    with (
+        patch.object(adb_utils, "get_adb_path", return_value="adb"),
+        patch("subprocess.run") as run,
+    ):
+        adb_utils._set_tracked_devices({"ABC123": "unauthorized"})
+        try:
+            assert adb_utils.get_adb_devices() == {"ABC123": "unauthorized"}
+            assert adb_utils.peek_adb_devices() == {"ABC123": "unauthorized"}
+        finally:
+            adb_utils._set_tracked_devices(None)
+    run.assert_not_called()
+
+
+def test_open_adb_service_sends_framed_request():
+    server = socket.create_server(("127.0.0.1", 0))
+    received = []
+
+    def _serve():
+        conn, _ = server.accept()
+        with conn:
+            received.append(conn.recv(64))
+            conn.sendall(b"OKAY0000")
+
+    thread = threading.Thread(target=_serve)
+    thread.start()
+    try:
+        with patch.object(adb_utils, "_ADB_SERVER_ADDR", server.getsockname()):
+            sock = adb_utils.open_adb_service("host:track-devices")
+        with sock, sock.makefile("rb") as stream:
+            assert list(adb_utils.read_track_devices(stream)) == [{}]
+    finally:
+        thread.join()
+        server.close()
+    assert received == [b"0012host:track-devices"]
@@ -0,0 +1,36 @@
+import json
+import os
+from unittest.mock import patch
+
+from aurynk.core.device_manager import DeviceStore
+
+
+def test_reload_skips_unchanged_file(tmp_path):
+    path = tmp_path / "devices.json"
+    path.write_text(json.dumps([{"address": "10.0.0.2", "name": "Pixel"}]))
+    store = DeviceStore(str(path))
+
+    with patch("aurynk.core.device_manager.json.loads") as loads:
+        store.reload()
+    loads.assert_not_called()
+    assert store.get_devices() == [{"address": "10.0.0.2", "name": "Pixel"}]
+
+    # An external write is picked up on the next reload
+    path.write_text(json.dumps([{"address": "10.0.0.3", "name": "Galaxy Tab"}]))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    store.reload()
+    assert store.get_devices() == [{"address": "10.0.0.3", "name": "Galaxy Tab"}]
+
+
+def test_reload_after_own_save_does_not_reparse(tmp_path):
+    path = tmp_path / "devices.json"
+    store = DeviceStore(str(path))
+    with patch("aurynk.services.tray_service.send_devices_to_tray"):
+        store._devices = [{"address": "10.0.0.2"}]
+        store._save_to_file()
+
+    with patch("aurynk.core.device_manager.json.loads") as loads:
+        store.reload()
+    loads.assert_not_called()
+    assert store.get_devices() == [{"address": "10.0.0.2"}]
@@ -1,3 +1,5 @@
+import queue
+
 from aurynk.services.device_monitor import DeviceMonitor
 
 
@@ -8,3 +10,14 @@ def test_device_monitor_add_remove():
     assert device["address"] in monitor._paired_devices
     monitor.remove_device(device["address"])
     assert device["address"] not in monitor._paired_devices
+
+
+def test_discovery_events_run_in_order_until_stopped():
+    monitor = DeviceMonitor()
+    events = queue.Queue()
+    seen = []
+    events.put((seen.append, ("first",)))
+    events.put((seen.append, ("second",)))
+    events.put(None)
+    monitor._process_discovery_events(events)
+    assert seen == ["first", "second"]
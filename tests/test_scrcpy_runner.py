@@ -1,5 +1,10 @@
+import queue
+import subprocess
 from unittest.mock import MagicMock, patch
 
+import pytest
+
+from aurynk.core import scrcpy_runner
 from aurynk.core.scrcpy_runner import ScrcpyManager
 
 
@@ -35,3 +40,47 @@ def test_window_geometry_clamping(mock_gdk):
                 # Should clamp position to fit
                 assert "--window-x" in args and str(0) in args
                 assert "--window-y" in args and str(0) in args
+
+
+def test_snapshot_active_prunes_finished_processes():
+    mgr = ScrcpyManager()
+    running = MagicMock()
+    running.poll.return_value = None
+    finished = MagicMock()
+    finished.poll.return_value = 0
+    procs = {"192.168.1.5:5555": running, "ABC123": finished}
+    with patch.object(mgr, "processes", procs):
+        serials, addresses = mgr.snapshot_active()
+        assert serials == {"192.168.1.5:5555"}
+        assert addresses == {"192.168.1.5"}
+        assert "ABC123" not in procs
+        # A port change still matches by address
+        assert mgr.is_mirroring("192.168.1.5", 40000)
+        assert not mgr.is_mirroring_serial("ABC123")
+
+
+def test_reaper_reports_exited_processes():
+    reaper = scrcpy_runner._get_reaper()
+    if reaper is None:
+        pytest.skip("pidfd_open is not supported here")
+    exited = queue.Queue()
+    procs = [subprocess.Popen(["sleep", delay]) for delay in ("0.2", "0")]
+    for serial, proc in zip(("A", "B"), procs):
+        reaper.watch(serial, proc, lambda serial, proc: exited.put((serial, proc.returncode)))
+    results = {exited.get(timeout=5), exited.get(timeout=5)}
+    assert results == {("A", 0), ("B", 0)}
+
+
+def test_reaper_survives_failing_exit_handler():
+    reaper = scrcpy_runner._get_reaper()
+    if reaper is None:
+        pytest.skip("pidfd_open is not supported here")
+
+    def fail(serial, proc):
+        raise KeyError(serial)
+
+    reaper.watch("bad", subprocess.Popen(["true"]), fail)
+    exited = queue.Queue()
+    proc = subprocess.Popen(["sleep", "0.2"])
+    reaper.watch("good", proc, lambda serial, proc: exited.put(serial))
+    assert exited.get(timeout=5) == "good"
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from aurynk.utils.settings import SettingsManager
 
 
@@ -15,3 +17,15 @@ def test_settings_manager_persistence(tmp_path):
     sm2.load()
     assert sm2.get("test", "key") == "value"
     assert sm2.get("test", "key2") == 123
+
+
+def test_settings_manager_batch_saves_once():
+    sm = SettingsManager()
+    with patch.object(sm, "save") as save:
+        with sm.batch():
+            sm.set("test", "batch_a", "a")
+            sm.set("test", "batch_b", "b")
+            save.assert_not_called()
+        save.assert_called_once()
+    assert sm.get("test", "batch_a") == "a"
+    assert sm.get("test", "batch_b") == "b"
@@ -71,7 +71,9 @@ class TestUSBMonitor(unittest.TestCase):
     def test_initialization(self):
         mock_pyudev.Context.assert_called_once()
         mock_pyudev.Monitor.from_netlink.assert_called_once_with(self.mock_context)
-        self.mock_monitor.filter_by.assert_called_once_with(subsystem="usb")
+        self.mock_monitor.filter_by.assert_called_once_with(
+            subsystem="usb", device_type="usb_device"
+        )
 
     def test_start_monitoring(self):
         self.monitor.start()
@@ -85,6 +87,24 @@ class TestUSBMonitor(unittest.TestCase):
         self.assertFalse(self.monitor._running)
         mock_glib.source_remove.assert_called_once_with(123)
 
+    def test_monitor_event_drains_queued_events(self):
+        first, second = Mock(name="first"), Mock(name="second")
+        self.mock_monitor.poll.side_effect = [first, second, None]
+        self.monitor._process_device = Mock()
+
+        self.assertTrue(self.monitor._on_monitor_event(0, mock_glib.IO_IN))
+
+        self.assertEqual(self.monitor._process_device.call_count, 2)
+        self.assertEqual(self.mock_monitor.poll.call_count, 3)
+
+    def test_connected_devices_served_from_cache_while_running(self):
+        cached = Mock(name="cached")
+        self.monitor._connected_devices["/devices/usb1/1-1"] = cached
+        self.monitor._running = True
+
+        self.assertEqual(self.monitor.get_connected_devices(), [cached])
+        self.mock_context.list_devices.assert_not_called()
+
     def test_android_detection_by_serial(self):
         mock_device = Mock(name="device")
         mock_device.action = "add"
@@ -126,6 +146,19 @@ class TestUSBMonitor(unittest.TestCase):
 
         self.assertEqual(len(self.monitor.signals_emitted), 0)
 
+    def test_removal_without_metadata_uses_cached_path(self):
+        added = Mock(name="added", action="add", device_path="/devices/usb1/1-1")
+        added.get.side_effect = lambda key, default=None: {"ID_VENDOR_ID": "18d1"}.get(key, default)
+        removed = Mock(name="removed", action="remove", device_path="/devices/usb1/1-1")
+        removed.get.side_effect = lambda key, default=None: default
+
+        self.monitor._process_device(added)
+        self.assertIs(self.monitor._connected_devices["/devices/usb1/1-1"], added)
+        self.monitor._process_device(removed)
+
+        self.assertEqual(self.monitor.signals_emitted[-1][0], "device-disconnected")
+        self.assertEqual(self.monitor._connected_devices, {})
+
     def test_device_removal(self):
         mock_device = Mock(name="device")
         mock_device.action = "remove"